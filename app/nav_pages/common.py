@@ -17,9 +17,13 @@ try:
         format_currency,
         format_pct,
         get_filter_options_from_projects,
+        get_query_engine,
         load_data_quality_cached,
-        load_projects_cached,
+        load_projects_metadata_cached,
         render_global_sidebar_filters,
+        render_query_trust_metadata_strip,
+        render_sidebar_filters_from_options,
+        render_trust_metadata_strip,
         set_filter_values,
     )
     from app.theme import (
@@ -38,9 +42,13 @@ except ModuleNotFoundError:
         format_currency,
         format_pct,
         get_filter_options_from_projects,
+        get_query_engine,
         load_data_quality_cached,
-        load_projects_cached,
+        load_projects_metadata_cached,
         render_global_sidebar_filters,
+        render_query_trust_metadata_strip,
+        render_sidebar_filters_from_options,
+        render_trust_metadata_strip,
         set_filter_values,
     )
     from theme import (
@@ -55,18 +63,18 @@ except ModuleNotFoundError:
 
 try:
     from src.metrics import (
-        add_time_to_implementation_days,
-        overall_realization_rate,
+        portfolio_summary,
         sector_concentration_shares,
+        yearly_capital,
     )
 except ModuleNotFoundError:
     repo_root = Path(__file__).resolve().parents[2]
     if str(repo_root) not in sys.path:
         sys.path.insert(0, str(repo_root))
     from src.metrics import (
-        add_time_to_implementation_days,
-        overall_realization_rate,
+        portfolio_summary,
         sector_concentration_shares,
+        yearly_capital,
     )
 
 SectionRenderer = Callable[[pd.DataFrame], None]
@@ -256,8 +264,8 @@ def render_footer_credit(*, compact: bool = False) -> None:
 
 def _render_metadata_expander(
     page_key: str,
-    projects: pd.DataFrame,
-    filtered: pd.DataFrame,
+    projects: pd.DataFrame | None,
+    filtered: pd.DataFrame | None,
     quality_report: dict[str, Any],
     *,
     label: str = "🔧 Data Quality & Metadata",
@@ -266,12 +274,15 @@ def _render_metadata_expander(
 
 
 def _load_page_state(
+    page_key: str,
     show_finance_type: bool,
 ) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Any], dict[str, list[Any]]]:
-    projects = load_projects_cached()
+    loaded = load_projects_metadata_cached()
+    projects = loaded.projects
     quality_report = load_data_quality_cached()
     filters = render_global_sidebar_filters(projects, show_finance_type=show_finance_type)
     filtered = apply_global_filters(projects, filters)
+    render_trust_metadata_strip(page_key, projects, filtered, quality_report, loaded=loaded)
     return projects, filtered, quality_report, filters
 
 
@@ -394,9 +405,33 @@ def render_home_page() -> None:
         """
     )
 
-    projects, filtered, quality_report, filters = _load_page_state(show_finance_type=True)
+    # The query engine serves options, counts and every aggregate below as SQL, so in that
+    # mode the project table is never loaded into pandas.
+    projects: pd.DataFrame | None = None
+    filtered: pd.DataFrame | None = None
+    query_engine = get_query_engine()
+    if query_engine is not None:
+        quality_report = load_data_quality_cached()
+        options = query_engine.filter_options()
+        filters = render_sidebar_filters_from_options(options, show_finance_type=True)
+        available_projects = query_engine.count({})
+        render_query_trust_metadata_strip(
+            "home", query_engine, filters, quality_report, total=available_projects
+        )
+        summary = query_engine.portfolio_summary(filters)
+        yearly = query_engine.yearly_capital(filters)
+        concentration = query_engine.sector_concentration_shares(filters)
+    else:
+        projects, filtered, quality_report, filters = _load_page_state(
+            "home", show_finance_type=True
+        )
+        available_projects = len(projects)
+        options = get_filter_options_from_projects(projects)
+        summary = portfolio_summary(filtered)
+        yearly = yearly_capital(filtered)
+        concentration = sector_concentration_shares(filtered)
 
-    if projects.empty:
+    if available_projects == 0:
         st.warning("No data available. Please check data sources.")
         _render_metadata_expander(
             "home",
@@ -407,8 +442,7 @@ def render_home_page() -> None:
         )
         return
 
-    options = get_filter_options_from_projects(projects)
-    if filtered.empty:
+    if summary["projects"] == 0:
         st.info("No records match current filters. Try adjusting sidebar filters.")
 
         recovery_col1, recovery_col2, recovery_col3 = st.columns(3)
@@ -431,18 +465,13 @@ def render_home_page() -> None:
         )
         return
 
-    finance_series = filtered["finance_type"].astype("string").str.upper()
-    total_projects = len(filtered)
-    df_count = int(finance_series.eq("DF").sum())
-    fdi_count = int(finance_series.eq("FDI").sum())
-    committed_total = pd.to_numeric(filtered["committed_usd"], errors="coerce").sum(min_count=1)
-    disbursed_total = pd.to_numeric(filtered["disbursed_usd"], errors="coerce").sum(min_count=1)
-    realization_rate = overall_realization_rate(filtered)
-
-    implementation_days = add_time_to_implementation_days(filtered)["time_to_implementation_days"]
-    median_implementation = pd.to_numeric(implementation_days, errors="coerce").median()
-
-    concentration = sector_concentration_shares(filtered)
+    total_projects = summary["projects"]
+    df_count = summary["df_projects"]
+    fdi_count = summary["fdi_projects"]
+    committed_total = summary["committed_usd"]
+    disbursed_total = summary["disbursed_usd"]
+    realization_rate = summary["realization_rate"]
+    median_implementation = summary["median_time_to_implementation_days"]
 
     with st.expander("ℹ️ About this dashboard", expanded=False):
         st.markdown(
@@ -550,26 +579,9 @@ def render_home_page() -> None:
     st.divider()
     st.markdown("### Portfolio Trends")
 
-    trend_year = filtered["year"]
-    if trend_year.dropna().empty:
-        trend_year = pd.to_datetime(filtered["approval_date"], errors="coerce").dt.year
-
-    trend = pd.DataFrame(
-        {
-            "year": pd.to_numeric(trend_year, errors="coerce"),
-            "committed_usd": pd.to_numeric(filtered["committed_usd"], errors="coerce"),
-            "disbursed_usd": pd.to_numeric(filtered["disbursed_usd"], errors="coerce"),
-        }
-    ).dropna(subset=["year"])
-
-    if trend.empty:
+    if yearly.empty:
         st.info("Year values are unavailable for trend visualization.")
     else:
-        yearly = (
-            trend.groupby("year", as_index=False)[["committed_usd", "disbursed_usd"]]
-            .sum(min_count=1)
-            .sort_values("year")
-        )
         trend_long = yearly.melt(
             id_vars="year",
             value_vars=["committed_usd", "disbursed_usd"],
@@ -691,7 +703,7 @@ def render_locked_section_page(
         research_question=research_questions.get(page_key),
     )
 
-    projects, filtered, quality_report, _ = _load_page_state(show_finance_type=False)
+    projects, filtered, quality_report, _ = _load_page_state(page_key, show_finance_type=False)
     if projects.empty:
         st.warning("No processed dataset detected. Add source files to `data/raw`, then run `make etl`.")
         _render_metadata_expander(page_key, projects, filtered, quality_report)
@@ -784,7 +796,7 @@ def _render_locked_df_page_header(
         research_question=research_questions.get(page_key),
     )
 
-    projects, filtered, quality_report, _ = _load_page_state(show_finance_type=False)
+    projects, filtered, quality_report, _ = _load_page_state(page_key, show_finance_type=False)
     if projects.empty:
         st.warning("No processed dataset detected. Add source files to `data/raw`, then run `make etl`.")
         return projects, pd.DataFrame(), quality_report
@@ -986,7 +998,7 @@ def _render_locked_fdi_page_header(
         research_question=research_questions.get(page_key),
     )
 
-    projects, filtered, quality_report, _ = _load_page_state(show_finance_type=False)
+    projects, filtered, quality_report, _ = _load_page_state(page_key, show_finance_type=False)
     if projects.empty:
         st.warning("No processed dataset detected. Add source files to `data/raw`, then run `make etl`.")
         return projects, pd.DataFrame(), quality_report
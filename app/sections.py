@@ -301,7 +301,7 @@ def render_overview_section(filtered: pd.DataFrame) -> None:
         _plotly_chart(status_fig)
 
     province_table = (
-        filtered.groupby("province", as_index=False)
+        filtered.groupby("province", as_index=False, observed=True)
         .agg(
             projects=("project_id", "size"),
             committed_usd=("committed_usd", "sum"),
@@ -481,7 +481,7 @@ def render_spatial_section(filtered: pd.DataFrame) -> None:
 
         top_projects = frame[["project_name", "finance_type", "year", "committed_usd", "status"]].copy()
         top_projects["project_name"] = top_projects["project_name"].fillna("Unnamed Project")
-        top_projects["status"] = top_projects["status"].fillna("Unknown")
+        top_projects["status"] = top_projects["status"].astype("string").fillna("Unknown")
         top_projects = top_projects.sort_values("committed_usd", ascending=False).head(20)
         top_projects["committed_usd"] = top_projects["committed_usd"].apply(format_currency)
 
@@ -573,7 +573,7 @@ def render_spatial_section(filtered: pd.DataFrame) -> None:
             drilldown_label = (
                 analysis_frame["project_name"].fillna("Unnamed Project")
                 + " ("
-                + analysis_frame["province"].fillna("Unknown Province")
+                + analysis_frame["province"].astype("string").fillna("Unknown Province")
                 + ")"
             )
             selectable = analysis_frame.assign(_label=drilldown_label)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -16,82 +17,92 @@ except ModuleNotFoundError:
     from theme import apply_global_styles, get_theme_colors
 
 try:
-    from src.model import CANONICAL_FIELDS, coerce_projects_schema, load_data_quality
+    from src.etl import DUCKDB_OUTPUT
+    from src.model import (
+        LoadedProjects,
+        load_data_quality,
+        load_projects_with_metadata,
+        resolve_processed_dir,
+    )
+    from src.query import ProjectQueryEngine, open_query_engine
 except ModuleNotFoundError:
     repo_root = Path(__file__).resolve().parents[1]
     if str(repo_root) not in sys.path:
         sys.path.insert(0, str(repo_root))
-    from src.model import CANONICAL_FIELDS, coerce_projects_schema, load_data_quality
-
-try:
-    import duckdb
-except ImportError:  # pragma: no cover
-    duckdb = None
-
+    from src.etl import DUCKDB_OUTPUT
+    from src.model import (
+        LoadedProjects,
+        load_data_quality,
+        load_projects_with_metadata,
+        resolve_processed_dir,
+    )
+    from src.query import ProjectQueryEngine, open_query_engine
 
-def _empty_projects() -> pd.DataFrame:
-    return pd.DataFrame(columns=CANONICAL_FIELDS)
+PROCESSED_DIR = Path("data/processed")
+# Set to "duckdb" to serve the home page from SQL against projects.duckdb, without loading
+# the project table into pandas.
+QUERY_ENGINE_ENV = "DASHBOARD_QUERY_ENGINE"
 
 
 def load_projects_with_source(
     processed_dir: Path = Path("data/processed"),
 ) -> tuple[pd.DataFrame, str]:
-    csv_path = processed_dir / "projects_canonical.csv"
-    parquet_path = processed_dir / "projects_canonical.parquet"
-    db_path = processed_dir / "projects.duckdb"
+    loaded = load_projects_with_metadata(processed_dir)
+    return loaded.projects, loaded.source
 
-    if csv_path.exists():
-        try:
-            projects = pd.read_csv(csv_path)
-            return coerce_projects_schema(projects), "csv"
-        except Exception:  # noqa: BLE001
-            pass
 
-    if parquet_path.exists():
-        try:
-            projects = pd.read_parquet(parquet_path)
-            return coerce_projects_schema(projects), "parquet"
-        except Exception:  # noqa: BLE001
-            pass
+def load_projects(processed_dir: Path = Path("data/processed")) -> pd.DataFrame:
+    return load_projects_with_metadata(processed_dir).projects
 
-    if db_path.exists() and duckdb is not None:
-        try:
-            connection = duckdb.connect(str(db_path), read_only=True)
-            try:
-                projects = connection.execute("SELECT * FROM projects").df()
-            finally:
-                connection.close()
-            return coerce_projects_schema(projects), "duckdb"
-        except Exception:  # noqa: BLE001
-            pass
 
-    return _empty_projects(), "empty"
+# Cache entries are keyed by the published version directory, so a new ETL publish is picked
+# up on the next rerun without restarting the server. cache_data hands every caller its own
+# copy, which pages are free to modify.
+@st.cache_data(show_spinner=False, max_entries=2)
+def _load_projects_for_dir(version_dir: Path) -> LoadedProjects:
+    return load_projects_with_metadata(version_dir)
 
 
-def load_projects(processed_dir: Path = Path("data/processed")) -> pd.DataFrame:
-    projects, _ = load_projects_with_source(processed_dir)
-    return projects
+@st.cache_data(show_spinner=False, max_entries=2)
+def _load_data_quality_for_dir(version_dir: Path) -> dict[str, Any]:
+    return load_data_quality(version_dir)
+
+
+def load_projects_metadata_cached() -> LoadedProjects:
+    return _load_projects_for_dir(resolve_processed_dir(PROCESSED_DIR))
 
 
-@st.cache_data(show_spinner=False)
 def load_projects_with_source_cached() -> tuple[pd.DataFrame, str]:
-    return load_projects_with_source()
+    loaded = load_projects_metadata_cached()
+    return loaded.projects, loaded.source
 
 
 def get_loaded_source_label() -> str:
-    _, source = load_projects_with_source_cached()
-    return source
+    return load_projects_metadata_cached().source
 
 
-@st.cache_data(show_spinner=False)
 def load_projects_cached() -> pd.DataFrame:
-    projects, _ = load_projects_with_source_cached()
-    return projects
+    return load_projects_metadata_cached().projects
 
 
-@st.cache_data(show_spinner=False)
 def load_data_quality_cached() -> dict[str, Any]:
-    return load_data_quality()
+    return _load_data_quality_for_dir(resolve_processed_dir(PROCESSED_DIR))
+
+
+# One engine per published version, so its filter options are queried once per publish
+# rather than on every rerun. Connections still come from the src.connections registry.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _query_engine_for_dir(version_dir: Path) -> ProjectQueryEngine | None:
+    return open_query_engine(PROCESSED_DIR)
+
+
+def get_query_engine() -> ProjectQueryEngine | None:
+    if os.environ.get(QUERY_ENGINE_ENV, "").strip().lower() != "duckdb":
+        return None
+    version_dir = resolve_processed_dir(PROCESSED_DIR)
+    if not (version_dir / DUCKDB_OUTPUT).exists():
+        return None
+    return _query_engine_for_dir(version_dir)
 
 
 def format_currency(value: float | int | None) -> str:
@@ -116,6 +127,9 @@ def format_pct(value: float | int | None) -> str:
 
 
 def _sorted_string_options(series: pd.Series) -> list[str]:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categories are already stripped and non-empty; only keep the ones still present.
+        return sorted(str(value) for value in series.cat.remove_unused_categories().cat.categories)
     values = (
         series.astype("string").str.strip().replace({"": pd.NA}).dropna().astype(str).unique().tolist()
     )
@@ -375,8 +389,42 @@ def render_trust_metadata_strip(
     projects: pd.DataFrame,
     filtered: pd.DataFrame,
     quality_report: dict[str, Any],
+    loaded: LoadedProjects | None = None,
 ) -> None:
-    return
+    parts: list[str] = []
+    if loaded is not None:
+        source = loaded.path.name if loaded.path is not None else loaded.source
+        load_note = " (schema coerced)" if loaded.coerced else ""
+        parts += [f"Data: {source}", f"loaded in {loaded.seconds * 1000:,.0f} ms{load_note}"]
+    _render_trust_caption(page_key, parts, quality_report, len(filtered), len(projects))
+
+
+def render_query_trust_metadata_strip(
+    page_key: str,
+    engine: ProjectQueryEngine,
+    filters: dict[str, list[Any]],
+    quality_report: dict[str, Any],
+    total: int,
+) -> None:
+    parts = [f"Data: {engine.connections.database_path().name} (query engine)"]
+    _render_trust_caption(page_key, parts, quality_report, engine.count(filters), total)
+
+
+def _render_trust_caption(
+    page_key: str,
+    parts: list[str],
+    quality_report: dict[str, Any],
+    matched: int,
+    total: int,
+) -> None:
+    version = quality_report.get("outputs", {}).get("version")
+    if version:
+        parts.append(f"version {version}")
+    generated_at = quality_report.get("generated_at_utc")
+    if generated_at:
+        parts.append(f"ETL run {str(generated_at)[:16].replace('T', ' ')} UTC")
+    parts.append(f"{matched:,} of {total:,} projects match the sidebar filters")
+    st.caption(" · ".join(parts), help=f"Trust metadata for the {page_key} view.")
 
 
 def set_filter_to_all(projects: pd.DataFrame, field: str) -> None:
@@ -447,10 +495,19 @@ def render_global_sidebar_filters(
     projects: pd.DataFrame,
     *,
     show_finance_type: bool = True,
+) -> dict[str, list[Any]]:
+    return render_sidebar_filters_from_options(
+        _build_filter_options(projects), show_finance_type=show_finance_type
+    )
+
+
+def render_sidebar_filters_from_options(
+    options: dict[str, list[Any]],
+    *,
+    show_finance_type: bool = True,
 ) -> dict[str, list[Any]]:
     apply_global_styles()
 
-    options = _build_filter_options(projects)
     _init_filter_state(options)
     _apply_query_param_overrides_once(options, include_finance_type=show_finance_type)
     _apply_queued_filter_updates(options)
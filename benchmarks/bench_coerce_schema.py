@@ -0,0 +1,125 @@
+"""Compare coerce_projects_schema with the original convert-every-column version.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_coerce_schema --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from src.etl import (
+    CANONICAL_FIELDS,
+    CATEGORICAL_FIELDS,
+    DATE_FIELDS,
+    NUMERIC_FIELDS,
+    encode_categorical,
+)
+from src.model import coerce_projects_schema
+
+
+def _coerce_projects_schema_full(frame: pd.DataFrame) -> pd.DataFrame:
+    projects = frame.copy()
+
+    for column in CANONICAL_FIELDS:
+        if column not in projects.columns:
+            projects[column] = pd.NA
+
+    projects = projects.loc[:, CANONICAL_FIELDS]
+
+    for column in DATE_FIELDS:
+        projects[column] = pd.to_datetime(projects[column], errors="coerce")
+
+    for column in NUMERIC_FIELDS:
+        projects[column] = pd.to_numeric(projects[column], errors="coerce")
+
+    projects["year"] = pd.to_numeric(projects["year"], errors="coerce").astype("Int64")
+
+    string_columns = [
+        column
+        for column in CANONICAL_FIELDS
+        if column not in set(DATE_FIELDS + NUMERIC_FIELDS + CATEGORICAL_FIELDS + ["year"])
+    ]
+    for column in string_columns:
+        projects[column] = projects[column].astype("string").str.strip().replace({"": pd.NA})
+
+    for column in CATEGORICAL_FIELDS:
+        projects[column] = encode_categorical(projects[column], column)
+
+    return projects
+
+
+def _raw_frame(rows: int, seed: int) -> pd.DataFrame:
+    # Object columns as they come out of a CSV read, before any typing.
+    rng = np.random.default_rng(seed)
+    years = rng.integers(2000, 2025, rows)
+    dates = pd.to_datetime(years.astype(str), format="%Y") + pd.to_timedelta(
+        rng.integers(0, 365, rows), unit="D"
+    )
+    frame = pd.DataFrame(
+        {
+            "project_id": [f"P{index:08d}" for index in range(rows)],
+            "project_name": [f" Project {index} " for index in range(rows)],
+            "finance_type": rng.choice(["DF", "FDI"], rows),
+            "sector": rng.choice(["Energy", "Transport", "Metals", "Finance"], rows),
+            "province": rng.choice(["Jawa Barat", "Banten", "Maluku Utara", ""], rows),
+            "district": rng.choice(["Bandung", "Serang", ""], rows),
+            "latitude": rng.uniform(-8, 4, rows).round(5).astype(str),
+            "longitude": rng.uniform(95, 135, rows).round(5).astype(str),
+            "sponsor_type": rng.choice(["SOE", "Private"], rows),
+            "status": rng.choice(["operational", "delayed", "cancelled"], rows),
+            "committed_usd": rng.lognormal(17, 1.5, rows).round(2),
+            "disbursed_usd": rng.lognormal(16, 1.5, rows).round(2),
+            "year": years,
+        }
+    )
+    for column in DATE_FIELDS:
+        frame[column] = dates.strftime("%Y-%m-%d")
+    return frame.loc[:, CANONICAL_FIELDS]
+
+
+def _best_of(repeat: int, func: Callable[[], pd.DataFrame]) -> tuple[float, pd.DataFrame]:
+    best = float("inf")
+    result = pd.DataFrame()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    raw = _raw_frame(args.rows, args.seed)
+    typed = _coerce_projects_schema_full(raw)
+
+    print(f"rows={args.rows}")
+    for label, frame in [("raw", raw), ("typed", typed)]:
+        full_s, expected = _best_of(args.repeat, partial(_coerce_projects_schema_full, frame))
+        fast_s, actual = _best_of(args.repeat, partial(coerce_projects_schema, frame))
+        pd.testing.assert_frame_equal(actual, expected)
+        print(
+            f"{label:6} full {full_s * 1000:9.1f} ms  fingerprint {fast_s * 1000:9.1f} ms  ({full_s / fast_s:.1f}x)"
+        )
+
+    strict_s, _ = _best_of(args.repeat, lambda: coerce_projects_schema(typed, strict=True))
+    print(f"typed  strict validation {strict_s * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
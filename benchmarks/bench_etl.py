@@ -0,0 +1,308 @@
+"""Benchmark the ETL stages on synthetic AidData/CGIT-shaped sources.
+
+Run from the repository root (no network or real raw files needed):
+
+    python -m benchmarks.bench_etl --size 1k --size 100k
+    python -m benchmarks.bench_etl --size 1k --update-baseline
+
+Each case reports the best wall time over ``--repeat`` runs, throughput and the peak traced
+memory of one extra run under tracemalloc. Results are compared with
+``benchmarks/baselines/etl_<size>.json`` when it exists; the command exits non-zero if a case
+is slower or uses more memory than the baseline allows. Baselines are checked in for 1k and
+100k; 1m has none (see the README).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from benchmarks.synthetic import AIDDATA_CSV_FILENAME, generate_sources, parse_size
+from src.etl import (
+    AIDDATA_FILENAME,
+    AIDDATA_HEADER,
+    AIDDATA_SHEET,
+    CGIT_INDONESIA_FILENAME,
+    CGIT_TRACKER_FILENAME,
+    ENRICHMENT_FILENAME,
+    SOURCE_COLUMNS,
+    _apply_optional_enrichment,
+    _optional_enrichment_frame,
+    _standardize_aiddata,
+    _standardize_cgit_indonesia,
+    _standardize_cgit_tracker,
+    read_raw_file,
+    run_etl,
+)
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+# Cases faster than this are compared against the floor instead of their own time, so timer
+# noise on short cases cannot fail the check.
+MIN_COMPARED_SECONDS = 0.1
+
+
+@dataclass(slots=True)
+class CaseResult:
+    name: str
+    rows: int
+    seconds: float
+    rows_per_s: float
+    peak_mb: float
+
+
+def _size_label(rows: int) -> str:
+    if rows >= 1_000_000 and rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows >= 1_000 and rows % 1_000 == 0:
+        return f"{rows // 1_000}k"
+    return str(rows)
+
+
+def _measure(name: str, rows: int, func: Callable[[], Any], repeat: int) -> CaseResult:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return CaseResult(
+        name=name,
+        rows=rows,
+        seconds=round(best, 4),
+        rows_per_s=round(rows / best) if best > 0 else 0.0,
+        peak_mb=round(peak / (1 << 20), 1),
+    )
+
+
+@contextmanager
+def _working_directory(path: Path) -> Iterator[None]:
+    # run_etl writes docs/methodology.md relative to the working directory.
+    previous = Path.cwd()
+    path.mkdir(parents=True, exist_ok=True)
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def run_cases(rows: int, work_dir: Path, repeat: int, seed: int = 0) -> list[CaseResult]:
+    paths = generate_sources(work_dir, rows, seed=seed)
+    aiddata_xlsx = paths[AIDDATA_FILENAME]
+    aiddata_csv = paths[AIDDATA_CSV_FILENAME]
+    tracker = paths[CGIT_TRACKER_FILENAME]
+    indonesia = paths[CGIT_INDONESIA_FILENAME]
+    enrichment = paths[ENRICHMENT_FILENAME]
+
+    def read(path: Path, **kwargs: Any) -> pd.DataFrame:
+        frame, _ = read_raw_file(
+            path, [], columns=SOURCE_COLUMNS[kwargs.pop("source", path.name)], **kwargs
+        )
+        return frame
+
+    aiddata_kwargs = {
+        "source": AIDDATA_FILENAME,
+        "fixed_sheet": AIDDATA_SHEET,
+        "fixed_header": AIDDATA_HEADER,
+    }
+    aiddata_raw = read(aiddata_xlsx, **aiddata_kwargs)
+    tracker_raw = read(tracker)
+    indonesia_raw = read(indonesia)
+    enrichment_raw = read(enrichment)
+
+    primary = pd.concat(
+        [
+            _standardize_aiddata(aiddata_raw, str(aiddata_xlsx), [], [])[0].assign(
+                finance_type="DF"
+            ),
+            _standardize_cgit_tracker(tracker_raw, str(tracker), [], [])[0].assign(
+                finance_type="FDI"
+            ),
+        ],
+        ignore_index=True,
+    )
+    enrichment_frame = _optional_enrichment_frame(enrichment_raw, str(enrichment), [], [])[0]
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("read_raw_file[aiddata.xlsx]", lambda: read(aiddata_xlsx, **aiddata_kwargs)),
+        ("read_raw_file[aiddata.csv]", lambda: read(aiddata_csv, **aiddata_kwargs)),
+        ("read_raw_file[cgit_tracker.xlsx]", lambda: read(tracker)),
+        (
+            "_standardize_aiddata",
+            lambda: _standardize_aiddata(aiddata_raw, str(aiddata_xlsx), [], []),
+        ),
+        (
+            "_standardize_cgit_tracker",
+            lambda: _standardize_cgit_tracker(tracker_raw, str(tracker), [], []),
+        ),
+        (
+            "_standardize_cgit_indonesia",
+            lambda: _standardize_cgit_indonesia(indonesia_raw, str(indonesia), [], []),
+        ),
+        (
+            "_optional_enrichment_frame",
+            lambda: _optional_enrichment_frame(enrichment_raw, str(enrichment), [], []),
+        ),
+        (
+            "_apply_optional_enrichment",
+            lambda: _apply_optional_enrichment(primary, enrichment_frame),
+        ),
+    ]
+
+    results = [_measure(name, rows, func, repeat) for name, func in cases]
+
+    out_dir = work_dir / "processed"
+    with _working_directory(work_dir):
+        results.append(
+            _measure(
+                "run_etl",
+                rows,
+                lambda: run_etl(raw_dir=work_dir / "raw", out_dir=out_dir, keep_versions=1),
+                repeat,
+            )
+        )
+    shutil.rmtree(out_dir, ignore_errors=True)
+    return results
+
+
+def _baseline_payload(rows: int, seed: int, results: list[CaseResult]) -> dict[str, Any]:
+    return {
+        "rows": rows,
+        "seed": seed,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cases": {
+            result.name: {key: value for key, value in asdict(result).items() if key != "name"}
+            for result in results
+        },
+    }
+
+
+def compare_with_baseline(
+    results: list[CaseResult],
+    baseline: dict[str, Any],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    regressions: list[str] = []
+    for result in results:
+        expected = baseline.get("cases", {}).get(result.name)
+        if expected is None:
+            continue
+        allowed_seconds = max(expected["seconds"], MIN_COMPARED_SECONDS) * time_tolerance
+        if result.seconds > allowed_seconds:
+            regressions.append(
+                f"{result.name}: {result.seconds:.3f}s > {allowed_seconds:.3f}s "
+                f"(baseline {expected['seconds']:.3f}s)"
+            )
+        allowed_mb = max(expected["peak_mb"], 1.0) * memory_tolerance
+        if result.peak_mb > allowed_mb:
+            regressions.append(
+                f"{result.name}: peak {result.peak_mb:.1f} MB > {allowed_mb:.1f} MB "
+                f"(baseline {expected['peak_mb']:.1f} MB)"
+            )
+    return regressions
+
+
+def _print_results(label: str, results: list[CaseResult], baseline: dict[str, Any] | None) -> None:
+    print(f"\nsize={label}")
+    print(f"{'case':36} {'seconds':>9} {'rows/s':>12} {'peak MB':>9} {'vs base':>8}")
+    for result in results:
+        ratio = ""
+        expected = (baseline or {}).get("cases", {}).get(result.name)
+        if expected and expected["seconds"] > 0:
+            ratio = f"{result.seconds / expected['seconds']:.2f}x"
+        print(
+            f"{result.name:36} {result.seconds:9.3f} {result.rows_per_s:12,.0f} "
+            f"{result.peak_mb:9.1f} {ratio:>8}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=parse_size,
+        help="Rows per synthetic source, e.g. 1k, 100k or 1m (repeatable; default 1k).",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "indonesia-china-etl-bench",
+        help="Where synthetic sources are generated and reused between runs.",
+    )
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results as the new baseline instead of comparing against it.",
+    )
+    parser.add_argument("--time-tolerance", type=float, default=2.0)
+    parser.add_argument("--memory-tolerance", type=float, default=1.25)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    regressions: list[str] = []
+
+    for rows in args.size or [1_000]:
+        label = _size_label(rows)
+        results = run_cases(rows, args.work_dir / label, args.repeat, seed=args.seed)
+        baseline_path = args.baseline_dir / f"etl_{label}.json"
+
+        if args.update_baseline:
+            args.baseline_dir.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(
+                json.dumps(_baseline_payload(rows, args.seed, results), indent=2) + "\n",
+                encoding="utf-8",
+            )
+            _print_results(label, results, None)
+            print(f"wrote {baseline_path}")
+            continue
+
+        baseline = None
+        if baseline_path.exists():
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+            regressions.extend(
+                f"[{label}] {message}"
+                for message in compare_with_baseline(
+                    results, baseline, args.time_tolerance, args.memory_tolerance
+                )
+            )
+        _print_results(label, results, baseline)
+
+    if regressions:
+        print("\nregressions:")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Generate synthetic AidData/CGIT-shaped raw sources for the ETL benchmarks.
+
+The workbooks use the real source filenames, sheet names and headers, so the generated raw
+directory runs through ``run_etl`` unchanged. Values are drawn from a seeded RNG:
+the same ``rows``/``seed`` always produce the same workbooks.
+"""
+
+from __future__ import annotations
+
+import csv
+import random
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from openpyxl import Workbook
+
+from src.etl import (
+    AIDDATA_FILENAME,
+    AIDDATA_SHEET,
+    CGIT_INDONESIA_FILENAME,
+    CGIT_TRACKER_FILENAME,
+    ENRICHMENT_FILENAME,
+)
+
+AIDDATA_CSV_FILENAME = "aiddata_synthetic.csv"
+
+COUNTRIES = ["Indonesia"] * 7 + ["Malaysia", "Viet Nam", "Philippines"]
+SECTORS = ["Energy", "Transport", "Metals", "Agriculture", "Real estate", "Technology", "Finance"]
+STATUSES = ["Completion", "Implementation", "Pipeline: Commitment", "Suspended", "Cancelled"]
+PROVINCES = [
+    ("Jawa Barat", "Bandung", -6.9, 107.6),
+    ("Jawa Timur", "Surabaya", -7.25, 112.75),
+    ("Sulawesi Tengah", "Morowali", -2.7, 121.9),
+    ("Maluku Utara", "Halmahera Tengah", 0.4, 127.9),
+    ("Kalimantan Timur", "Balikpapan", -1.27, 116.83),
+    ("Sumatera Utara", "Medan", 3.59, 98.67),
+    ("Banten", "Serang", -6.12, 106.15),
+]
+INVESTORS = ["PowerChina", "Tsingshan", "CRCC", "State Grid", "China Huadian", "Sinohydro", "CCCC"]
+
+AIDDATA_HEADER = [
+    "AidData Record ID",
+    "Title",
+    "Recipient",
+    "Sector Name",
+    "Available ADM1 Level",
+    "Available ADM2 Level",
+    "Latitude",
+    "Longitude",
+    "Status",
+    "Commitment Date (MM/DD/YYYY)",
+    "Actual Implementation Start Date",
+    "Financial Close Date",
+    "Actual Completion Date",
+    "Adjusted Amount (Nominal USD)",
+    "Amount (Nominal USD)",
+    "Disbursed Amount (Nominal USD)",
+    "Commitment Year",
+]
+CGIT_TRACKER_HEADER = [
+    "Year",
+    "Month",
+    "Investor",
+    "Quantity in Millions",
+    "Share Size",
+    "Transaction Party",
+    "Sector",
+    "Country",
+    "Region",
+]
+CGIT_INDONESIA_HEADER = [
+    "Year",
+    "Investor",
+    "Sector",
+    "Country",
+    "Province",
+    "Amount_musd",
+    "Status",
+]
+ENRICHMENT_HEADER = [
+    "AidData Record ID",
+    "Title",
+    "Recipient",
+    "Sector Name",
+    "Available ADM1 Level",
+    "Available ADM2 Level",
+    "Latitude",
+    "Longitude",
+    "Status",
+    "Commitment Date",
+    "Implementation Start Date",
+    "Amount (Nominal USD)",
+    "Commitment Year",
+]
+
+
+def parse_size(value: str) -> int:
+    """Parse ``1000``, ``1k``, ``100k`` or ``1m`` into a row count."""
+    text = value.strip().lower().replace("_", "")
+    multiplier = 1
+    if text.endswith("k"):
+        multiplier, text = 1_000, text[:-1]
+    elif text.endswith("m"):
+        multiplier, text = 1_000_000, text[:-1]
+    return int(float(text) * multiplier)
+
+
+def _date_text(rng: random.Random, year: int) -> str:
+    if rng.random() < 0.2:
+        return ""
+    return f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{year}"
+
+
+def _amount(rng: random.Random) -> Any:
+    value = round(rng.lognormvariate(17, 1.5), 2)
+    # A share of amounts arrive as formatted text, which exercises the numeric cleanup path.
+    return f"{value:,.2f}" if rng.random() < 0.1 else value
+
+
+def _aiddata_rows(rows: int, rng: random.Random) -> Iterator[list[Any]]:
+    for index in range(rows):
+        year = rng.randint(2000, 2024)
+        province, district, latitude, longitude = rng.choice(PROVINCES)
+        located = rng.random() < 0.8
+        yield [
+            f"AD{index:08d}",
+            f"{rng.choice(INVESTORS)} {rng.choice(SECTORS)} project {index}",
+            rng.choice(COUNTRIES),
+            rng.choice(SECTORS),
+            province if located else "",
+            district if located else "",
+            round(latitude + rng.uniform(-0.5, 0.5), 5) if located else None,
+            round(longitude + rng.uniform(-0.5, 0.5), 5) if located else None,
+            rng.choice(STATUSES),
+            _date_text(rng, year),
+            _date_text(rng, min(year + 1, 2025)),
+            _date_text(rng, year),
+            _date_text(rng, min(year + 3, 2025)),
+            _amount(rng),
+            _amount(rng),
+            _amount(rng) if rng.random() < 0.6 else None,
+            year,
+        ]
+
+
+def _cgit_tracker_rows(rows: int, rng: random.Random) -> Iterator[list[Any]]:
+    for index in range(rows):
+        province, _, _, _ = rng.choice(PROVINCES)
+        yield [
+            rng.randint(2005, 2024),
+            rng.choice(["January", "April", "July", "October"]),
+            rng.choice(INVESTORS),
+            round(rng.uniform(50, 3_000), 1),
+            f"{rng.randint(10, 100)}%",
+            f"Party {index % 997}",
+            rng.choice(SECTORS),
+            rng.choice(COUNTRIES),
+            province,
+        ]
+
+
+def _cgit_indonesia_rows(rows: int, rng: random.Random) -> Iterator[list[Any]]:
+    for _ in range(rows):
+        province, _, _, _ = rng.choice(PROVINCES)
+        yield [
+            rng.randint(2006, 2025),
+            rng.choice(INVESTORS),
+            rng.choice(SECTORS),
+            "Indonesia",
+            province,
+            round(rng.uniform(10, 2_000), 1),
+            rng.choice(["Operational", "Delayed", "Under construction"]),
+        ]
+
+
+def _enrichment_rows(rows: int, rng: random.Random) -> Iterator[list[Any]]:
+    # Enrichment overlaps the AidData IDs, so the join actually fills values.
+    for index in range(rows):
+        year = rng.randint(2000, 2024)
+        province, district, latitude, longitude = rng.choice(PROVINCES)
+        yield [
+            f"AD{rng.randrange(max(rows, 1)):08d}",
+            f"Enrichment project {index}",
+            "Indonesia",
+            rng.choice(SECTORS),
+            province,
+            district,
+            latitude,
+            longitude,
+            rng.choice(STATUSES),
+            _date_text(rng, year),
+            _date_text(rng, min(year + 1, 2025)),
+            _amount(rng),
+            year,
+        ]
+
+
+def _write_xlsx(path: Path, sheet: str, header: list[str], rows: Iterator[list[Any]]) -> Path:
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet)
+    worksheet.append(header)
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(path)
+    return path
+
+
+def _write_csv(path: Path, header: list[str], rows: Iterator[list[Any]]) -> Path:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        writer.writerows(["" if value is None else value for value in row] for row in rows)
+    return path
+
+
+def generate_sources(work_dir: Path, rows: int, seed: int = 0) -> dict[str, Path]:
+    """Write every synthetic source with ``rows`` rows under ``work_dir``.
+
+    The workbooks go to ``work_dir/raw`` (the ``run_etl`` input); the AidData-shaped CSV sits
+    next to it so it does not count as a raw file. An existing set generated with the same
+    size and seed is reused, since writing the large workbooks takes longer than the
+    benchmarks themselves.
+    """
+    raw_dir = work_dir / "raw"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    marker = work_dir / ".synthetic"
+    expected = f"rows={rows} seed={seed}"
+    specs = {
+        raw_dir / AIDDATA_FILENAME: lambda path, rng: _write_xlsx(
+            path, AIDDATA_SHEET, AIDDATA_HEADER, _aiddata_rows(rows, rng)
+        ),
+        raw_dir / CGIT_TRACKER_FILENAME: lambda path, rng: _write_xlsx(
+            path, "Dataset", CGIT_TRACKER_HEADER, _cgit_tracker_rows(rows, rng)
+        ),
+        raw_dir / CGIT_INDONESIA_FILENAME: lambda path, rng: _write_xlsx(
+            path, "Sheet1", CGIT_INDONESIA_HEADER, _cgit_indonesia_rows(rows, rng)
+        ),
+        raw_dir / ENRICHMENT_FILENAME: lambda path, rng: _write_xlsx(
+            path, "Sheet1", ENRICHMENT_HEADER, _enrichment_rows(rows, rng)
+        ),
+        work_dir / AIDDATA_CSV_FILENAME: lambda path, rng: _write_csv(
+            path, AIDDATA_HEADER, _aiddata_rows(rows, rng)
+        ),
+    }
+    paths = {path.name: path for path in specs}
+    reusable = marker.exists() and marker.read_text(encoding="utf-8") == expected
+    if reusable and all(path.exists() for path in specs):
+        return paths
+
+    marker.unlink(missing_ok=True)
+    for offset, (path, write) in enumerate(specs.items()):
+        write(path, random.Random(seed * 1_000 + offset))
+    marker.write_text(expected, encoding="utf-8")
+    return paths
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.etl import DUCKDB_OUTPUT, PUBLISH_VERSIONS_DIR, resolve_processed_dir
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover
+    duckdb = None
+
+logger = logging.getLogger(__name__)
+
+# Managers kept by duckdb_connections(); older ones (usually superseded versions) are dropped.
+DUCKDB_MAX_OPEN_DATABASES = 4
+DUCKDB_ATTACH_ALIAS = "published"
+
+
+@dataclass(slots=True)
+class DuckDBConnectionManager:
+    # One read-only handle, one cursor per thread; attached to :memory: because connect(path)
+    # returns DuckDB's cached instance, which keeps serving a file replaced in place.
+
+    processed_dir: Path
+    generation: int = field(default=0, init=False)
+    _connection: Any = field(default=None, init=False, repr=False)
+    _signature: tuple[str, int, int, int] | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+
+    def database_path(self) -> Path:
+        return resolve_processed_dir(self.processed_dir) / DUCKDB_OUTPUT
+
+    def _file_signature(self) -> tuple[str, int, int, int]:
+        path = self.database_path()
+        stat = path.stat()
+        return (str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def cursor(self) -> Any:
+        if duckdb is None:
+            raise ImportError("duckdb is not installed")
+
+        signature = self._file_signature()
+        local = self._local
+        if signature == self._signature and getattr(local, "generation", None) == self.generation:
+            return local.cursor
+
+        # Reopening and taking the cursor happen under one lock, so a concurrent reset() or
+        # publish cannot leave this thread holding a cursor on a handle that was replaced.
+        with self._lock:
+            if self._connection is None or signature != self._signature:
+                # The old handle is dropped, not closed: other threads may still be running
+                # queries on cursors from it, and it closes once they let go.
+                connection = duckdb.connect(":memory:")
+                escaped = signature[0].replace("'", "''")
+                connection.execute(f"ATTACH '{escaped}' AS {DUCKDB_ATTACH_ALIAS} (READ_ONLY)")
+                self._connection = connection
+                self._signature = signature
+                self.generation += 1
+                logger.info("Opened %s (generation %d)", signature[0], self.generation)
+
+            if getattr(local, "generation", None) != self.generation:
+                local.cursor = self._connection.cursor()
+                local.cursor.execute(f"USE {DUCKDB_ATTACH_ALIAS}")
+                local.generation = self.generation
+            return local.cursor
+
+    def healthy(self) -> bool:
+        try:
+            return self.cursor().execute("SELECT 1").fetchone() == (1,)
+        except Exception:  # noqa: BLE001
+            return False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._connection = None
+            self._signature = None
+            self.generation += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = None
+            self._signature = None
+            self.generation += 1
+
+    def query(self, sql: str, params: list[Any] | None = None) -> pd.DataFrame:
+        cursor = self.cursor()
+        try:
+            return cursor.execute(sql, params or []).df()
+        except duckdb.Error as exc:
+            if self.healthy():
+                raise
+            logger.warning("Reopening %s after a failed health check: %s", self.processed_dir, exc)
+            self.reset()
+            return self.cursor().execute(sql, params or []).df()
+
+
+# The process-wide registry: every Streamlit session thread and the loader share these
+# managers, so the app needs no st.cache_resource wrapper.
+_MANAGERS: OrderedDict[Path, DuckDBConnectionManager] = OrderedDict()
+_MANAGERS_LOCK = threading.Lock()
+
+
+def duckdb_connections(processed_dir: Path) -> DuckDBConnectionManager:
+    key = Path(processed_dir).resolve()
+    with _MANAGERS_LOCK:
+        manager = _MANAGERS.get(key)
+        if manager is None:
+            manager = _MANAGERS[key] = DuckDBConnectionManager(key)
+        _MANAGERS.move_to_end(key)
+        while len(_MANAGERS) > DUCKDB_MAX_OPEN_DATABASES:
+            _MANAGERS.popitem(last=False)
+        return manager
+
+
+def published_connections(database_path: Path) -> DuckDBConnectionManager | None:
+    # The live version is served by its processed dir's manager; superseded ones get None.
+    version_dir = Path(database_path).parent
+    if version_dir.parent.name != PUBLISH_VERSIONS_DIR:
+        return duckdb_connections(version_dir)
+    processed_dir = version_dir.parent.parent
+    if resolve_processed_dir(processed_dir) != version_dir:
+        return None
+    return duckdb_connections(processed_dir)
@@ -1,17 +1,40 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import hashlib
+import inspect
 import json
 import logging
+import mmap
+import multiprocessing
+import os
 import re
+import shutil
+import threading
+import time
 import zipfile
-from dataclasses import asdict, dataclass
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from difflib import SequenceMatcher
+from functools import cache, partial
+from itertools import islice
 from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
 
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover
+    duckdb = None
 
 logger = logging.getLogger(__name__)
 
@@ -70,12 +93,83 @@ STRING_FIELDS = [
     column for column in CANONICAL_FIELDS if column not in set(DATE_FIELDS + NUMERIC_FIELDS + ["year"])
 ]
 
+# Low-cardinality fields emitted as categoricals; finance types keep a fixed leading order.
+CATEGORICAL_FIELDS = ["finance_type", "sector", "province", "district", "status"]
+FINANCE_TYPE_CATEGORIES = ["DF", "FDI"]
+
+ENRICHMENT_FILL_FIELDS = [
+    "sector",
+    "province",
+    "district",
+    "latitude",
+    "longitude",
+    "status",
+    "approval_date",
+    "construction_start_date",
+    "financial_close_date",
+    "operation_date",
+    "committed_usd",
+    "disbursed_usd",
+    "year",
+]
+
+# Cross-source record linkage: rows are only compared inside a finance type + year + sector
+# block and a log-scale committed amount bucket (plus the next bucket up), so the number of
+# compared pairs grows with block size rather than with the square of the dataset.
+DEDUPE_AMOUNT_BUCKETS_PER_DECADE = 10
+DEDUPE_AMOUNT_TOLERANCE = 0.1
+DEDUPE_NAME_SIMILARITY = 0.9
+DEDUPE_REVIEW_SIMILARITY = 0.6
+# Rows whose bucket and neighbouring buckets together hold more rows than this are skipped.
+DEDUPE_MAX_BLOCK_SIZE = 2_000
+DEDUPE_BLOCK_KEYS = ["finance_type", "year", "sector", "bucket"]
+
+PARSE_CACHE_DIR = Path("data/cache/parse")
+PARSE_CACHE_MAX_BYTES = 1 << 30
+SOURCE_STORE_DIR = Path("data/cache/sources")
+
+SHARED_STRINGS_LRU_SIZE = 4096
+
+DATE_SAMPLE_ROWS = 200
+DATE_FORMAT_MIN_SHARE = 0.9
+
+ROW_FILTER_CHUNK_ROWS = 5_000
+
+STAGE_RSS_SAMPLE_SECONDS = 0.01
+
+CSV_OUTPUT = "projects_canonical.csv"
+PARQUET_OUTPUT = "projects_canonical.parquet"
+ARROW_OUTPUT = "projects_canonical.arrow"
+DUCKDB_OUTPUT = "projects.duckdb"
+QUALITY_OUTPUT = "data_quality.json"
+DEDUPE_AUDIT_OUTPUT = "dedupe_matches.csv"
+PARQUET_ROW_GROUP_SIZE = 50_000
+DUCKDB_INDEX_FIELDS = ["year", "finance_type", "province"]
+
+# Each ETL run publishes into versions/<version>; current.json names the live version.
+PUBLISH_VERSIONS_DIR = "versions"
+PUBLISH_POINTER = "current.json"
+PUBLISH_KEEP_VERSIONS = 3
+# A superseded version survives this long after its successor went live, since a running
+# server may still be reading it through a cached frame or an open DuckDB file.
+PUBLISH_PRUNE_GRACE_SECONDS = 3600
+# Copied to the top of out_dir on publish: the committed fallback read when no pointer exists.
+# The fast formats come along so a fresh checkout does not drop to the CSV loader.
+PUBLISH_TOP_LEVEL_OUTPUTS = [ARROW_OUTPUT, PARQUET_OUTPUT, DUCKDB_OUTPUT, CSV_OUTPUT]
+
+HEADER_CANDIDATES = range(0, 9)
+HEADER_SCAN_ROWS = 20
+
 XLSX_NS = {
     "a": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
     "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
     "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
 }
 
+# Normalized header names shorter than this ("Y", "X", "Lat") only match exactly; as
+# substrings they would hit unrelated headers such as "Year" or "Translation".
+FUZZY_MATCH_MIN_LENGTH = 4
+
 COUNTRY_HINTS = (
     "country",
     "recipient",
@@ -120,6 +214,102 @@ LONGITUDE_CANDIDATES = [
     "x_coord",
 ]
 
+LOCATION_CANDIDATES = (
+    PROVINCE_CANDIDATES + DISTRICT_CANDIDATES + LATITUDE_CANDIDATES + LONGITUDE_CANDIDATES
+)
+
+# Header candidates per source adapter, in resolution order. The _standardize_* and
+# _optional_enrichment_frame adapters read these, and SOURCE_COLUMNS is derived from them.
+AIDDATA_COLUMNS: dict[str, list[str]] = {
+    "project_id": ["AidData Record ID"],
+    "project_name": ["Title"],
+    "sector": ["Sector Name"],
+    "province": ["Available ADM1 Level"],
+    "district": ["Available ADM2 Level"],
+    "latitude": ["Latitude", "Project Latitude", "Available Latitude", "Lat"],
+    "longitude": ["Longitude", "Project Longitude", "Available Longitude", "Lon", "Lng"],
+    "status": ["Status"],
+    "approval_date": [
+        "Commitment Date",
+        "Commitment Date (MM/DD/YYYY)",
+        "Original Commitment Date",
+        "Date of Commitment",
+    ],
+    "actual_start": [
+        "Actual Implementation Start Date",
+        "Implementation Start Date",
+        "Actual Construction Start Date",
+        "Construction Start Date",
+    ],
+    "planned_start": [
+        "Planned Implementation Start Date",
+        "Planned Construction Start Date",
+        "Planned Start Date",
+        "Expected Start Date",
+    ],
+    "financial_close_date": ["Financial Close Date", "Loan Signing Date"],
+    "actual_completion": ["Actual Completion Date", "Actual Project Completion Date"],
+    "planned_completion": ["Planned Completion Date", "Expected Completion Date"],
+    "adjusted_amount": ["Adjusted Amount (Nominal USD)"],
+    "amount": ["Amount (Nominal USD)"],
+    "disbursed_usd": ["Disbursed Amount (Nominal USD)", "Disbursement Amount (Nominal USD)"],
+    "year": ["Commitment Year"],
+}
+
+CGIT_TRACKER_COLUMNS: dict[str, list[str]] = {
+    "transaction_party": ["Transaction Party"],
+    "investor": ["Investor/Contractor", "Investor", "Investor or Builder"],
+    "sector": ["Sector"],
+    "quantity_musd": ["Quantity in Millions"],
+    "year": ["Year"],
+}
+
+CGIT_INDONESIA_COLUMNS: dict[str, list[str]] = {
+    "project_name": ["Investor or Builder", "Investor"],
+    "sector": ["Sector"],
+    "status": ["Status"],
+    "amount_musd": ["Amount_musd"],
+    "amount": ["Amount"],
+    "year": ["Year"],
+}
+
+ENRICHMENT_COLUMNS: dict[str, list[str]] = {
+    "project_id": ["AidData Record ID", "project_id"],
+    "project_name": ["Title", "Project Name", "project_name"],
+    "sector": ["Sector Name", "Sector"],
+    "province": ["Available ADM1 Level", "Province"],
+    "district": ["Available ADM2 Level", "District"],
+    "latitude": ["Latitude"],
+    "longitude": ["Longitude"],
+    "status": ["Status"],
+    "approval_date": ["Commitment Date"],
+    "construction_start_date": ["Implementation Start Date"],
+    "financial_close_date": ["Financial Close Date"],
+    "operation_date": ["Actual Completion Date"],
+    "adjusted_amount": ["Adjusted Amount (Nominal USD)"],
+    "amount": ["Amount (Nominal USD)"],
+    "disbursed_usd": ["Disbursed Amount (Nominal USD)"],
+    "year": ["Commitment Year", "Year"],
+}
+
+
+def _source_columns(*groups: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(column for group in groups for column in group))
+
+
+# Source columns each adapter reads (country columns are always kept for the Indonesia
+# filter). Readers only decode headers these can resolve to.
+SOURCE_COLUMNS: dict[str, list[str]] = {
+    AIDDATA_FILENAME: _source_columns(
+        *AIDDATA_COLUMNS.values(), LATITUDE_CANDIDATES, LONGITUDE_CANDIDATES
+    ),
+    CGIT_TRACKER_FILENAME: _source_columns(*CGIT_TRACKER_COLUMNS.values(), LOCATION_CANDIDATES),
+    CGIT_INDONESIA_FILENAME: _source_columns(
+        *CGIT_INDONESIA_COLUMNS.values(), LOCATION_CANDIDATES
+    ),
+    ENRICHMENT_FILENAME: _source_columns(*ENRICHMENT_COLUMNS.values()),
+}
+
 
 @dataclass(slots=True)
 class ETLWarning:
@@ -149,6 +339,348 @@ class MappingAuditRow:
     canonical_column: str
     transform: str
     null_rate_pct: float
+    resolved_column: str = ""
+    values_cleaned: int = 0
+
+
+@dataclass(slots=True)
+class DuplicateMatch:
+    kept_project_id: str
+    dropped_project_id: str
+    kept_source: str
+    dropped_source: str
+    kept_name: str
+    dropped_name: str
+    block: str
+    name_similarity: float
+    amount_ratio: float
+    decision: str
+
+
+@dataclass(slots=True)
+class StageTiming:
+    stage: str
+    source_file: str = ""
+    started_at: float = 0.0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_mb: float | None = None
+    rss_growth_mb: float | None = None
+    pid: int = 0
+
+
+def _current_rss_bytes() -> int | None:
+    # Resident set size from /proc (Linux); None where it is not available.
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * mmap.PAGESIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RSSSampler:
+    # Polls RSS on a daemon thread for the duration of one stage, so each stage reports its
+    # own peak instead of the process-lifetime high-water mark.
+    __slots__ = ("start", "peak", "_stopped", "_thread")
+
+    def __init__(self, interval_s: float = STAGE_RSS_SAMPLE_SECONDS) -> None:
+        self.start = _current_rss_bytes()
+        self.peak = self.start
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._run, args=(interval_s,), daemon=True)
+            self._thread.start()
+
+    def _run(self, interval_s: float) -> None:
+        while not self._stopped.wait(interval_s):
+            self._sample()
+
+    def _sample(self) -> None:
+        current = _current_rss_bytes()
+        if current is not None and self.peak is not None and current > self.peak:
+            self.peak = current
+
+    def stop(self) -> tuple[float | None, float | None]:
+        if self._thread is None or self.start is None or self.peak is None:
+            return None, None
+        self._stopped.set()
+        self._thread.join()
+        self._sample()
+        return round(self.peak / (1 << 20), 1), round((self.peak - self.start) / (1 << 20), 1)
+
+
+@dataclass(slots=True)
+class StageProfiler:
+    timings: list[StageTiming] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str, source_file: str = "") -> Iterator[None]:
+        started_at = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        sampler = RSSSampler()
+        try:
+            yield
+        finally:
+            peak_rss_mb, rss_growth_mb = sampler.stop()
+            self.timings.append(
+                StageTiming(
+                    stage=name,
+                    source_file=source_file,
+                    started_at=started_at,
+                    wall_s=round(time.perf_counter() - wall_start, 4),
+                    cpu_s=round(time.process_time() - cpu_start, 4),
+                    peak_rss_mb=peak_rss_mb,
+                    rss_growth_mb=rss_growth_mb,
+                    pid=os.getpid(),
+                )
+            )
+
+    def report(self) -> dict[str, Any]:
+        started = min((item.started_at for item in self.timings), default=0.0)
+        return {
+            "peak_rss_mb": max(
+                (item.peak_rss_mb for item in self.timings if item.peak_rss_mb is not None),
+                default=None,
+            ),
+            "stages": [
+                {**asdict(item), "started_at": round(item.started_at - started, 4)}
+                for item in sorted(self.timings, key=lambda item: item.started_at)
+            ],
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        # Chrome trace "complete" events, viewable in chrome://tracing or Perfetto.
+        started = min((item.started_at for item in self.timings), default=0.0)
+        events = [
+            {
+                "name": item.stage if not item.source_file else f"{item.stage} {Path(item.source_file).name}",
+                "cat": "etl",
+                "ph": "X",
+                "ts": round((item.started_at - started) * 1_000_000),
+                "dur": round(item.wall_s * 1_000_000),
+                "pid": item.pid,
+                "tid": item.pid,
+                "args": {
+                    "source_file": item.source_file,
+                    "cpu_s": item.cpu_s,
+                    "peak_rss_mb": item.peak_rss_mb,
+                    "rss_growth_mb": item.rss_growth_mb,
+                },
+            }
+            for item in self.timings
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+
+@dataclass(slots=True)
+class SourceResult:
+    frame: pd.DataFrame | None = None
+    warnings: list[ETLWarning] = field(default_factory=list)
+    source_loads: list[SourceLoadStat] = field(default_factory=list)
+    audits: list[MappingAuditRow] = field(default_factory=list)
+    date_formats: dict[str, str] = field(default_factory=dict)
+    timings: list[StageTiming] = field(default_factory=list)
+
+
+def _source_rows(result: SourceResult) -> int:
+    return 0 if result.frame is None else len(result.frame)
+
+
+@dataclass(slots=True)
+class IndonesiaRowFilter:
+    rows_seen: int = 0
+    rows_dropped: int = 0
+
+    def apply(self, frame: pd.DataFrame) -> pd.DataFrame:
+        mask, _, _ = _indonesia_mask(frame)
+        self.rows_seen += len(frame)
+        self.rows_dropped += int((~mask).sum())
+        return frame.loc[mask].reset_index(drop=True)
+
+
+@dataclass(slots=True)
+class ParseCache:
+    directory: Path
+    max_bytes: int = PARSE_CACHE_MAX_BYTES
+    rebuild: bool = False
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.parquet", self.directory / f"{key}.json"
+
+    @property
+    def date_formats_path(self) -> Path:
+        return self.directory / "date_formats.json"
+
+    def _read_date_formats(self) -> dict[str, dict[str, str]]:
+        if not self.date_formats_path.exists():
+            return {}
+        try:
+            return json.loads(self.date_formats_path.read_text(encoding="utf-8"))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Ignoring unreadable date format cache: %s", exc)
+            return {}
+
+    def load_date_formats(self, source_name: str) -> dict[str, str]:
+        if self.rebuild:
+            return {}
+        return dict(self._read_date_formats().get(source_name, {}))
+
+    def store_date_formats(self, formats: dict[str, dict[str, str]]) -> None:
+        if not formats:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        merged = self._read_date_formats()
+        merged.update(formats)
+        tmp_path = self.date_formats_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(merged, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.date_formats_path)
+
+    def load(self, key: str) -> tuple[pd.DataFrame, dict[str, Any]] | None:
+        if self.rebuild:
+            return None
+
+        frame_path, meta_path = self._paths(key)
+        if not frame_path.exists() or not meta_path.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            frame = pd.read_parquet(frame_path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Ignoring unreadable parse cache entry %s: %s", key, exc)
+            return None
+
+        frame_path.touch()
+        return frame, meta
+
+    def store(self, key: str, frame: pd.DataFrame, meta: dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        frame_path, meta_path = self._paths(key)
+        tmp_path = frame_path.with_suffix(".parquet.tmp")
+
+        try:
+            frame.to_parquet(tmp_path, index=False)
+        except Exception as exc:  # noqa: BLE001
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Could not write parse cache entry %s: %s", key, exc)
+            return
+
+        tmp_path.replace(frame_path)
+        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        self.evict()
+
+    def evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for item in self.directory.glob("*.parquet"):
+            try:
+                stat = item.stat()
+            except FileNotFoundError:  # evicted concurrently by another worker
+                continue
+            entries.append((stat.st_mtime, stat.st_size, item))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, oldest in entries:
+            if total <= self.max_bytes:
+                break
+            total -= size
+            oldest.unlink(missing_ok=True)
+            oldest.with_suffix(".json").unlink(missing_ok=True)
+            logger.info("Evicted parse cache entry %s", oldest.name)
+
+
+@dataclass(slots=True)
+class SourceStore:
+    directory: Path
+    rebuild: bool = False
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / "manifest.json"
+
+    def _manifest(self) -> dict[str, Any]:
+        if not self.manifest_path.exists():
+            return {"sources": {}}
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.warning("Ignoring unreadable source manifest %s", self.manifest_path)
+            return {"sources": {}}
+
+    def _stem(self, path: Path, role: str) -> str:
+        return hashlib.sha256(f"{role}|{path}".encode()).hexdigest()[:16]
+
+    def load(self, path: Path, role: str, file_sha256: str) -> SourceResult | None:
+        if self.rebuild:
+            return None
+
+        entry = self._manifest()["sources"].get(str(path))
+        if (
+            entry is None
+            or entry.get("role") != role
+            or entry.get("file_sha256") != file_sha256
+            or entry.get("code_version") != _etl_code_version()
+        ):
+            return None
+
+        stem = self._stem(path, role)
+        try:
+            payload = json.loads((self.directory / f"{stem}.json").read_text(encoding="utf-8"))
+            frame = (
+                pd.read_parquet(self.directory / f"{stem}.parquet") if payload["has_frame"] else None
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Ignoring unreadable stored output for %s: %s", path.name, exc)
+            return None
+
+        return SourceResult(
+            frame=frame,
+            warnings=[ETLWarning(**item) for item in payload["warnings"]],
+            source_loads=[SourceLoadStat(**item) for item in payload["source_loads"]],
+            audits=[MappingAuditRow(**item) for item in payload["audits"]],
+        )
+
+    def save(self, entries: list[tuple[Path, str, str, SourceResult]]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest = self._manifest()
+        sources = manifest.setdefault("sources", {})
+
+        for path, role, file_sha256, result in entries:
+            if _is_read_error(result):
+                # A failed read may be transient (locked or half-copied file); drop any
+                # stored entry so the next run reads the source again.
+                sources.pop(str(path), None)
+                continue
+            stem = self._stem(path, role)
+            if result.frame is not None:
+                result.frame.to_parquet(self.directory / f"{stem}.parquet", index=False)
+            payload = {
+                "has_frame": result.frame is not None,
+                "warnings": [asdict(item) for item in result.warnings],
+                "source_loads": [asdict(item) for item in result.source_loads],
+                "audits": [asdict(item) for item in result.audits],
+            }
+            (self.directory / f"{stem}.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            sources[str(path)] = {
+                "role": role,
+                "file_sha256": file_sha256,
+                "parser_used": result.source_loads[0].parser_used if result.source_loads else "",
+                "code_version": _etl_code_version(),
+                "stored_at_utc": pd.Timestamp.now(tz="UTC").isoformat(),
+            }
+
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.manifest_path)
+
+
+def _is_read_error(result: SourceResult) -> bool:
+    return any(item.parser_used == "read_error" for item in result.source_loads) or any(
+        item.warning_type.endswith("read_error") for item in result.warnings
+    )
 
 
 def discover_raw_files(raw_dir: Path) -> list[Path]:
@@ -162,10 +694,19 @@ def discover_raw_files(raw_dir: Path) -> list[Path]:
     return sorted({path for path in files if path.is_file()})
 
 
+@cache
 def _normalize_column_name(name: str) -> str:
     return re.sub(r"[^a-z0-9]+", "", name.lower())
 
 
+def _column_names_match(candidate: str, column: str) -> bool:
+    # Both arguments are normalized; a fuzzy match needs the contained name to be long enough.
+    if candidate == column:
+        return True
+    shorter, longer = sorted((candidate, column), key=len)
+    return len(shorter) >= FUZZY_MATCH_MIN_LENGTH and shorter in longer
+
+
 def _strip_column_whitespace(frame: pd.DataFrame) -> pd.DataFrame:
     stripped = frame.copy()
     stripped.columns = _dedupe_columns(
@@ -184,40 +725,121 @@ def _column_lookup(frame: pd.DataFrame) -> dict[str, str]:
     return lookup
 
 
-def _find_column(frame: pd.DataFrame, candidates: list[str]) -> str | None:
-    lookup = _column_lookup(frame)
-    for candidate in candidates:
-        normalized = _normalize_column_name(candidate)
-        if normalized in lookup:
-            return lookup[normalized]
-
-    for candidate in candidates:
-        normalized = _normalize_column_name(candidate)
-        if not normalized:
-            continue
-        for normalized_column, original in lookup.items():
-            if normalized in normalized_column or normalized_column in normalized:
-                return original
-    return None
-
-
-def _get_column(frame: pd.DataFrame, candidates: list[str]) -> pd.Series:
-    match = _find_column(frame, candidates)
-    if match is None:
-        return pd.Series([pd.NA] * len(frame), index=frame.index)
-    return frame[match]
-
-
-def _to_numeric_clean(series: pd.Series, multiplier: float = 1.0) -> pd.Series:
-    cleaned = (
-        series.astype("string")
+@dataclass(slots=True)
+class ColumnMatch:
+    canonical: str
+    candidate: str
+    column: str
+    method: str
+
+    def describe(self) -> str:
+        if self.method == "exact":
+            return self.column
+        return f"{self.column} (fuzzy: {self.candidate})"
+
+
+class ColumnResolver:
+    # Normalizes a frame's headers once and memoizes candidate-list resolutions.
+    __slots__ = ("frame", "lookup", "matches", "values_cleaned", "date_formats", "_resolved")
+
+    def __init__(self, frame: pd.DataFrame, date_formats: dict[str, str] | None = None) -> None:
+        self.frame = frame
+        self.lookup = _column_lookup(frame)
+        self.matches: list[ColumnMatch] = []
+        self.values_cleaned: dict[str, int] = {}
+        self.date_formats = date_formats if date_formats is not None else {}
+        self._resolved: dict[tuple[str, ...], tuple[str, str, str] | None] = {}
+
+    def _resolve(self, candidates: Sequence[str]) -> tuple[str, str, str] | None:
+        key = tuple(candidates)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        resolved = None
+        normalized_candidates = [(candidate, _normalize_column_name(candidate)) for candidate in key]
+        for candidate, normalized in normalized_candidates:
+            if normalized in self.lookup:
+                resolved = (self.lookup[normalized], candidate, "exact")
+                break
+        else:
+            for candidate, normalized in normalized_candidates:
+                if not normalized:
+                    continue
+                resolved = next(
+                    (
+                        (original, candidate, "fuzzy")
+                        for normalized_column, original in self.lookup.items()
+                        if _column_names_match(normalized, normalized_column)
+                    ),
+                    None,
+                )
+                if resolved is not None:
+                    break
+
+        self._resolved[key] = resolved
+        return resolved
+
+    def find(self, candidates: Sequence[str]) -> str | None:
+        resolved = self._resolve(candidates)
+        return None if resolved is None else resolved[0]
+
+    def get(self, candidates: Sequence[str], canonical: str = "") -> pd.Series:
+        resolved = self._resolve(candidates)
+        if resolved is None:
+            return pd.Series([pd.NA] * len(self.frame), index=self.frame.index)
+
+        column, candidate, method = resolved
+        if canonical:
+            match = ColumnMatch(canonical=canonical, candidate=candidate, column=column, method=method)
+            if match not in self.matches:
+                self.matches.append(match)
+        return self.frame[column]
+
+    def numeric(self, candidates: Sequence[str], canonical: str = "", multiplier: float = 1.0) -> pd.Series:
+        values, cleaned = _clean_numeric(self.get(candidates, canonical))
+        if canonical:
+            self.values_cleaned[canonical] = self.values_cleaned.get(canonical, 0) + cleaned
+        return values * multiplier
+
+    def dates(self, candidates: Sequence[str], canonical: str = "") -> pd.Series:
+        column = self.find(candidates)
+        values = self.get(candidates, canonical)
+        if column is None:
+            return parse_date_any(values)
+
+        parsed, date_format = parse_dates_with_format(values, self.date_formats.get(column, ""))
+        if date_format:
+            self.date_formats[column] = date_format
+        return parsed
+
+    def describe(self, canonical: str) -> str:
+        return " | ".join(match.describe() for match in self.matches if match.canonical == canonical)
+
+
+def _clean_numeric(series: pd.Series) -> tuple[pd.Series, int]:
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return series.astype("Int64"), 0
+    if pd.api.types.is_float_dtype(series.dtype):
+        return series.astype("Float64"), 0
+
+    text = series.astype("string")
+    parsed = pd.to_numeric(text, errors="coerce")
+    needs_cleaning = text.notna() & parsed.isna()
+    if not needs_cleaning.any():
+        return parsed, 0
+
+    # Only values that fail the plain parse go through the currency/accounting cleanup.
+    text = text.copy()
+    text.loc[needs_cleaning] = (
+        text.loc[needs_cleaning]
         .str.replace(",", "", regex=False)
         .str.replace("$", "", regex=False)
         .str.replace("(", "-", regex=False)
         .str.replace(")", "", regex=False)
         .str.strip()
     )
-    return pd.to_numeric(cleaned, errors="coerce") * multiplier
+    parsed = pd.to_numeric(text, errors="coerce")
+    return parsed, int((needs_cleaning & parsed.notna()).sum())
 
 
 def _coalesce_series(series_list: list[pd.Series], index: pd.Index) -> pd.Series:
@@ -230,12 +852,62 @@ def _coalesce_series(series_list: list[pd.Series], index: pd.Index) -> pd.Series
     return result
 
 
-def parse_date_any(series: pd.Series) -> pd.Series:
-    text = series.astype("string").str.strip().replace({"": pd.NA})
-    parsed = pd.to_datetime(text, errors="coerce")
+def _excel_serial_dates(text: pd.Series) -> pd.Series:
     numeric = pd.to_numeric(text, errors="coerce")
-    parsed_excel_serial = pd.to_datetime(numeric, unit="D", origin="1899-12-30", errors="coerce")
-    return parsed.fillna(parsed_excel_serial)
+    return pd.to_datetime(numeric, unit="D", origin="1899-12-30", errors="coerce")
+
+
+def detect_date_format(text: pd.Series) -> str:
+    sample = text.dropna().head(DATE_SAMPLE_ROWS)
+    if sample.empty:
+        return ""
+
+    guesses = sample.map(guess_datetime_format)
+    if guesses.isna().all() and pd.to_numeric(sample, errors="coerce").notna().all():
+        return "excel_serial"
+
+    counts = guesses.value_counts()
+    if not counts.empty and counts.iloc[0] >= DATE_FORMAT_MIN_SHARE * len(sample):
+        return str(counts.index[0])
+    return "mixed"
+
+
+def _parse_date_text(text: pd.Series, date_format: str) -> tuple[pd.Series, int]:
+    if date_format == "excel_serial":
+        parsed = _excel_serial_dates(text)
+    else:
+        parsed = pd.to_datetime(text, format=date_format or "mixed", errors="coerce")
+    matched = int(parsed.notna().sum())
+
+    residual = text.notna() & parsed.isna()
+    if residual.any():
+        # Values the column format missed fall back to Excel serials, then per-value parsing.
+        rest = text.loc[residual]
+        fallback = _excel_serial_dates(rest)
+        unresolved = fallback.isna()
+        if date_format != "mixed" and unresolved.any():
+            fallback.loc[unresolved] = pd.to_datetime(rest.loc[unresolved], format="mixed", errors="coerce")
+        parsed = parsed.fillna(fallback)
+    return parsed, matched
+
+
+def parse_dates_with_format(series: pd.Series, date_format: str = "") -> tuple[pd.Series, str]:
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        return series.astype("datetime64[ns]"), "datetime"
+
+    text = series.astype("string").str.strip().replace({"": pd.NA})
+    if date_format and date_format != "datetime":
+        parsed, matched = _parse_date_text(text, date_format)
+        # A remembered format that no longer fits the column is detected again.
+        if matched >= DATE_FORMAT_MIN_SHARE * int(text.notna().sum()):
+            return parsed, date_format
+
+    detected = detect_date_format(text)
+    return _parse_date_text(text, detected)[0], detected
+
+
+def parse_date_any(series: pd.Series) -> pd.Series:
+    return parse_dates_with_format(series)[0]
 
 
 def _excel_col_to_index(cell_ref: str) -> int:
@@ -249,16 +921,87 @@ def _excel_col_to_index(cell_ref: str) -> int:
     return value - 1
 
 
-def _xlsx_shared_strings(archive: zipfile.ZipFile) -> list[str]:
+class SharedStringTable:
+    # Shared strings packed into one UTF-8 buffer; only referenced entries are decoded. Recent
+    # decodes are kept in a bounded per-instance LRU, and ``decoded`` counts distinct entries.
+    __slots__ = ("_buffer", "_offsets", "_cache", "_seen", "decoded")
+
+    def __init__(self, buffer: bytes = b"", offsets: array | None = None) -> None:
+        self._buffer = buffer
+        self._offsets = offsets if offsets is not None else array("Q", [0])
+        self._cache: OrderedDict[int, str] = OrderedDict()
+        self._seen = bytearray(len(self._offsets) - 1)
+        self.decoded = 0
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0 or index >= len(self):
+            raise IndexError(index)
+        value = self._cache.get(index)
+        if value is not None:
+            self._cache.move_to_end(index)
+            return value
+
+        if not self._seen[index]:
+            self._seen[index] = 1
+            self.decoded += 1
+        start, end = self._offsets[index], self._offsets[index + 1]
+        value = self._cache[index] = self._buffer[start:end].decode("utf-8")
+        if len(self._cache) > SHARED_STRINGS_LRU_SIZE:
+            self._cache.popitem(last=False)
+        return value
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buffer) + self._offsets.itemsize * len(self._offsets)
+
+
+def _xlsx_shared_strings(archive: zipfile.ZipFile) -> SharedStringTable:
     path = "xl/sharedStrings.xml"
     if path not in archive.namelist():
-        return []
+        return SharedStringTable()
+
+    si_tag = f"{{{XLSX_NS['a']}}}si"
+    text_tag = f"{{{XLSX_NS['a']}}}t"
+    buffer = bytearray()
+    offsets = array("Q", [0])
+
+    with archive.open(path) as handle:
+        root: ET.Element | None = None
+        for event, element in ET.iterparse(handle, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                continue
+            if element.tag != si_tag:
+                continue
+
+            buffer.extend("".join((node.text or "") for node in element.iter(text_tag)).encode("utf-8"))
+            offsets.append(len(buffer))
+            element.clear()
+            if root is not None:
+                root.remove(element)
+
+    table = SharedStringTable(bytes(buffer), offsets)
+    logger.info(
+        "Shared strings file=%s count=%s packed_bytes=%s",
+        Path(archive.filename or "").name,
+        len(table),
+        table.nbytes,
+    )
+    return table
 
-    root = ET.fromstring(archive.read(path))
-    values: list[str] = []
-    for item in root.findall("a:si", XLSX_NS):
-        values.append("".join((node.text or "") for node in item.findall(".//a:t", XLSX_NS)))
-    return values
+
+def _log_shared_string_usage(path: Path, shared_strings: SharedStringTable) -> None:
+    logger.info(
+        "Shared strings file=%s decoded=%s of %s packed_bytes=%s",
+        path.name,
+        shared_strings.decoded,
+        len(shared_strings),
+        shared_strings.nbytes,
+    )
 
 
 def _xlsx_sheet_targets(archive: zipfile.ZipFile) -> dict[str, str]:
@@ -289,7 +1032,7 @@ def _xlsx_sheet_targets(archive: zipfile.ZipFile) -> dict[str, str]:
     return targets
 
 
-def _xlsx_cell_value(cell: ET.Element, shared_strings: list[str]) -> Any:
+def _xlsx_cell_value(cell: ET.Element, shared_strings: SharedStringTable) -> Any:
     cell_type = cell.attrib.get("t")
 
     if cell_type == "inlineStr":
@@ -312,33 +1055,98 @@ def _xlsx_cell_value(cell: ET.Element, shared_strings: list[str]) -> Any:
     return raw
 
 
-def _xlsx_rows_for_sheet(
+def _iter_xlsx_rows(
     archive: zipfile.ZipFile,
     sheet_target: str,
-    shared_strings: list[str],
-) -> list[list[Any]]:
-    sheet_root = ET.fromstring(archive.read(sheet_target))
-    sheet_data = sheet_root.find("a:sheetData", XLSX_NS)
-    if sheet_data is None:
-        return []
+    shared_strings: SharedStringTable,
+    keep_columns: list[int] | None = None,
+) -> Iterator[list[Any]]:
+    row_tag = f"{{{XLSX_NS['a']}}}row"
+    cell_tag = f"{{{XLSX_NS['a']}}}c"
+    sheet_data_tag = f"{{{XLSX_NS['a']}}}sheetData"
+    keep_set = set(keep_columns) if keep_columns is not None else None
+
+    with archive.open(sheet_target) as handle:
+        sheet_data: ET.Element | None = None
+        for event, element in ET.iterparse(handle, events=("start", "end")):
+            if event == "start":
+                if element.tag == sheet_data_tag:
+                    sheet_data = element
+                continue
 
-    sparse_rows: list[dict[int, Any]] = []
-    max_col = 0
+            if element.tag != row_tag:
+                continue
+
+            values: dict[int, Any] = {}
+            skipped: list[ET.Element] = []
+            for cell in element.iter(cell_tag):
+                index = _excel_col_to_index(cell.attrib.get("r", "A1"))
+                if keep_set is not None and index not in keep_set:
+                    skipped.append(cell)
+                    continue
+                values[index] = _xlsx_cell_value(cell, shared_strings)
+
+            if keep_columns is None:
+                width = max(values) + 1 if values else 0
+                yield [values.get(index, pd.NA) for index in range(width)]
+            else:
+                # Projected rows can be empty while the sheet row is not; report fully blank
+                # rows as [] so callers can still drop exactly the rows an unprojected read would.
+                projected = [values.get(index, pd.NA) for index in keep_columns]
+                blank = not _row_has_values(projected) and not any(
+                    _row_has_values([_xlsx_cell_value(cell, shared_strings)]) for cell in skipped
+                )
+                yield [] if blank else projected
+
+            # Drop the consumed row so memory stays bounded by a single row.
+            element.clear()
+            if sheet_data is not None:
+                sheet_data.remove(element)
+
+
+def _column_projection(columns: Sequence[str] | None) -> Callable[[Any], bool] | None:
+    if columns is None:
+        return None
+
+    candidates = {_normalize_column_name(column) for column in columns} - {""}
 
-    for row in sheet_data.findall("a:row", XLSX_NS):
-        values: dict[int, Any] = {}
-        for cell in row.findall("a:c", XLSX_NS):
-            index = _excel_col_to_index(cell.attrib.get("r", "A1"))
-            values[index] = _xlsx_cell_value(cell, shared_strings)
-            max_col = max(max_col, index)
-        sparse_rows.append(values)
+    # Keep every header ColumnResolver could resolve for these candidates (same matching
+    # rules) plus the country columns the Indonesia filter needs.
+    def keep(name: Any) -> bool:
+        normalized = _normalize_column_name("" if pd.isna(name) else str(name).strip())
+        if not normalized:
+            return False
+        if any(hint in normalized for hint in COUNTRY_HINTS):
+            return True
+        return any(_column_names_match(candidate, normalized) for candidate in candidates)
+
+    return keep
+
+
+def _projected_indices(header: list[Any], usecols: Callable[[Any], bool]) -> list[int] | None:
+    indices = [index for index, value in enumerate(header) if usecols(value)]
+    # With nothing to project, read every column so row accounting stays exact.
+    return indices or None
 
-    dense_rows: list[list[Any]] = []
-    width = max_col + 1
-    for sparse in sparse_rows:
-        dense_rows.append([sparse.get(index, pd.NA) for index in range(width)])
 
-    return dense_rows
+def _settle_projection(
+    path: Path,
+    reader: Callable[..., pd.DataFrame],
+    usecols: Callable[[Any], bool] | None,
+) -> Callable[[Any], bool] | None:
+    # The projection is settled on the header alone, so the body is parsed exactly once.
+    if usecols is not None and not any(usecols(name) for name in reader(nrows=0).columns):
+        logger.warning("Column projection matched no headers file=%s; reading all columns", path.name)
+        return None
+    return usecols
+
+
+def _read_projected(
+    path: Path,
+    reader: Callable[..., pd.DataFrame],
+    usecols: Callable[[Any], bool] | None,
+) -> pd.DataFrame:
+    return reader(usecols=_settle_projection(path, reader, usecols))
 
 
 def _dedupe_columns(raw_columns: list[Any]) -> list[str]:
@@ -357,18 +1165,43 @@ def _dedupe_columns(raw_columns: list[Any]) -> list[str]:
     return columns
 
 
-def _frame_from_rows(rows: list[list[Any]], header_row: int) -> pd.DataFrame:
-    if header_row >= len(rows):
-        return pd.DataFrame()
-
-    header = rows[header_row]
-    columns = _dedupe_columns(header)
-    values = rows[header_row + 1 :]
-
-    frame = pd.DataFrame(values, columns=columns)
-    frame = frame.replace({"": pd.NA})
-    frame = frame.dropna(how="all").reset_index(drop=True)
-    return _strip_column_whitespace(frame)
+def _frame_from_rows(
+    rows: Iterable[list[Any]],
+    header_row: int,
+    drop_blank_rows: bool = True,
+    row_filter: IndonesiaRowFilter | None = None,
+) -> pd.DataFrame:
+    row_iter = iter(rows)
+    header: list[Any] | None = None
+    width = 0
+    for _ in range(header_row + 1):
+        header = next(row_iter, None)
+        if header is None:
+            return pd.DataFrame()
+        width = max(width, len(header))
+
+    def _build(values: list[list[Any]]) -> pd.DataFrame:
+        chunk_width = max([width, *(len(row) for row in values)])
+        padded_header = header + [pd.NA] * (chunk_width - len(header))
+        padded = [row + [pd.NA] * (chunk_width - len(row)) for row in values]
+
+        frame = pd.DataFrame(padded, columns=_dedupe_columns(padded_header))
+        frame = frame.replace({"": pd.NA})
+        if drop_blank_rows:
+            frame = frame.dropna(how="all")
+        return _strip_column_whitespace(frame.reset_index(drop=True))
+
+    rows_to_keep = (row for row in row_iter if drop_blank_rows or row)
+    if row_filter is None:
+        return _build(list(rows_to_keep))
+
+    # Filter while streaming so only matching rows are ever held beyond one chunk.
+    chunks: list[pd.DataFrame] = []
+    while batch := list(islice(rows_to_keep, ROW_FILTER_CHUNK_ROWS)):
+        chunks.append(row_filter.apply(_build(batch)))
+    if not chunks:
+        return row_filter.apply(_build([]))
+    return pd.concat(chunks, ignore_index=True)
 
 
 def _non_unnamed_column_count(columns: list[Any]) -> int:
@@ -383,7 +1216,13 @@ def _non_unnamed_column_count(columns: list[Any]) -> int:
     return count
 
 
-def _read_xlsx_sheet_header(path: Path, sheet_name: str, header_row: int) -> tuple[pd.DataFrame, str]:
+def _read_xlsx_sheet_header(
+    path: Path,
+    sheet_name: str,
+    header_row: int,
+    usecols: Callable[[Any], bool] | None = None,
+    row_filter: IndonesiaRowFilter | None = None,
+) -> tuple[pd.DataFrame, str]:
     with zipfile.ZipFile(path) as archive:
         targets = _xlsx_sheet_targets(archive)
         target = targets.get(sheet_name)
@@ -391,16 +1230,64 @@ def _read_xlsx_sheet_header(path: Path, sheet_name: str, header_row: int) -> tup
             raise ValueError(f"Sheet '{sheet_name}' not found in {path.name}.")
 
         shared = _xlsx_shared_strings(archive)
-        rows = _xlsx_rows_for_sheet(archive, target, shared)
-        frame = _frame_from_rows(rows, header_row)
+        keep_columns = None
+        if usecols is not None:
+            head = _xlsx_sample_rows(archive, target, shared, limit=header_row + 1)
+            if len(head) > header_row:
+                keep_columns = _projected_indices(head[header_row], usecols)
+        rows = _iter_xlsx_rows(archive, target, shared, keep_columns)
+        frame = _frame_from_rows(rows, header_row, keep_columns is None, row_filter)
+        _log_shared_string_usage(path, shared)
 
     parser = f"xlsx_zip(sheet={sheet_name},header={header_row})"
     return frame, parser
 
 
-def _scan_xlsx_for_best_parse(path: Path) -> tuple[pd.DataFrame, str]:
-    best_frame: pd.DataFrame | None = None
+def _row_has_values(row: list[Any]) -> bool:
+    return any(not pd.isna(value) and value != "" for value in row)
+
+
+def _score_header_candidates(sample_rows: list[list[Any]]) -> tuple[int, int, int]:
+    best_header = -1
+    best_score = -1
+    best_rows = -1
+
+    for header in HEADER_CANDIDATES:
+        if header >= len(sample_rows):
+            break
+
+        score = _non_unnamed_column_count(sample_rows[header])
+        row_count = sum(1 for row in sample_rows[header + 1 :] if _row_has_values(row))
+        if score > best_score or (score == best_score and row_count > best_rows):
+            best_header = header
+            best_score = score
+            best_rows = row_count
+
+    return best_header, best_score, best_rows
+
+
+def _xlsx_sample_rows(
+    archive: zipfile.ZipFile,
+    sheet_target: str,
+    shared_strings: SharedStringTable,
+    limit: int = HEADER_SCAN_ROWS,
+) -> list[list[Any]]:
+    rows = _iter_xlsx_rows(archive, sheet_target, shared_strings)
+    try:
+        return list(islice(rows, limit))
+    finally:
+        rows.close()
+
+
+def _scan_xlsx_for_best_parse(
+    path: Path,
+    usecols: Callable[[Any], bool] | None = None,
+    row_filter: IndonesiaRowFilter | None = None,
+) -> tuple[pd.DataFrame, str]:
+    best_target = ""
+    best_sample: list[list[Any]] = []
     best_parser = ""
+    best_header = -1
     best_score = -1
     best_rows = -1
 
@@ -410,52 +1297,107 @@ def _scan_xlsx_for_best_parse(path: Path) -> tuple[pd.DataFrame, str]:
 
         for sheet_name, target in targets.items():
             try:
-                rows = _xlsx_rows_for_sheet(archive, target, shared)
+                sample = _xlsx_sample_rows(archive, target, shared)
             except Exception:  # noqa: BLE001
                 continue
 
-            for header in range(0, 9):
-                frame = _frame_from_rows(rows, header)
-                score = _non_unnamed_column_count(frame.columns.tolist())
-                row_count = len(frame)
-                if score > best_score or (score == best_score and row_count > best_rows):
-                    best_frame = frame
-                    best_score = score
-                    best_rows = row_count
-                    best_parser = f"excel_fallback_scan(sheet={sheet_name},header={header},score={score})"
+            header, score, row_count = _score_header_candidates(sample)
+            if header < 0:
+                continue
+            if score > best_score or (score == best_score and row_count > best_rows):
+                best_target = target
+                best_sample = sample
+                best_header = header
+                best_score = score
+                best_rows = row_count
+                best_parser = f"excel_fallback_scan(sheet={sheet_name},header={header},score={score})"
+
+        if not best_target:
+            raise ValueError(f"Failed to parse {path.name} using xlsx fallback scan.")
 
-    if best_frame is None:
-        raise ValueError(f"Failed to parse {path.name} using xlsx fallback scan.")
+        keep_columns = _projected_indices(best_sample[best_header], usecols) if usecols else None
+        rows = _iter_xlsx_rows(archive, best_target, shared, keep_columns)
+        frame = _frame_from_rows(rows, best_header, keep_columns is None, row_filter)
+        _log_shared_string_usage(path, shared)
 
-    return best_frame, best_parser
+    return frame, best_parser
 
 
-def _scan_excel_with_pandas(path: Path) -> tuple[pd.DataFrame, str]:
-    best_frame: pd.DataFrame | None = None
+def _scan_excel_with_pandas(
+    path: Path,
+    usecols: Callable[[Any], bool] | None = None,
+) -> tuple[pd.DataFrame, str]:
+    best_sheet: str | int | None = None
     best_parser = ""
+    best_header = -1
     best_score = -1
     best_rows = -1
 
-    workbook = pd.ExcelFile(path)
-    for sheet_name in workbook.sheet_names:
-        for header in range(0, 9):
+    with pd.ExcelFile(path) as workbook:
+        for sheet_name in workbook.sheet_names:
             try:
-                frame = pd.read_excel(path, sheet_name=sheet_name, header=header)
+                sample = workbook.parse(sheet_name, header=None, nrows=HEADER_SCAN_ROWS)
             except Exception:  # noqa: BLE001
                 continue
 
-            score = _non_unnamed_column_count(frame.columns.tolist())
-            row_count = len(frame)
+            header, score, row_count = _score_header_candidates(sample.values.tolist())
+            if header < 0:
+                continue
             if score > best_score or (score == best_score and row_count > best_rows):
-                best_frame = frame
+                best_sheet = sheet_name
+                best_header = header
                 best_score = score
                 best_rows = row_count
                 best_parser = f"excel_fallback_scan(sheet={sheet_name},header={header},score={score})"
 
-    if best_frame is None:
-        raise ValueError(f"Failed to parse {path.name} using excel fallback scan.")
+        if best_sheet is None:
+            raise ValueError(f"Failed to parse {path.name} using excel fallback scan.")
 
-    return best_frame, best_parser
+        frame = _read_projected(path, partial(workbook.parse, best_sheet, header=best_header), usecols)
+
+    return frame, best_parser
+
+
+def _apply_row_filter(frame: pd.DataFrame, row_filter: IndonesiaRowFilter | None) -> pd.DataFrame:
+    return frame if row_filter is None else row_filter.apply(frame)
+
+
+def _read_csv_filtered(
+    path: Path,
+    usecols: Callable[[Any], bool] | None,
+    row_filter: IndonesiaRowFilter,
+) -> pd.DataFrame:
+    usecols = _settle_projection(path, partial(pd.read_csv, path), usecols)
+    # dtype=str gives every chunk the same columns and dtypes, so they concatenate as read.
+    with pd.read_csv(path, dtype=str, usecols=usecols, chunksize=ROW_FILTER_CHUNK_ROWS) as reader:
+        chunks = [row_filter.apply(_strip_column_whitespace(chunk)) for chunk in reader]
+    if not chunks:
+        header = pd.read_csv(path, dtype=str, usecols=usecols, nrows=0)
+        return row_filter.apply(_strip_column_whitespace(header))
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _read_xlsx_filtered(
+    path: Path,
+    sheet_name: str | None,
+    header_row: int,
+    usecols: Callable[[Any], bool] | None,
+    row_filter: IndonesiaRowFilter,
+) -> tuple[pd.DataFrame, str]:
+    label = sheet_name
+    if sheet_name is None:
+        with zipfile.ZipFile(path) as archive:
+            sheet_name = next(iter(_xlsx_sheet_targets(archive)), None)
+        if sheet_name is None:
+            raise ValueError(f"No worksheets found in {path.name}.")
+        label = "0"
+
+    # Counts move to the caller's filter only once the whole sheet streamed without error.
+    stream_filter = IndonesiaRowFilter()
+    frame, _ = _read_xlsx_sheet_header(path, sheet_name, header_row, usecols, stream_filter)
+    row_filter.rows_seen += stream_filter.rows_seen
+    row_filter.rows_dropped += stream_filter.rows_dropped
+    return frame, f"xlsx_stream(sheet={label},header={header_row})"
 
 
 def read_raw_file(
@@ -463,23 +1405,57 @@ def read_raw_file(
     warnings: list[ETLWarning],
     fixed_sheet: str | None = None,
     fixed_header: int | None = None,
+    columns: Sequence[str] | None = None,
+    row_filter: IndonesiaRowFilter | None = None,
 ) -> tuple[pd.DataFrame, str]:
     suffix = path.suffix.lower()
+    usecols = _column_projection(columns)
 
     if suffix == ".csv":
-        return _strip_column_whitespace(pd.read_csv(path)), "csv(header=0)"
+        if row_filter is not None:
+            return _read_csv_filtered(path, usecols, row_filter), "csv(header=0)"
+        frame = _read_projected(path, partial(pd.read_csv, path), usecols)
+        return _strip_column_whitespace(frame), "csv(header=0)"
 
     if suffix not in {".xlsx", ".xls"}:
         raise ValueError(f"Unsupported file extension: {path.suffix}")
 
+    # Filtered workbooks stream so rows outside Indonesia never build up; pandas loads the
+    # whole sheet and is only the fallback here (and the sole reader for .xls).
+    if suffix == ".xlsx" and row_filter is not None:
+        try:
+            return _read_xlsx_filtered(
+                path,
+                fixed_sheet if fixed_header is not None else None,
+                fixed_header if fixed_sheet is not None else 0,
+                usecols,
+                row_filter,
+            )
+        except Exception as exc:  # noqa: BLE001
+            warnings.append(
+                ETLWarning(
+                    source_file=str(path),
+                    warning_type="xlsx_stream_failed",
+                    message=f"Streaming xlsx parser failed; pandas parser used. Error: {exc}",
+                )
+            )
+
     if fixed_sheet is not None and fixed_header is not None:
         try:
-            frame = pd.read_excel(path, sheet_name=fixed_sheet, header=fixed_header)
-            parser = f"excel_fixed(sheet={fixed_sheet},header={fixed_header})"
-            return _strip_column_whitespace(frame), parser
+            frame = _read_projected(
+                path,
+                partial(pd.read_excel, path, sheet_name=fixed_sheet, header=fixed_header),
+                usecols,
+            )
         except Exception as exc:  # noqa: BLE001
             if suffix == ".xlsx":
-                frame, parser = _read_xlsx_sheet_header(path, fixed_sheet, fixed_header)
+                frame, parser = _read_xlsx_sheet_header(
+                    path,
+                    fixed_sheet,
+                    fixed_header,
+                    usecols,
+                    row_filter,
+                )
                 warnings.append(
                     ETLWarning(
                         source_file=str(path),
@@ -493,14 +1469,17 @@ def read_raw_file(
                 return _strip_column_whitespace(frame), parser
             raise
 
+        parser = f"excel_fixed(sheet={fixed_sheet},header={fixed_header})"
+        return _apply_row_filter(_strip_column_whitespace(frame), row_filter), parser
+
     try:
-        frame = pd.read_excel(path, sheet_name=0, header=0)
-        return _strip_column_whitespace(frame), "excel_default(sheet=0,header=0)"
+        frame = _read_projected(path, partial(pd.read_excel, path, sheet_name=0, header=0), usecols)
     except Exception as exc:  # noqa: BLE001
         if suffix == ".xlsx":
-            frame, parser = _scan_xlsx_for_best_parse(path)
+            frame, parser = _scan_xlsx_for_best_parse(path, usecols, row_filter)
         else:
-            frame, parser = _scan_excel_with_pandas(path)
+            frame, parser = _scan_excel_with_pandas(path, usecols)
+            frame = _apply_row_filter(_strip_column_whitespace(frame), row_filter)
 
         warnings.append(
             ETLWarning(
@@ -514,6 +1493,212 @@ def read_raw_file(
         )
         return _strip_column_whitespace(frame), parser
 
+    return _apply_row_filter(_strip_column_whitespace(frame), row_filter), "excel_default(sheet=0,header=0)"
+
+
+@cache
+def _etl_code_version() -> str:
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+@cache
+def _reader_code_version() -> str:
+    # Parsed frames depend on the reader functions and the header/matching constants they use,
+    # so any edit to them invalidates cached parses without a hand-bumped version.
+    readers = (
+        read_raw_file,
+        _read_projected,
+        _settle_projection,
+        _read_csv_filtered,
+        _read_xlsx_filtered,
+        _column_projection,
+        _projected_indices,
+        _column_names_match,
+        _normalize_column_name,
+        _read_xlsx_sheet_header,
+        _scan_xlsx_for_best_parse,
+        _scan_excel_with_pandas,
+        _score_header_candidates,
+        _non_unnamed_column_count,
+        _xlsx_sample_rows,
+        _iter_xlsx_rows,
+        _xlsx_cell_value,
+        _xlsx_shared_strings,
+        _xlsx_sheet_targets,
+        _frame_from_rows,
+        _dedupe_columns,
+        _strip_column_whitespace,
+        _row_has_values,
+        _apply_row_filter,
+        _indonesia_mask,
+        _column_lookup,
+        _cacheable_frame,
+        IndonesiaRowFilter,
+        SharedStringTable,
+    )
+    digest = hashlib.sha256()
+    for reader in readers:
+        digest.update(inspect.getsource(reader).encode("utf-8"))
+    constants = (list(HEADER_CANDIDATES), HEADER_SCAN_ROWS, FUZZY_MATCH_MIN_LENGTH, COUNTRY_HINTS, XLSX_NS)
+    digest.update(repr(constants).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_cache_key(
+    path: Path,
+    fixed_sheet: str | None,
+    fixed_header: int | None,
+    columns: Sequence[str] | None = None,
+    indonesia_only: bool = False,
+) -> str:
+    payload = json.dumps(
+        {
+            "reader_version": _reader_code_version(),
+            "file_sha256": _file_digest(path),
+            "fixed_sheet": fixed_sheet,
+            "fixed_header": fixed_header,
+            "columns": sorted(columns) if columns is not None else None,
+            "indonesia_only": indonesia_only,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cacheable_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    # Raw object columns routinely mix str/int/datetime cells, which Parquet cannot store.
+    # Every read returns them as ``string`` so cold, cached and uncached runs see one dtype.
+    cacheable = frame.copy()
+    for column in cacheable.columns:
+        if cacheable[column].dtype == object:
+            cacheable[column] = cacheable[column].astype("string")
+    return cacheable
+
+
+def read_raw_file_cached(
+    path: Path,
+    warnings: list[ETLWarning],
+    cache: ParseCache | None,
+    fixed_sheet: str | None = None,
+    fixed_header: int | None = None,
+    columns: Sequence[str] | None = None,
+    row_filter: IndonesiaRowFilter | None = None,
+) -> tuple[pd.DataFrame, str]:
+    if cache is None:
+        frame, parser = read_raw_file(
+            path,
+            warnings,
+            fixed_sheet=fixed_sheet,
+            fixed_header=fixed_header,
+            columns=columns,
+            row_filter=row_filter,
+        )
+        return _cacheable_frame(frame), parser
+
+    key = _parse_cache_key(path, fixed_sheet, fixed_header, columns, row_filter is not None)
+    cached = cache.load(key)
+    if cached is not None:
+        frame, meta = cached
+        warnings.extend(
+            ETLWarning(source_file=str(path), warning_type=item["warning_type"], message=item["message"])
+            for item in meta.get("warnings", [])
+        )
+        if row_filter is not None:
+            row_filter.rows_seen += int(meta.get("rows_seen", 0))
+            row_filter.rows_dropped += int(meta.get("rows_dropped", 0))
+        parser = str(meta.get("parser_used", ""))
+        logger.info("Parse cache hit file=%s parser=%s", path.name, parser)
+        return frame, parser
+
+    read_warnings: list[ETLWarning] = []
+    read_filter = IndonesiaRowFilter() if row_filter is not None else None
+    frame, parser = read_raw_file(
+        path,
+        read_warnings,
+        fixed_sheet=fixed_sheet,
+        fixed_header=fixed_header,
+        columns=columns,
+        row_filter=read_filter,
+    )
+    frame = _cacheable_frame(frame)
+    warnings.extend(read_warnings)
+    meta: dict[str, Any] = {
+        "parser_used": parser,
+        "warnings": [{"warning_type": item.warning_type, "message": item.message} for item in read_warnings],
+    }
+    if row_filter is not None and read_filter is not None:
+        row_filter.rows_seen += read_filter.rows_seen
+        row_filter.rows_dropped += read_filter.rows_dropped
+        meta["rows_seen"] = read_filter.rows_seen
+        meta["rows_dropped"] = read_filter.rows_dropped
+    cache.store(key, frame, meta)
+    return frame, parser
+
+
+def _xlsx_cell_has_value(cell: ET.Element) -> bool:
+    for node in (cell.find("a:v", XLSX_NS), cell.find("a:is/a:t", XLSX_NS)):
+        if node is not None and node.text:
+            return True
+    return False
+
+
+def _xlsx_row_count(path: Path) -> int:
+    row_tag = f"{{{XLSX_NS['a']}}}row"
+    sheet_data_tag = f"{{{XLSX_NS['a']}}}sheetData"
+
+    with zipfile.ZipFile(path) as archive:
+        targets = _xlsx_sheet_targets(archive)
+        if not targets:
+            raise ValueError(f"No worksheets found in {path.name}.")
+        first_target = next(iter(targets.values()))
+
+        row_number = 0
+        last_value_row = 0
+        with archive.open(first_target) as handle:
+            sheet_data: ET.Element | None = None
+            for event, element in ET.iterparse(handle, events=("start", "end")):
+                if event == "start":
+                    if element.tag == sheet_data_tag:
+                        sheet_data = element
+                    continue
+                if element.tag != row_tag:
+                    continue
+                row_attr = element.attrib.get("r", "")
+                row_number = int(row_attr) if row_attr.isdigit() else row_number + 1
+                if any(_xlsx_cell_has_value(cell) for cell in element.findall("a:c", XLSX_NS)):
+                    last_value_row = row_number
+                # Drop the counted row, as _iter_xlsx_rows does, so memory stays flat.
+                element.clear()
+                if sheet_data is not None:
+                    sheet_data.remove(element)
+
+    # Mirrors pd.read_excel(sheet_name=0, header=0): rows run from sheet row 1 through the last
+    # row holding a value (gaps included, trailing blanks trimmed) and row 1 is the header.
+    return max(last_value_row - 1, 0)
+
+
+def _csv_row_count(path: Path) -> int:
+    with path.open(newline="", encoding="utf-8", errors="replace") as handle:
+        non_blank = sum(1 for row in csv.reader(handle) if row)
+    return max(non_blank - 1, 0)
+
+
+def inspect_raw_row_count(path: Path) -> tuple[int, str] | None:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return _csv_row_count(path), "metadata(csv_rows,header=0)"
+    if suffix == ".xlsx":
+        return _xlsx_row_count(path), "metadata(xlsx_rows,sheet=0,header=0)"
+    return None
+
 
 def _indonesia_mask(frame: pd.DataFrame) -> tuple[pd.Series, pd.Series, list[str]]:
     lookup = _column_lookup(frame)
@@ -567,16 +1752,23 @@ def _enforce_indonesia_filter(
     return filtered, filtered_country, excluded_rows
 
 
-def _parse_dates(series: pd.Series) -> pd.Series:
-    return parse_date_any(series)
-
-
-def _resolve_location_series(filtered: pd.DataFrame) -> dict[str, pd.Series]:
+def _resolve_location_series(
+    columns: ColumnResolver,
+    fields: Sequence[str] = ("province", "district", "latitude", "longitude"),
+) -> dict[str, pd.Series]:
+    candidates = {
+        "province": PROVINCE_CANDIDATES,
+        "district": DISTRICT_CANDIDATES,
+        "latitude": LATITUDE_CANDIDATES,
+        "longitude": LONGITUDE_CANDIDATES,
+    }
     return {
-        "province": _get_column(filtered, PROVINCE_CANDIDATES),
-        "district": _get_column(filtered, DISTRICT_CANDIDATES),
-        "latitude": _to_numeric_clean(_get_column(filtered, LATITUDE_CANDIDATES)),
-        "longitude": _to_numeric_clean(_get_column(filtered, LONGITUDE_CANDIDATES)),
+        name: (
+            columns.numeric(candidates[name], name)
+            if name in NUMERIC_FIELDS
+            else columns.get(candidates[name], name)
+        )
+        for name in fields
     }
 
 
@@ -627,31 +1819,57 @@ def _finalize_schema(
     return standardized
 
 
-def _generate_deterministic_ids(
-    standardized: pd.DataFrame,
-    source_file: str,
-    country_series: pd.Series,
+def _category_order(values: Iterable[str], column: str) -> list[str]:
+    observed = sorted(set(values))
+    if column != "finance_type":
+        return observed
+    leading = [value for value in FINANCE_TYPE_CATEGORIES if value in observed]
+    return leading + [value for value in observed if value not in FINANCE_TYPE_CATEGORIES]
+
+
+def encode_categorical(series: pd.Series, column: str) -> pd.Series:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        clean = categories.map(lambda value: isinstance(value, str) and value == value.strip() and value != "")
+        if clean.all():
+            ordered = _category_order(categories, column)
+            if list(categories) == ordered:
+                return series
+            return series.cat.reorder_categories(ordered)
+
+    values = series.astype("string").str.strip().replace({"": pd.NA})
+    return values.astype(pd.CategoricalDtype(_category_order(values.dropna(), column)))
+
+
+def encode_categoricals(frame: pd.DataFrame) -> pd.DataFrame:
+    encoded = frame.copy()
+    for column in CATEGORICAL_FIELDS:
+        if column in encoded.columns:
+            encoded[column] = encode_categorical(encoded[column], column)
+    return encoded
+
+
+def _generate_deterministic_ids(
+    standardized: pd.DataFrame,
+    source_file: str,
+    country_series: pd.Series,
 ) -> pd.DataFrame:
     frame = standardized.copy()
     missing_id = frame["project_id"].isna() | frame["project_id"].astype("string").str.strip().eq("")
     if not missing_id.any():
         return frame
 
-    names = frame["project_name"].astype("string").fillna("")
-    years = frame["year"].astype("string").fillna("")
-    countries = country_series.astype("string").fillna("")
+    names = frame.loc[missing_id, "project_name"].astype("string").fillna("")
+    years = frame.loc[missing_id, "year"].astype("string").fillna("")
+    countries = country_series.reindex(names.index).astype("string").fillna("")
+    payloads = f"{source_file}|" + names + "|" + years + "|" + countries
 
-    generated: list[str] = []
-    for idx in frame.index:
-        if not bool(missing_id.loc[idx]):
-            generated.append(str(frame.loc[idx, "project_id"]))
-            continue
-
-        payload = f"{source_file}|{names.loc[idx]}|{years.loc[idx]}|{countries.loc[idx]}"
-        hash_value = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
-        generated.append(f"gen_{hash_value}")
-
-    frame["project_id"] = pd.Series(generated, index=frame.index, dtype="string")
+    generated = pd.Series(pd.NA, index=frame.index, dtype="string")
+    generated.loc[~missing_id] = frame.loc[~missing_id, "project_id"].astype(str)
+    generated.loc[missing_id] = [
+        f"gen_{hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]}" for payload in payloads
+    ]
+    frame["project_id"] = generated
     return frame
 
 
@@ -660,10 +1878,12 @@ def _add_mapping_audit(
     source_file: str,
     mappings: list[tuple[str, str, str]],
     standardized: pd.DataFrame,
+    columns: ColumnResolver | None = None,
 ) -> None:
     null_rates = (standardized.isna().mean() * 100).round(2).to_dict() if not standardized.empty else {}
 
     for source_column, canonical_column, transform in mappings:
+        resolves_columns = columns is not None and not transform.startswith(("constant", "deterministic_hash"))
         audits.append(
             MappingAuditRow(
                 source_file=source_file,
@@ -671,6 +1891,8 @@ def _add_mapping_audit(
                 canonical_column=canonical_column,
                 transform=transform,
                 null_rate_pct=float(null_rates.get(canonical_column, 100.0)),
+                resolved_column=columns.describe(canonical_column) if resolves_columns else "",
+                values_cleaned=columns.values_cleaned.get(canonical_column, 0) if resolves_columns else 0,
             )
         )
 
@@ -680,110 +1902,57 @@ def _standardize_aiddata(
     source_file: str,
     warnings: list[ETLWarning],
     audits: list[MappingAuditRow],
+    date_formats: dict[str, str] | None = None,
 ) -> tuple[pd.DataFrame, int, int]:
     rows_in = len(frame)
     filtered, country_series, rows_excluded_by_country = _enforce_indonesia_filter(frame, source_file, warnings)
+    columns = ColumnResolver(filtered, date_formats)
 
     standardized = pd.DataFrame(index=filtered.index)
-    standardized["project_id"] = _get_column(filtered, ["AidData Record ID"])
-    standardized["project_name"] = _get_column(filtered, ["Title"])
+    standardized["project_id"] = columns.get(AIDDATA_COLUMNS["project_id"], "project_id")
+    standardized["project_name"] = columns.get(AIDDATA_COLUMNS["project_name"], "project_name")
     standardized["finance_type"] = "DF"
-    standardized["sector"] = _get_column(filtered, ["Sector Name"])
-    standardized["province"] = _get_column(filtered, ["Available ADM1 Level"])
-    standardized["district"] = _get_column(filtered, ["Available ADM2 Level"])
-    location_resolved = _resolve_location_series(filtered)
+    standardized["sector"] = columns.get(AIDDATA_COLUMNS["sector"], "sector")
+    standardized["province"] = columns.get(AIDDATA_COLUMNS["province"], "province")
+    standardized["district"] = columns.get(AIDDATA_COLUMNS["district"], "district")
+    location_resolved = _resolve_location_series(columns, fields=("latitude", "longitude"))
     standardized["latitude"] = _coalesce_series(
         [
-            _to_numeric_clean(
-                _get_column(filtered, ["Latitude", "Project Latitude", "Available Latitude", "Lat"])
-            ),
+            columns.numeric(AIDDATA_COLUMNS["latitude"], "latitude"),
             location_resolved["latitude"],
         ],
         index=filtered.index,
     )
     standardized["longitude"] = _coalesce_series(
         [
-            _to_numeric_clean(
-                _get_column(
-                    filtered,
-                    ["Longitude", "Project Longitude", "Available Longitude", "Lon", "Lng"],
-                )
-            ),
+            columns.numeric(AIDDATA_COLUMNS["longitude"], "longitude"),
             location_resolved["longitude"],
         ],
         index=filtered.index,
     )
-    standardized["status"] = _get_column(filtered, ["Status"])
-    standardized["approval_date"] = _parse_dates(
-        _get_column(
-            filtered,
-            [
-                "Commitment Date",
-                "Commitment Date (MM/DD/YYYY)",
-                "Original Commitment Date",
-                "Date of Commitment",
-            ],
-        )
-    )
+    standardized["status"] = columns.get(AIDDATA_COLUMNS["status"], "status")
+    standardized["approval_date"] = columns.dates(AIDDATA_COLUMNS["approval_date"], "approval_date")
 
-    actual_start = _parse_dates(
-        _get_column(
-            filtered,
-            [
-                "Actual Implementation Start Date",
-                "Implementation Start Date",
-                "Actual Construction Start Date",
-                "Construction Start Date",
-            ],
-        )
-    )
-    planned_start = _parse_dates(
-        _get_column(
-            filtered,
-            [
-                "Planned Implementation Start Date",
-                "Planned Construction Start Date",
-                "Planned Start Date",
-                "Expected Start Date",
-            ],
-        )
-    )
+    actual_start = columns.dates(AIDDATA_COLUMNS["actual_start"], "construction_start_date")
+    planned_start = columns.dates(AIDDATA_COLUMNS["planned_start"], "construction_start_date")
     standardized["construction_start_date"] = actual_start.combine_first(planned_start)
-    standardized["financial_close_date"] = _parse_dates(
-        _get_column(filtered, ["Financial Close Date", "Loan Signing Date"])
-    )
-    actual_completion = _parse_dates(
-        _get_column(
-            filtered,
-            [
-                "Actual Completion Date",
-                "Actual Project Completion Date",
-            ],
-        )
-    )
-    planned_completion = _parse_dates(
-        _get_column(
-            filtered,
-            [
-                "Planned Completion Date",
-                "Expected Completion Date",
-            ],
-        )
+    standardized["financial_close_date"] = columns.dates(
+        AIDDATA_COLUMNS["financial_close_date"], "financial_close_date"
     )
+    actual_completion = columns.dates(AIDDATA_COLUMNS["actual_completion"], "operation_date")
+    planned_completion = columns.dates(AIDDATA_COLUMNS["planned_completion"], "operation_date")
     standardized["operation_date"] = actual_completion.combine_first(planned_completion)
 
     committed = _coalesce_series(
         [
-            _to_numeric_clean(_get_column(filtered, ["Adjusted Amount (Nominal USD)"])),
-            _to_numeric_clean(_get_column(filtered, ["Amount (Nominal USD)"])),
+            columns.numeric(AIDDATA_COLUMNS["adjusted_amount"], "committed_usd"),
+            columns.numeric(AIDDATA_COLUMNS["amount"], "committed_usd"),
         ],
         index=filtered.index,
     )
     standardized["committed_usd"] = committed
-    standardized["disbursed_usd"] = _to_numeric_clean(
-        _get_column(filtered, ["Disbursed Amount (Nominal USD)", "Disbursement Amount (Nominal USD)"])
-    )
-    standardized["year"] = _to_numeric_clean(_get_column(filtered, ["Commitment Year"]))
+    standardized["disbursed_usd"] = columns.numeric(AIDDATA_COLUMNS["disbursed_usd"], "disbursed_usd")
+    standardized["year"] = columns.numeric(AIDDATA_COLUMNS["year"], "year")
 
     standardized = _finalize_schema(standardized, source_file, warnings)
     standardized = _generate_deterministic_ids(standardized, source_file, country_series)
@@ -835,7 +2004,7 @@ def _standardize_aiddata(
             "deterministic_hash_if_missing",
         ),
     ]
-    _add_mapping_audit(audits, source_file, mapping_rows, standardized)
+    _add_mapping_audit(audits, source_file, mapping_rows, standardized, columns)
 
     rows_loaded = len(standardized)
     return standardized.reset_index(drop=True), rows_in, rows_excluded_by_country + max(rows_in - rows_loaded - rows_excluded_by_country, 0)
@@ -849,19 +2018,20 @@ def _standardize_cgit_tracker(
 ) -> tuple[pd.DataFrame, int, int]:
     rows_in = len(frame)
     filtered, country_series, rows_excluded_by_country = _enforce_indonesia_filter(frame, source_file, warnings)
-    location_resolved = _resolve_location_series(filtered)
+    columns = ColumnResolver(filtered)
+    location_resolved = _resolve_location_series(columns)
 
     standardized = pd.DataFrame(index=filtered.index)
     standardized["project_id"] = pd.NA
     standardized["project_name"] = _coalesce_series(
         [
-            _get_column(filtered, ["Transaction Party"]),
-            _get_column(filtered, ["Investor/Contractor", "Investor", "Investor or Builder"]),
+            columns.get(CGIT_TRACKER_COLUMNS["transaction_party"], "project_name"),
+            columns.get(CGIT_TRACKER_COLUMNS["investor"], "project_name"),
         ],
         index=filtered.index,
     )
     standardized["finance_type"] = "FDI"
-    standardized["sector"] = _get_column(filtered, ["Sector"])
+    standardized["sector"] = columns.get(CGIT_TRACKER_COLUMNS["sector"], "sector")
     standardized["province"] = location_resolved["province"]
     standardized["district"] = location_resolved["district"]
     standardized["latitude"] = location_resolved["latitude"]
@@ -871,9 +2041,11 @@ def _standardize_cgit_tracker(
     standardized["construction_start_date"] = pd.NA
     standardized["financial_close_date"] = pd.NA
     standardized["operation_date"] = pd.NA
-    standardized["committed_usd"] = _to_numeric_clean(_get_column(filtered, ["Quantity in Millions"]), multiplier=1_000_000)
+    standardized["committed_usd"] = columns.numeric(
+        CGIT_TRACKER_COLUMNS["quantity_musd"], "committed_usd", multiplier=1_000_000
+    )
     standardized["disbursed_usd"] = pd.NA
-    standardized["year"] = _to_numeric_clean(_get_column(filtered, ["Year"]))
+    standardized["year"] = columns.numeric(CGIT_TRACKER_COLUMNS["year"], "year")
 
     standardized = _finalize_schema(standardized, source_file, warnings)
     standardized = _generate_deterministic_ids(standardized, source_file, country_series)
@@ -894,7 +2066,7 @@ def _standardize_cgit_tracker(
         ("Quantity in Millions", "committed_usd", "numeric * 1_000_000"),
         ("Year", "year", "numeric"),
     ]
-    _add_mapping_audit(audits, source_file, mapping_rows, standardized)
+    _add_mapping_audit(audits, source_file, mapping_rows, standardized, columns)
 
     rows_loaded = len(standardized)
     return standardized.reset_index(drop=True), rows_in, rows_excluded_by_country + max(rows_in - rows_loaded - rows_excluded_by_country, 0)
@@ -908,31 +2080,34 @@ def _standardize_cgit_indonesia(
 ) -> tuple[pd.DataFrame, int, int]:
     rows_in = len(frame)
     filtered, country_series, rows_excluded_by_country = _enforce_indonesia_filter(frame, source_file, warnings)
-    location_resolved = _resolve_location_series(filtered)
+    columns = ColumnResolver(filtered)
+    location_resolved = _resolve_location_series(columns)
 
     standardized = pd.DataFrame(index=filtered.index)
     standardized["project_id"] = pd.NA
-    standardized["project_name"] = _get_column(filtered, ["Investor or Builder", "Investor"])
+    standardized["project_name"] = columns.get(CGIT_INDONESIA_COLUMNS["project_name"], "project_name")
     standardized["finance_type"] = "FDI"
-    standardized["sector"] = _get_column(filtered, ["Sector"])
+    standardized["sector"] = columns.get(CGIT_INDONESIA_COLUMNS["sector"], "sector")
     standardized["province"] = location_resolved["province"]
     standardized["district"] = location_resolved["district"]
     standardized["latitude"] = location_resolved["latitude"]
     standardized["longitude"] = location_resolved["longitude"]
-    standardized["status"] = _get_column(filtered, ["Status"])
+    standardized["status"] = columns.get(CGIT_INDONESIA_COLUMNS["status"], "status")
     standardized["approval_date"] = pd.NA
     standardized["construction_start_date"] = pd.NA
     standardized["financial_close_date"] = pd.NA
     standardized["operation_date"] = pd.NA
     standardized["committed_usd"] = _coalesce_series(
         [
-            _to_numeric_clean(_get_column(filtered, ["Amount_musd"]), multiplier=1_000_000),
-            _to_numeric_clean(_get_column(filtered, ["Amount"])),
+            columns.numeric(
+                CGIT_INDONESIA_COLUMNS["amount_musd"], "committed_usd", multiplier=1_000_000
+            ),
+            columns.numeric(CGIT_INDONESIA_COLUMNS["amount"], "committed_usd"),
         ],
         index=filtered.index,
     )
     standardized["disbursed_usd"] = pd.NA
-    standardized["year"] = _to_numeric_clean(_get_column(filtered, ["Year"]))
+    standardized["year"] = columns.numeric(CGIT_INDONESIA_COLUMNS["year"], "year")
 
     standardized = _finalize_schema(standardized, source_file, warnings)
     standardized = _generate_deterministic_ids(standardized, source_file, country_series)
@@ -950,7 +2125,7 @@ def _standardize_cgit_indonesia(
         ("Amount_musd | Amount", "committed_usd", "coalesce_numeric_with_scaling"),
         ("Year", "year", "numeric"),
     ]
-    _add_mapping_audit(audits, source_file, mapping_rows, standardized)
+    _add_mapping_audit(audits, source_file, mapping_rows, standardized, columns)
 
     rows_loaded = len(standardized)
     return standardized.reset_index(drop=True), rows_in, rows_excluded_by_country + max(rows_in - rows_loaded - rows_excluded_by_country, 0)
@@ -961,32 +2136,32 @@ def _optional_enrichment_frame(
     source_file: str,
     warnings: list[ETLWarning],
     audits: list[MappingAuditRow],
+    date_formats: dict[str, str] | None = None,
 ) -> tuple[pd.DataFrame, int, int]:
     rows_in = len(frame)
     filtered, country_series, rows_excluded_by_country = _enforce_indonesia_filter(frame, source_file, warnings)
+    columns = ColumnResolver(filtered, date_formats)
 
     enrich = pd.DataFrame(index=filtered.index)
-    enrich["project_id"] = _get_column(filtered, ["AidData Record ID", "project_id"])
-    enrich["project_name"] = _get_column(filtered, ["Title", "Project Name", "project_name"])
-    enrich["sector"] = _get_column(filtered, ["Sector Name", "Sector"])
-    enrich["province"] = _get_column(filtered, ["Available ADM1 Level", "Province"])
-    enrich["district"] = _get_column(filtered, ["Available ADM2 Level", "District"])
-    enrich["latitude"] = _to_numeric_clean(_get_column(filtered, ["Latitude"]))
-    enrich["longitude"] = _to_numeric_clean(_get_column(filtered, ["Longitude"]))
-    enrich["status"] = _get_column(filtered, ["Status"])
-    enrich["approval_date"] = _parse_dates(_get_column(filtered, ["Commitment Date"]))
-    enrich["construction_start_date"] = _parse_dates(_get_column(filtered, ["Implementation Start Date"]))
-    enrich["financial_close_date"] = _parse_dates(_get_column(filtered, ["Financial Close Date"]))
-    enrich["operation_date"] = _parse_dates(_get_column(filtered, ["Actual Completion Date"]))
+    enrich["project_id"] = columns.get(ENRICHMENT_COLUMNS["project_id"], "project_id")
+    enrich["project_name"] = columns.get(ENRICHMENT_COLUMNS["project_name"], "project_name")
+    enrich["sector"] = columns.get(ENRICHMENT_COLUMNS["sector"], "sector")
+    enrich["province"] = columns.get(ENRICHMENT_COLUMNS["province"], "province")
+    enrich["district"] = columns.get(ENRICHMENT_COLUMNS["district"], "district")
+    enrich["latitude"] = columns.numeric(ENRICHMENT_COLUMNS["latitude"], "latitude")
+    enrich["longitude"] = columns.numeric(ENRICHMENT_COLUMNS["longitude"], "longitude")
+    enrich["status"] = columns.get(ENRICHMENT_COLUMNS["status"], "status")
+    for name in DATE_FIELDS:
+        enrich[name] = columns.dates(ENRICHMENT_COLUMNS[name], name)
     enrich["committed_usd"] = _coalesce_series(
         [
-            _to_numeric_clean(_get_column(filtered, ["Adjusted Amount (Nominal USD)"])),
-            _to_numeric_clean(_get_column(filtered, ["Amount (Nominal USD)"])),
+            columns.numeric(ENRICHMENT_COLUMNS["adjusted_amount"], "committed_usd"),
+            columns.numeric(ENRICHMENT_COLUMNS["amount"], "committed_usd"),
         ],
         index=filtered.index,
     )
-    enrich["disbursed_usd"] = _to_numeric_clean(_get_column(filtered, ["Disbursed Amount (Nominal USD)"]))
-    enrich["year"] = _to_numeric_clean(_get_column(filtered, ["Commitment Year", "Year"]))
+    enrich["disbursed_usd"] = columns.numeric(ENRICHMENT_COLUMNS["disbursed_usd"], "disbursed_usd")
+    enrich["year"] = columns.numeric(ENRICHMENT_COLUMNS["year"], "year")
 
     enrich = _finalize_schema(enrich.assign(finance_type="DF"), source_file, warnings)
     enrich = _generate_deterministic_ids(enrich, source_file, country_series)
@@ -1013,20 +2188,35 @@ def _optional_enrichment_frame(
         ("Disbursed Amount (Nominal USD)", "disbursed_usd", "numeric"),
         ("Commitment Year | Year", "year", "coalesce_numeric"),
     ]
-    _add_mapping_audit(audits, source_file, mapping_rows, enrich.assign(finance_type="DF"))
+    _add_mapping_audit(audits, source_file, mapping_rows, enrich.assign(finance_type="DF"), columns)
 
     rows_loaded = len(enrich)
     return enrich.reset_index(drop=True), rows_in, rows_excluded_by_country + max(rows_in - rows_loaded - rows_excluded_by_country, 0)
 
 
 def _normalize_name_for_key(series: pd.Series) -> pd.Series:
-    return (
-        series.astype("string")
+    # Names repeat across rows, so run the regex cleanup once per distinct value.
+    codes, uniques = pd.factorize(series.astype("string"))
+    normalized = (
+        pd.Series(uniques, dtype="string")
         .str.lower()
         .str.replace(r"\s+", " ", regex=True)
         .str.replace(r"[^a-z0-9 ]+", "", regex=True)
         .str.strip()
     )
+    return pd.Series(normalized.array.take(codes, allow_fill=True), index=series.index, dtype="string")
+
+
+def _fill_from_lookup(enriched: pd.DataFrame, keys: pd.Series, lookup: pd.DataFrame) -> pd.Series:
+    touched = pd.Series(False, index=enriched.index)
+    positions = lookup.index.get_indexer(keys.array)
+    for column in ENRICHMENT_FILL_FIELDS:
+        candidates = pd.Series(lookup[column].array.take(positions, allow_fill=True), index=enriched.index)
+        fill = enriched[column].isna() & candidates.notna()
+        if fill.any():
+            enriched[column] = enriched[column].mask(fill, candidates)
+            touched |= fill
+    return touched
 
 
 def _apply_optional_enrichment(projects: pd.DataFrame, enrich: pd.DataFrame) -> tuple[pd.DataFrame, int]:
@@ -1034,56 +2224,230 @@ def _apply_optional_enrichment(projects: pd.DataFrame, enrich: pd.DataFrame) ->
         return projects, 0
 
     enriched = projects.copy()
-    fill_fields = [
-        "sector",
-        "province",
-        "district",
-        "latitude",
-        "longitude",
-        "status",
-        "approval_date",
-        "construction_start_date",
-        "financial_close_date",
-        "operation_date",
-        "committed_usd",
-        "disbursed_usd",
-        "year",
-    ]
-
-    rows_touched = pd.Series([False] * len(enriched), index=enriched.index)
+    rows_touched = pd.Series(False, index=enriched.index)
 
     enrich_by_id = enrich.dropna(subset=["project_id"]).drop_duplicates(subset=["project_id"], keep="first")
     if not enrich_by_id.empty:
-        id_lookup = enrich_by_id.set_index("project_id")
-        for idx, project_id in enriched["project_id"].items():
-            if pd.isna(project_id) or project_id not in id_lookup.index:
-                continue
-            updates = 0
-            for field in fill_fields:
-                if pd.isna(enriched.at[idx, field]) and pd.notna(id_lookup.at[project_id, field]):
-                    enriched.at[idx, field] = id_lookup.at[project_id, field]
-                    updates += 1
-            if updates > 0:
-                rows_touched.at[idx] = True
+        rows_touched |= _fill_from_lookup(enriched, enriched["project_id"], enrich_by_id.set_index("project_id"))
 
+    # The name|year key is built after the ID join so years it filled take part in the match.
     left_key = _normalize_name_for_key(enriched["project_name"]) + "|" + enriched["year"].astype("string")
     right_key = _normalize_name_for_key(enrich["project_name"]) + "|" + enrich["year"].astype("string")
     enrich_by_name_year = enrich.assign(_key=right_key).dropna(subset=["_key"]).drop_duplicates("_key", keep="first")
-    key_lookup = enrich_by_name_year.set_index("_key") if not enrich_by_name_year.empty else pd.DataFrame()
+    if not enrich_by_name_year.empty:
+        rows_touched |= _fill_from_lookup(enriched, left_key, enrich_by_name_year.set_index("_key"))
 
-    if not key_lookup.empty:
-        for idx, key in left_key.items():
-            if pd.isna(key) or key not in key_lookup.index:
+    return enriched, int(rows_touched.sum())
+
+
+def _dedupe_candidates(projects: pd.DataFrame, sources: pd.Series) -> pd.DataFrame:
+    amount = pd.to_numeric(projects["committed_usd"], errors="coerce").astype("float64")
+    candidates = pd.DataFrame(
+        {
+            "row": np.arange(len(projects)),
+            "source": sources.astype("string").to_numpy(),
+            "finance_type": projects["finance_type"].astype("string").to_numpy(),
+            "year": projects["year"].astype("Int64").to_numpy(),
+            "sector": projects["sector"].astype("string").str.strip().str.lower().to_numpy(),
+            "name": _normalize_name_for_key(projects["project_name"]).to_numpy(),
+            "amount": amount.to_numpy(),
+        }
+    )
+    blockable = (
+        candidates[["source", "finance_type", "year", "sector", "name"]].notna().all(axis=1)
+        & candidates["name"].ne("")
+        & candidates["amount"].gt(0)
+    )
+    candidates = candidates.loc[blockable.fillna(False)].copy()
+    candidates["bucket"] = np.floor(
+        np.log10(candidates["amount"]) * DEDUPE_AMOUNT_BUCKETS_PER_DECADE
+    ).astype("int64")
+    return candidates
+
+
+def _dedupe_block_sizes(candidates: pd.DataFrame) -> np.ndarray:
+    # Rows each candidate is compared against: its own bucket and the buckets either side.
+    bucket_sizes = candidates.groupby(DEDUPE_BLOCK_KEYS)["row"].size()
+    sizes = np.zeros(len(candidates), dtype="int64")
+    for offset in (-1, 0, 1):
+        neighbour = pd.MultiIndex.from_arrays(
+            [candidates[key] for key in DEDUPE_BLOCK_KEYS[:-1]] + [candidates["bucket"] + offset]
+        )
+        sizes += bucket_sizes.reindex(neighbour, fill_value=0).to_numpy()
+    return sizes
+
+
+def _dedupe_candidate_pairs(candidates: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    # Streams each finance type + year + sector block: a row is checked against the later rows
+    # of its bucket and every row of the next bucket up (amounts either side of a bucket edge)
+    # with vectorized source, amount and name-length filters, so only pairs that reach the
+    # review threshold are ever kept. Returns those pairs and the amount-matched pair count.
+    records: list[tuple[Any, ...]] = []
+    amount_matched = 0
+    ordered = candidates.sort_values(["bucket", "row"], kind="stable")
+    for (finance_type, year, sector), block in ordered.groupby(
+        DEDUPE_BLOCK_KEYS[:-1], sort=False
+    ):
+        rows = block["row"].to_numpy()
+        buckets = block["bucket"].to_numpy()
+        sources = block["source"].to_numpy()
+        amounts = block["amount"].to_numpy()
+        names = block["name"].tolist()
+        lengths = np.fromiter((len(name) for name in names), dtype="int64", count=len(names))
+        window_ends = np.searchsorted(buckets, buckets + 1, side="right")
+
+        for index in range(len(block)):
+            start, end = index + 1, int(window_ends[index])
+            if start >= end:
                 continue
-            updates = 0
-            for field in fill_fields:
-                if pd.isna(enriched.at[idx, field]) and pd.notna(key_lookup.at[key, field]):
-                    enriched.at[idx, field] = key_lookup.at[key, field]
-                    updates += 1
-            if updates > 0:
-                rows_touched.at[idx] = True
+            amount_ratio = np.round(
+                np.minimum(amounts[index], amounts[start:end])
+                / np.maximum(amounts[index], amounts[start:end]),
+                4,
+            )
+            matched = (sources[start:end] != sources[index]) & (
+                amount_ratio >= 1 - DEDUPE_AMOUNT_TOLERANCE
+            )
+            amount_matched += int(matched.sum())
+            # 2 * shorter / (sum of lengths) bounds SequenceMatcher.ratio, so clearly
+            # different names are discarded before the per-pair comparison.
+            length_bound = (
+                2 * np.minimum(lengths[index], lengths[start:end]) / (lengths[index] + lengths[start:end])
+            )
+            for offset in np.flatnonzero(matched & (length_bound >= DEDUPE_REVIEW_SIMILARITY)):
+                other = start + int(offset)
+                left, right = (index, other) if rows[index] < rows[other] else (other, index)
+                similarity = round(SequenceMatcher(None, names[left], names[right]).ratio(), 4)
+                if similarity < DEDUPE_REVIEW_SIMILARITY:
+                    continue
+                records.append(
+                    (
+                        int(rows[left]),
+                        int(rows[right]),
+                        sources[left],
+                        sources[right],
+                        finance_type,
+                        year,
+                        sector,
+                        int(buckets[index]),
+                        float(amount_ratio[offset]),
+                        similarity,
+                    )
+                )
+
+    pairs = pd.DataFrame.from_records(
+        records,
+        columns=[
+            "row_left",
+            "row_right",
+            "source_left",
+            "source_right",
+            "finance_type",
+            "year",
+            "sector",
+            "bucket",
+            "amount_ratio",
+            "name_similarity",
+        ],
+    )
+    return pairs, amount_matched
 
-    return enriched, int(rows_touched.sum())
+
+def link_cross_source_duplicates(
+    projects: pd.DataFrame,
+    sources: pd.Series,
+    warnings: list[ETLWarning],
+) -> tuple[pd.DataFrame, list[DuplicateMatch], dict[str, int]]:
+    stats = {
+        "rows_compared": 0,
+        "rows_unblocked": int(len(projects)),
+        "candidate_pairs": 0,
+        "review_pairs": 0,
+        "fuzzy_duplicates_merged": 0,
+    }
+    if projects.empty:
+        return projects, [], stats
+
+    candidates = _dedupe_candidates(projects, sources)
+    oversized = _dedupe_block_sizes(candidates) > DEDUPE_MAX_BLOCK_SIZE
+    if oversized.any():
+        warnings.append(
+            ETLWarning(
+                source_file="canonical_dataset",
+                warning_type="dedupe_block_too_large",
+                message=(
+                    f"{int(oversized.sum())} rows sit in blocks larger than {DEDUPE_MAX_BLOCK_SIZE} "
+                    "and were not compared for cross-source duplicates."
+                ),
+            )
+        )
+        candidates = candidates.loc[~oversized]
+
+    stats["rows_compared"] = int(len(candidates))
+    stats["rows_unblocked"] = int(len(projects) - len(candidates))
+    if candidates.empty:
+        return projects, [], stats
+
+    pairs, stats["candidate_pairs"] = _dedupe_candidate_pairs(candidates)
+    if pairs.empty:
+        return projects, [], stats
+
+    pairs = pairs.sort_values(
+        ["row_right", "name_similarity", "row_left"], ascending=[True, False, True]
+    )
+
+    # Earlier rows win (sources are concatenated in PRIMARY_SOURCES order). A later row is
+    # merged into its most similar earlier row that has not itself been merged away.
+    project_ids = projects["project_id"].astype("string").fillna("")
+    names = projects["project_name"].astype("string").fillna("")
+    dropped: dict[int, int] = {}
+    matches: list[DuplicateMatch] = []
+    for pair in pairs.itertuples(index=False):
+        left, right = int(pair.row_left), int(pair.row_right)
+        if pair.name_similarity < DEDUPE_NAME_SIMILARITY:
+            decision = "review"
+        elif right in dropped or left in dropped:
+            decision = "superseded"
+        else:
+            decision = "merged"
+            dropped[right] = left
+        matches.append(
+            DuplicateMatch(
+                kept_project_id=str(project_ids.iloc[left]),
+                dropped_project_id=str(project_ids.iloc[right]),
+                kept_source=str(pair.source_left),
+                dropped_source=str(pair.source_right),
+                kept_name=str(names.iloc[left]),
+                dropped_name=str(names.iloc[right]),
+                block=f"{pair.finance_type}|{pair.year}|{pair.sector}|{pair.bucket}",
+                name_similarity=float(pair.name_similarity),
+                amount_ratio=float(pair.amount_ratio),
+                decision=decision,
+            )
+        )
+
+    stats["review_pairs"] = sum(match.decision == "review" for match in matches)
+    stats["fuzzy_duplicates_merged"] = len(dropped)
+    if not dropped:
+        return projects, matches, stats
+
+    # The kept row takes over values only the dropped duplicate had (e.g. status).
+    linked = projects.copy()
+    kept_labels = projects.index[list(dropped.values())]
+    dropped_labels = projects.index[list(dropped)]
+    filler = projects.loc[dropped_labels].set_axis(kept_labels)
+    filler = filler.loc[~filler.index.duplicated(keep="first")]
+    for column in CANONICAL_FIELDS:
+        if column != "project_id":
+            linked[column] = linked[column].fillna(filler[column])
+    return linked.drop(index=dropped_labels), matches, stats
+
+
+def _dedupe_audit_frame(matches: list[DuplicateMatch]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [asdict(match) for match in matches],
+        columns=[item.name for item in fields(DuplicateMatch)],
+    )
 
 
 def _build_quality_report(
@@ -1091,6 +2455,8 @@ def _build_quality_report(
     raw_files: list[Path],
     warnings: list[ETLWarning],
     source_loads: list[SourceLoadStat],
+    source_reuse: dict[str, Any] | None = None,
+    deduplication: dict[str, int] | None = None,
 ) -> dict[str, Any]:
     missing_pct = (
         {column: 100.0 for column in CANONICAL_FIELDS}
@@ -1098,7 +2464,7 @@ def _build_quality_report(
         else (projects.isna().mean() * 100).round(2).to_dict()
     )
 
-    return {
+    report: dict[str, Any] = {
         "generated_at_utc": pd.Timestamp.now(tz="UTC").isoformat(),
         "raw_file_count": len(raw_files),
         "row_count": int(len(projects)),
@@ -1107,22 +2473,277 @@ def _build_quality_report(
         "source_loads": [asdict(item) for item in source_loads],
         "missing_pct": missing_pct,
     }
+    if source_reuse is not None:
+        report["source_reuse"] = source_reuse
+    if deduplication is not None:
+        report["deduplication"] = deduplication
+    return report
 
 
-def _write_outputs(projects: pd.DataFrame, quality_report: dict[str, Any], out_dir: Path) -> None:
-    out_dir.mkdir(parents=True, exist_ok=True)
+def _checksum_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    columns: dict[str, pd.Series] = {}
+    for column in CANONICAL_FIELDS:
+        values = frame[column].reset_index(drop=True)
+        if column in DATE_FIELDS:
+            columns[column] = pd.to_datetime(values, errors="coerce").astype("datetime64[ns]")
+        elif column in NUMERIC_FIELDS:
+            columns[column] = pd.to_numeric(values, errors="coerce").astype("Float64")
+        elif column == "year":
+            columns[column] = pd.to_numeric(values, errors="coerce").astype("Int64")
+        else:
+            columns[column] = values.astype("string").replace({"": pd.NA})
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(frame)))
+
 
-    csv_path = out_dir / "projects_canonical.csv"
-    projects.to_csv(csv_path, index=False)
+def frame_checksum(frame: pd.DataFrame) -> str:
+    hashed = pd.util.hash_pandas_object(_checksum_frame(frame), index=False)
+    return hashlib.sha256(hashed.to_numpy().tobytes()).hexdigest()
 
-    quality_path = out_dir / "data_quality.json"
-    quality_path.write_text(json.dumps(quality_report, indent=2), encoding="utf-8")
+
+def _write_csv_output(projects: pd.DataFrame, path: Path) -> pd.DataFrame:
+    projects.to_csv(path, index=False)
+    # Numeric columns are left to the C parser so round_trip reproduces the written floats.
+    return pd.read_csv(
+        path,
+        dtype={column: str for column in STRING_FIELDS + DATE_FIELDS},
+        keep_default_na=False,
+        na_values=[""],
+        float_precision="round_trip",
+    )
+
+
+def _with_typed_empty_categories(projects: pd.DataFrame) -> pd.DataFrame:
+    # Arrow stores empty object categories as a null dictionary, which reads back as a plain
+    # object column; typing them as strings keeps the category dtype through the round trip.
+    return projects.astype(
+        {
+            column: pd.CategoricalDtype(pd.Index([], dtype="string"))
+            for column in CATEGORICAL_FIELDS
+            if isinstance(projects[column].dtype, pd.CategoricalDtype)
+            and projects[column].cat.categories.empty
+        }
+    )
+
+
+def _write_parquet_output(projects: pd.DataFrame, path: Path) -> pd.DataFrame:
+    projects = _with_typed_empty_categories(projects)
+    projects.to_parquet(
+        path,
+        engine="pyarrow",
+        index=False,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+        write_statistics=True,
+    )
+    return pd.read_parquet(path, engine="pyarrow")
+
+
+def _write_arrow_output(projects: pd.DataFrame, path: Path) -> pd.DataFrame:
+    # Uncompressed Feather v2 (Arrow IPC file), so reading it skips decompression.
+    _with_typed_empty_categories(projects).to_feather(path, compression="uncompressed")
+    return pd.read_feather(path)
+
+
+def _write_duckdb_output(projects: pd.DataFrame, path: Path) -> pd.DataFrame:
+    if duckdb is None:
+        raise ImportError("duckdb is not installed")
+
+    # DuckDB cannot build (or index) an ENUM without values, so empty categoricals stay VARCHAR.
+    frame = projects.astype(
+        {
+            column: "string"
+            for column in CATEGORICAL_FIELDS
+            if isinstance(projects[column].dtype, pd.CategoricalDtype)
+            and projects[column].cat.categories.empty
+        }
+    )
+    path.unlink(missing_ok=True)
+    connection = duckdb.connect(str(path))
+    try:
+        connection.register("projects_frame", frame)
+        connection.execute("CREATE TABLE projects AS SELECT * FROM projects_frame")
+        connection.unregister("projects_frame")
+        for column in DUCKDB_INDEX_FIELDS:
+            connection.execute(f"CREATE INDEX idx_projects_{column} ON projects ({column})")
+        connection.execute("CHECKPOINT")
+        return connection.execute("SELECT * FROM projects").df()
+    finally:
+        connection.close()
+
+
+def read_publish_pointer(out_dir: Path) -> dict[str, Any] | None:
+    pointer_path = out_dir / PUBLISH_POINTER
+    try:
+        pointer = json.loads(pointer_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable publish pointer %s: %s", pointer_path, exc)
+        return None
+
+    version = str(pointer.get("version") or "")
+    if not version or not (out_dir / PUBLISH_VERSIONS_DIR / version).is_dir():
+        logger.warning("Publish pointer %s names a missing version %r", pointer_path, version)
+        return None
+    return pointer
+
+
+def resolve_processed_dir(out_dir: Path) -> Path:
+    pointer = read_publish_pointer(out_dir)
+    if pointer is None:
+        return out_dir
+    return out_dir / PUBLISH_VERSIONS_DIR / str(pointer["version"])
+
+
+def _swap_publish_pointer(out_dir: Path, pointer: dict[str, Any]) -> None:
+    tmp_path = out_dir / f".{PUBLISH_POINTER}.tmp"
+    tmp_path.write_text(json.dumps(pointer, indent=2), encoding="utf-8")
+    os.replace(tmp_path, out_dir / PUBLISH_POINTER)
+
+
+def _version_published_at(version: str) -> pd.Timestamp | None:
+    try:
+        return pd.to_datetime(version.split("-", 1)[0], format="%Y%m%dT%H%M%S%fZ", utc=True)
+    except ValueError:
+        return None
+
+
+def _prune_versions(
+    versions_dir: Path,
+    keep_versions: int,
+    current: str,
+    grace_seconds: float = PUBLISH_PRUNE_GRACE_SECONDS,
+    now: pd.Timestamp | None = None,
+) -> None:
+    published = sorted(
+        item.name for item in versions_dir.iterdir() if item.is_dir() and not item.name.startswith(".")
+    )
+    now = now if now is not None else pd.Timestamp.now(tz="UTC")
+    excess = max(0, len(published) - keep_versions)
+    for version, successor in zip(published[:excess], published[1 : excess + 1], strict=True):
+        if version == current:
+            continue
+        superseded_at = _version_published_at(successor)
+        if superseded_at is None or (now - superseded_at).total_seconds() < grace_seconds:
+            continue
+        shutil.rmtree(versions_dir / version, ignore_errors=True)
+        logger.info("Removed old processed version %s", version)
+
+
+def _publish_top_level_outputs(
+    out_dir: Path,
+    version_dir: Path,
+    quality_report: dict[str, Any],
+) -> None:
+    # Refresh the files a checkout without current.json (e.g. a deployment serving the
+    # committed data) falls back to; each is replaced atomically.
+    written = quality_report["outputs"]["files"]
+    files = [name for name in PUBLISH_TOP_LEVEL_OUTPUTS if name in written]
+    for name in PUBLISH_TOP_LEVEL_OUTPUTS:
+        if name not in files:
+            # An older copy of a format this run skipped would otherwise be read first.
+            (out_dir / name).unlink(missing_ok=True)
+            continue
+        tmp_path = out_dir / f".{name}.tmp"
+        shutil.copyfile(version_dir / name, tmp_path)
+        os.replace(tmp_path, out_dir / name)
+
+    # versions/ is not committed, so the top-level report does not name a version directory.
+    outputs = {key: value for key, value in quality_report["outputs"].items() if key != "version"}
+    report = {**quality_report, "outputs": {**outputs, "files": files}}
+    tmp_path = out_dir / f".{QUALITY_OUTPUT}.tmp"
+    tmp_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    os.replace(tmp_path, out_dir / QUALITY_OUTPUT)
+
+
+def _write_outputs(
+    projects: pd.DataFrame,
+    quality_report: dict[str, Any],
+    out_dir: Path,
+    keep_versions: int = PUBLISH_KEEP_VERSIONS,
+    profiler: StageProfiler | None = None,
+    audit_tables: dict[str, pd.DataFrame] | None = None,
+) -> Path:
+    writers: list[tuple[str, Callable[[pd.DataFrame, Path], pd.DataFrame], bool]] = [
+        (CSV_OUTPUT, _write_csv_output, True),
+        (PARQUET_OUTPUT, _write_parquet_output, False),
+        (ARROW_OUTPUT, _write_arrow_output, False),
+        (DUCKDB_OUTPUT, _write_duckdb_output, False),
+    ]
+    expected_rows = len(projects)
+    expected_checksum = frame_checksum(projects)
+    published_at = pd.Timestamp.now(tz="UTC")
+    version = f"{published_at.strftime('%Y%m%dT%H%M%S%fZ')}-{expected_checksum[:8]}"
+
+    versions_dir = out_dir / PUBLISH_VERSIONS_DIR
+    staging_dir = versions_dir / f".{version}.tmp"
+    staging_dir.mkdir(parents=True)
+    profiler = profiler if profiler is not None else StageProfiler()
+    files: list[str] = []
+    try:
+        with profiler.stage("write"):
+            for name, writer, required in writers:
+                try:
+                    written = writer(projects, staging_dir / name)
+                except ImportError as exc:
+                    if required:
+                        raise
+                    logger.warning("Skipping %s output: %s", name, exc)
+                    (staging_dir / name).unlink(missing_ok=True)
+                    continue
+
+                if len(written) != expected_rows:
+                    raise ValueError(
+                        f"{name} has {len(written)} rows after writing; expected {expected_rows}."
+                    )
+                if frame_checksum(written) != expected_checksum:
+                    raise ValueError(f"{name} content checksum does not match the canonical frame.")
+                files.append(name)
+            for name, table in (audit_tables or {}).items():
+                table.to_csv(staging_dir / name, index=False)
+                files.append(name)
+
+        quality_report["timings"] = profiler.report()
+        quality_report["outputs"] = {
+            "version": version,
+            "row_count": expected_rows,
+            "checksum_sha256": expected_checksum,
+            "files": files,
+        }
+        (staging_dir / QUALITY_OUTPUT).write_text(
+            json.dumps(quality_report, indent=2), encoding="utf-8"
+        )
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    # Readers resolve the version through the pointer, so they see either the previous
+    # complete directory or this one, never a partially written file.
+    version_dir = versions_dir / version
+    os.replace(staging_dir, version_dir)
+    _swap_publish_pointer(
+        out_dir,
+        {
+            "version": version,
+            "published_at_utc": published_at.isoformat(),
+            "row_count": expected_rows,
+            "checksum_sha256": expected_checksum,
+        },
+    )
+    _publish_top_level_outputs(out_dir, version_dir, quality_report)
+    _prune_versions(
+        versions_dir,
+        max(1, keep_versions),
+        current=version,
+        grace_seconds=PUBLISH_PRUNE_GRACE_SECONDS,
+    )
+    return version_dir
 
 
 def _write_methodology(
     raw_files: list[Path],
     source_loads: list[SourceLoadStat],
     audits: list[MappingAuditRow],
+    duplicate_matches: list[DuplicateMatch] | None = None,
     output_path: Path = Path("docs/methodology.md"),
 ) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1181,19 +2802,45 @@ def _write_methodology(
         [
             "",
             "## Mapping Audit (Source Column -> Canonical Column)",
-            "| Source File | Source Column | Canonical Column | Transform | Null Rate (%) |",
-            "|---|---|---|---|---:|",
+            "| Source File | Source Column | Resolved Column | Canonical Column | Transform | Values Cleaned "
+            "| Null Rate (%) |",
+            "|---|---|---|---|---|---:|---:|",
         ]
     )
 
     if audits:
         for row in sorted(audits, key=lambda item: (item.source_file, item.canonical_column, item.source_column)):
+            resolved = f"`{row.resolved_column}`" if row.resolved_column else "_n/a_"
             lines.append(
-                f"| `{row.source_file}` | `{row.source_column}` | `{row.canonical_column}` | "
-                f"`{row.transform}` | {row.null_rate_pct:.2f} |"
+                f"| `{row.source_file}` | `{row.source_column}` | {resolved} | `{row.canonical_column}` | "
+                f"`{row.transform}` | {row.values_cleaned} | {row.null_rate_pct:.2f} |"
             )
     else:
-        lines.append("| _n/a_ | _n/a_ | _n/a_ | _n/a_ | 100.00 |")
+        lines.append("| _n/a_ | _n/a_ | _n/a_ | _n/a_ | _n/a_ | 0 | 100.00 |")
+
+    merged = [match for match in duplicate_matches or [] if match.decision == "merged"]
+    lines.extend(
+        [
+            "",
+            "## Cross-Source Duplicates",
+            f"- Merged: {len(merged)}",
+            f"- Flagged for review: {sum(match.decision == 'review' for match in duplicate_matches or [])}",
+            f"- Full decision list: `{DEDUPE_AUDIT_OUTPUT}` next to the published dataset.",
+        ]
+    )
+    if merged:
+        lines.extend(
+            [
+                "",
+                "| Kept | Dropped | Kept Source | Dropped Source | Name Similarity | Amount Ratio |",
+                "|---|---|---|---|---:|---:|",
+            ]
+        )
+        for match in merged:
+            lines.append(
+                f"| {match.kept_name} | {match.dropped_name} | `{Path(match.kept_source).name}` | "
+                f"`{Path(match.dropped_source).name}` | {match.name_similarity:.2f} | {match.amount_ratio:.2f} |"
+            )
 
     lines.extend(
         [
@@ -1203,256 +2850,463 @@ def _write_methodology(
             "- Indonesia-only filter is applied to each included source using available country/recipient/host fields.",
             "- Unknown values remain null (no-fabrication policy).",
             "- Deterministic IDs are generated only when source project ID is missing.",
+            "- Rows from different sources with the same finance type, year, sector, committed amount "
+            f"(within {DEDUPE_AMOUNT_TOLERANCE:.0%}) and a normalized-name similarity of at least "
+            f"{DEDUPE_NAME_SIMILARITY:.2f} are merged into the earlier source's row.",
         ]
     )
 
     output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def run_etl(
-    raw_dir: Path = Path("data/raw"),
-    out_dir: Path = Path("data/processed"),
-) -> tuple[pd.DataFrame, dict[str, Any]]:
-    warnings: list[ETLWarning] = []
-    source_loads: list[SourceLoadStat] = []
-    audits: list[MappingAuditRow] = []
-
-    raw_files = discover_raw_files(raw_dir)
-    if not raw_files:
-        warnings.append(
-            ETLWarning(
-                source_file=str(raw_dir),
-                warning_type="no_raw_files",
-                message="No files found in data/raw. ETL produced an empty project-level dataset.",
-            )
-        )
-
-    primary_frames: list[pd.DataFrame] = []
-    optional_enrichment: pd.DataFrame | None = None
-
-    files_by_name = {path.name: path for path in raw_files}
-
-    for source_name, finance_type in PRIMARY_SOURCES.items():
-        path = files_by_name.get(source_name)
-        if path is None:
-            warnings.append(
-                ETLWarning(
-                    source_file=str(raw_dir / source_name),
-                    warning_type="missing_primary_source",
-                    message="Required primary source file is missing.",
-                )
-            )
-            source_loads.append(
-                SourceLoadStat(
-                    source_file=str(raw_dir / source_name),
-                    role="primary",
-                    parser_used="missing",
-                    rows_in_source=0,
-                    rows_loaded=0,
-                    rows_excluded=0,
-                    note="required_primary_source_missing",
-                )
-            )
-            continue
+def _load_primary_source(
+    path: Path,
+    source_name: str,
+    finance_type: str,
+    cache: ParseCache | None,
+) -> SourceResult:
+    result = SourceResult()
+    warnings = result.warnings
+    profiler = StageProfiler(result.timings)
+    row_filter = IndonesiaRowFilter()
+    if cache is not None:
+        result.date_formats = cache.load_date_formats(path.name)
 
-        try:
+    try:
+        with profiler.stage("read", str(path)):
             if source_name == AIDDATA_FILENAME:
-                frame, parser = read_raw_file(
+                frame, parser = read_raw_file_cached(
                     path,
                     warnings,
+                    cache,
                     fixed_sheet=AIDDATA_SHEET,
                     fixed_header=AIDDATA_HEADER,
+                    columns=SOURCE_COLUMNS.get(source_name),
+                    row_filter=row_filter,
                 )
             else:
-                frame, parser = read_raw_file(path, warnings)
-        except Exception as exc:  # noqa: BLE001
-            warnings.append(
-                ETLWarning(
-                    source_file=str(path),
-                    warning_type="read_error",
-                    message=f"Failed to read source file: {exc}",
+                frame, parser = read_raw_file_cached(
+                    path,
+                    warnings,
+                    cache,
+                    columns=SOURCE_COLUMNS.get(source_name),
+                    row_filter=row_filter,
                 )
+    except Exception as exc:  # noqa: BLE001
+        warnings.append(
+            ETLWarning(
+                source_file=str(path),
+                warning_type="read_error",
+                message=f"Failed to read source file: {exc}",
             )
-            source_loads.append(
-                SourceLoadStat(
-                    source_file=str(path),
-                    role="primary",
-                    parser_used="read_error",
-                    rows_in_source=0,
-                    rows_loaded=0,
-                    rows_excluded=0,
-                    note=str(exc),
-                )
+        )
+        result.source_loads.append(
+            SourceLoadStat(
+                source_file=str(path),
+                role="primary",
+                parser_used="read_error",
+                rows_in_source=0,
+                rows_loaded=0,
+                rows_excluded=0,
+                note=str(exc),
             )
-            continue
+        )
+        return result
 
+    with profiler.stage("standardize", str(path)):
         if source_name == AIDDATA_FILENAME:
-            standardized, rows_in, rows_excluded = _standardize_aiddata(frame, str(path), warnings, audits)
+            standardized, rows_in, rows_excluded = _standardize_aiddata(
+                frame,
+                str(path),
+                warnings,
+                result.audits,
+                result.date_formats,
+            )
         elif source_name == CGIT_TRACKER_FILENAME:
             standardized, rows_in, rows_excluded = _standardize_cgit_tracker(
                 frame,
                 str(path),
                 warnings,
-                audits,
+                result.audits,
             )
         elif source_name == CGIT_INDONESIA_FILENAME:
             standardized, rows_in, rows_excluded = _standardize_cgit_indonesia(
                 frame,
                 str(path),
                 warnings,
-                audits,
+                result.audits,
             )
         else:
             standardized = pd.DataFrame(columns=CANONICAL_FIELDS)
             rows_in = len(frame)
             rows_excluded = rows_in
 
+        # Rows dropped by the reader-level Indonesia filter never reach the standardizer.
+        rows_in += row_filter.rows_dropped
+        rows_excluded += row_filter.rows_dropped
+
         standardized["finance_type"] = finance_type
         standardized = _finalize_schema(standardized, str(path), warnings)
 
-        primary_frames.append(standardized)
-        rows_loaded = len(standardized)
-        province_missing_pct, coordinate_missing_pct = _source_missingness(standardized)
+    result.frame = standardized
+    rows_loaded = len(standardized)
+    province_missing_pct, coordinate_missing_pct = _source_missingness(standardized)
 
-        logger.info(
-            "Loaded source file=%s rows=%s parser=%s role=primary",
-            source_name,
-            rows_loaded,
-            parser,
+    logger.info(
+        "Loaded source file=%s rows=%s parser=%s role=primary",
+        source_name,
+        rows_loaded,
+        parser,
+    )
+
+    result.source_loads.append(
+        SourceLoadStat(
+            source_file=str(path),
+            role="primary",
+            parser_used=parser,
+            rows_in_source=rows_in,
+            rows_loaded=rows_loaded,
+            rows_excluded=max(rows_excluded, rows_in - rows_loaded),
+            province_missing_pct=province_missing_pct,
+            coordinate_missing_pct=coordinate_missing_pct,
         )
+    )
+    return result
+
 
-        source_loads.append(
+def _load_enrichment_source(path: Path, cache: ParseCache | None) -> SourceResult:
+    result = SourceResult()
+    profiler = StageProfiler(result.timings)
+    row_filter = IndonesiaRowFilter()
+    if cache is not None:
+        result.date_formats = cache.load_date_formats(path.name)
+
+    try:
+        with profiler.stage("read", str(path)):
+            enrich_raw, parser = read_raw_file_cached(
+                path,
+                result.warnings,
+                cache,
+                columns=SOURCE_COLUMNS[ENRICHMENT_FILENAME],
+                row_filter=row_filter,
+            )
+        with profiler.stage("standardize", str(path)):
+            enrichment, rows_in, rows_excluded = _optional_enrichment_frame(
+                enrich_raw,
+                str(path),
+                result.warnings,
+                result.audits,
+                result.date_formats,
+            )
+        rows_in += row_filter.rows_dropped
+        rows_excluded += row_filter.rows_dropped
+        result.frame = enrichment
+        province_missing_pct, coordinate_missing_pct = _source_missingness(
+            enrichment.assign(finance_type="DF")
+        )
+        result.source_loads.append(
             SourceLoadStat(
                 source_file=str(path),
-                role="primary",
+                role="enrichment",
                 parser_used=parser,
                 rows_in_source=rows_in,
-                rows_loaded=rows_loaded,
-                rows_excluded=max(rows_excluded, rows_in - rows_loaded),
+                rows_loaded=0,
+                rows_excluded=max(rows_excluded, rows_in),
+                note="optional_enrichment_only",
                 province_missing_pct=province_missing_pct,
                 coordinate_missing_pct=coordinate_missing_pct,
             )
         )
-
-    enrichment_path = files_by_name.get(ENRICHMENT_FILENAME)
-    if enrichment_path is not None:
-        try:
-            enrich_raw, parser = read_raw_file(enrichment_path, warnings)
-            enrichment, rows_in, rows_excluded = _optional_enrichment_frame(
-                enrich_raw,
-                str(enrichment_path),
-                warnings,
-                audits,
+        logger.info(
+            "Loaded source file=%s rows=%s parser=%s role=enrichment",
+            path.name,
+            len(enrichment),
+            parser,
+        )
+    except Exception as exc:  # noqa: BLE001
+        result.warnings.append(
+            ETLWarning(
+                source_file=str(path),
+                warning_type="enrichment_read_error",
+                message=f"Failed to read enrichment source: {exc}",
             )
-            optional_enrichment = enrichment
-            province_missing_pct, coordinate_missing_pct = _source_missingness(
-                enrichment.assign(finance_type="DF")
+        )
+        result.source_loads.append(
+            SourceLoadStat(
+                source_file=str(path),
+                role="enrichment",
+                parser_used="read_error",
+                rows_in_source=0,
+                rows_loaded=0,
+                rows_excluded=0,
+                note=str(exc),
             )
-            source_loads.append(
-                SourceLoadStat(
-                    source_file=str(enrichment_path),
-                    role="enrichment",
-                    parser_used=parser,
-                    rows_in_source=rows_in,
-                    rows_loaded=0,
-                    rows_excluded=max(rows_excluded, rows_in),
-                    note="optional_enrichment_only",
-                    province_missing_pct=province_missing_pct,
-                    coordinate_missing_pct=coordinate_missing_pct,
-                )
+        )
+
+    return result
+
+
+def _inspect_excluded_source(path: Path, cache: ParseCache | None) -> SourceResult:
+    result = SourceResult()
+    profiler = StageProfiler(result.timings)
+
+    rows_in = 0
+    parser = "excluded"
+    note = "excluded_from_project_level"
+    try:
+        with profiler.stage("read", str(path)):
+            inspected = inspect_raw_row_count(path)
+            if inspected is None:
+                frame, parser = read_raw_file_cached(path, result.warnings, cache)
+                rows_in = len(frame)
+            else:
+                rows_in, parser = inspected
+    except Exception as exc:  # noqa: BLE001
+        result.warnings.append(
+            ETLWarning(
+                source_file=str(path),
+                warning_type="excluded_source_read_error",
+                message=(
+                    "Source is excluded from canonical rows; row count could not be inspected. "
+                    f"Error: {exc}"
+                ),
             )
-            logger.info(
-                "Loaded source file=%s rows=%s parser=%s role=enrichment",
-                ENRICHMENT_FILENAME,
-                len(enrichment),
-                parser,
+        )
+        note = f"excluded_from_project_level; row_count_unavailable ({exc})"
+
+    result.source_loads.append(
+        SourceLoadStat(
+            source_file=str(path),
+            role="excluded",
+            parser_used=parser,
+            rows_in_source=rows_in,
+            rows_loaded=0,
+            rows_excluded=rows_in,
+            note=note,
+        )
+    )
+    return result
+
+
+def _run_source_tasks(
+    tasks: list[tuple[Callable[..., SourceResult], tuple[Any, ...]]],
+    jobs: int,
+) -> list[SourceResult]:
+    if jobs <= 1 or len(tasks) <= 1:
+        return [task(*args) for task, args in tasks]
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), mp_context=context) as executor:
+        futures = [executor.submit(task, *args) for task, args in tasks]
+        # Collect in submission order so warnings/audits merge deterministically.
+        return [future.result() for future in futures]
+
+
+def run_etl(
+    raw_dir: Path = Path("data/raw"),
+    out_dir: Path = Path("data/processed"),
+    cache: ParseCache | None = None,
+    jobs: int = 1,
+    store: SourceStore | None = None,
+    keep_versions: int = PUBLISH_KEEP_VERSIONS,
+    trace_path: Path | None = None,
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    warnings: list[ETLWarning] = []
+    source_loads: list[SourceLoadStat] = []
+    audits: list[MappingAuditRow] = []
+    profiler = StageProfiler()
+
+    with profiler.stage("discover"):
+        raw_files = discover_raw_files(raw_dir)
+    if not raw_files:
+        warnings.append(
+            ETLWarning(
+                source_file=str(raw_dir),
+                warning_type="no_raw_files",
+                message="No files found in data/raw. ETL produced an empty project-level dataset.",
             )
-        except Exception as exc:  # noqa: BLE001
-            warnings.append(
+        )
+
+    primary_frames: list[pd.DataFrame] = []
+    primary_sources: list[str] = []
+    optional_enrichment: pd.DataFrame | None = None
+
+    files_by_name = {path.name: path for path in raw_files}
+
+    # Missing primary sources are reported inline and unchanged sources are reused from the
+    # store; everything else is queued so it can be read concurrently and merged back in the
+    # same order as the sequential run.
+    ordered: list[SourceResult | int] = []
+    tasks: list[tuple[Callable[..., SourceResult], tuple[Any, ...]]] = []
+    task_keys: list[tuple[Path, str, str]] = []
+    source_reuse: dict[str, Any] = {"reused": [], "rebuilt": [], "sources": {}}
+
+    def _queue(
+        path: Path,
+        role: str,
+        task: Callable[..., SourceResult],
+        args: tuple[Any, ...],
+    ) -> None:
+        file_sha256 = _file_digest(path) if store is not None else ""
+        stored = store.load(path, role, file_sha256) if store is not None else None
+        source_reuse["sources"][str(path)] = {
+            "role": role,
+            "reused": stored is not None,
+            "file_sha256": file_sha256,
+            "rows": None,
+        }
+        if stored is not None:
+            ordered.append(stored)
+            source_reuse["reused"].append(str(path))
+            source_reuse["sources"][str(path)]["rows"] = _source_rows(stored)
+            logger.info("Reused stored output file=%s role=%s", path.name, role)
+            return
+
+        ordered.append(len(tasks))
+        tasks.append((task, args))
+        task_keys.append((path, role, file_sha256))
+        source_reuse["rebuilt"].append(str(path))
+
+    for source_name, finance_type in PRIMARY_SOURCES.items():
+        path = files_by_name.get(source_name)
+        if path is None:
+            missing = SourceResult()
+            missing.warnings.append(
                 ETLWarning(
-                    source_file=str(enrichment_path),
-                    warning_type="enrichment_read_error",
-                    message=f"Failed to read enrichment source: {exc}",
+                    source_file=str(raw_dir / source_name),
+                    warning_type="missing_primary_source",
+                    message="Required primary source file is missing.",
                 )
             )
-            source_loads.append(
+            missing.source_loads.append(
                 SourceLoadStat(
-                    source_file=str(enrichment_path),
-                    role="enrichment",
-                    parser_used="read_error",
+                    source_file=str(raw_dir / source_name),
+                    role="primary",
+                    parser_used="missing",
                     rows_in_source=0,
                     rows_loaded=0,
                     rows_excluded=0,
-                    note=str(exc),
+                    note="required_primary_source_missing",
                 )
             )
+            ordered.append(missing)
+            continue
+
+        _queue(path, "primary", _load_primary_source, (path, source_name, finance_type, cache))
+
+    enrichment_position: int | None = None
+    enrichment_path = files_by_name.get(ENRICHMENT_FILENAME)
+    if enrichment_path is not None:
+        enrichment_position = len(ordered)
+        _queue(enrichment_path, "enrichment", _load_enrichment_source, (enrichment_path, cache))
 
     for source_name in sorted(EXCLUDED_SOURCES - {ENRICHMENT_FILENAME}):
         path = files_by_name.get(source_name)
         if path is None:
             continue
-
-        rows_in = 0
-        parser = "excluded"
-        note = "excluded_from_project_level"
-        try:
-            frame, parser = read_raw_file(path, warnings)
-            rows_in = len(frame)
-        except Exception as exc:  # noqa: BLE001
-            warnings.append(
-                ETLWarning(
-                    source_file=str(path),
-                    warning_type="excluded_source_read_error",
-                    message=(
-                        "Source is excluded from canonical rows; row count could not be inspected. "
-                        f"Error: {exc}"
-                    ),
-                )
-            )
-            note = f"excluded_from_project_level; row_count_unavailable ({exc})"
-
-        source_loads.append(
-            SourceLoadStat(
-                source_file=str(path),
-                role="excluded",
-                parser_used=parser,
-                rows_in_source=rows_in,
-                rows_loaded=0,
-                rows_excluded=rows_in,
-                note=note,
-            )
+        _queue(path, "excluded", _inspect_excluded_source, (path, cache))
+
+    with profiler.stage("sources"):
+        task_results = _run_source_tasks(tasks, jobs)
+    if cache is not None:
+        cache.store_date_formats(
+            {
+                path.name: result.date_formats
+                for (path, _, _), result in zip(task_keys, task_results, strict=True)
+                if result.date_formats
+            }
+        )
+    for (path, _, _), result in zip(task_keys, task_results, strict=True):
+        source_reuse["sources"][str(path)]["rows"] = _source_rows(result)
+    if store is not None and task_results:
+        store.save(
+            [
+                (path, role, file_sha256, result)
+                for (path, role, file_sha256), result in zip(task_keys, task_results, strict=True)
+            ]
         )
 
+    for position, entry in enumerate(ordered):
+        result = task_results[entry] if isinstance(entry, int) else entry
+        warnings.extend(result.warnings)
+        source_loads.extend(result.source_loads)
+        audits.extend(result.audits)
+        profiler.timings.extend(result.timings)
+        if result.frame is None:
+            continue
+        if position == enrichment_position:
+            optional_enrichment = result.frame
+        else:
+            primary_frames.append(result.frame)
+            primary_sources.append(result.source_loads[0].source_file if result.source_loads else "")
+
     if primary_frames:
         projects = pd.concat(primary_frames, ignore_index=True)
     else:
         projects = pd.DataFrame(columns=CANONICAL_FIELDS)
+    source_files = pd.Series(
+        np.repeat(primary_sources, [len(frame) for frame in primary_frames]),
+        index=projects.index,
+        dtype="string",
+    )
 
     if optional_enrichment is not None and not projects.empty:
-        projects, touched_rows = _apply_optional_enrichment(projects, optional_enrichment)
+        with profiler.stage("enrichment"):
+            projects, touched_rows = _apply_optional_enrichment(projects, optional_enrichment)
         for item in source_loads:
             if Path(item.source_file).name == ENRICHMENT_FILENAME and item.role == "enrichment":
                 item.rows_used_for_enrichment = touched_rows
                 break
 
     if not projects.empty:
-        projects = _finalize_schema(projects, "canonical_dataset", warnings)
-        missing_finance = projects["finance_type"].isna()
-        if missing_finance.any():
-            warnings.append(
-                ETLWarning(
-                    source_file="canonical_dataset",
-                    warning_type="missing_finance_type",
-                    message="Some rows had missing finance_type after source mapping and were dropped.",
+        with profiler.stage("finalize"):
+            projects = _finalize_schema(projects, "canonical_dataset", warnings)
+            missing_finance = projects["finance_type"].isna()
+            if missing_finance.any():
+                warnings.append(
+                    ETLWarning(
+                        source_file="canonical_dataset",
+                        warning_type="missing_finance_type",
+                        message="Some rows had missing finance_type after source mapping and were dropped.",
+                    )
                 )
-            )
-            projects = projects.loc[~missing_finance].reset_index(drop=True)
+                projects = projects.loc[~missing_finance].reset_index(drop=True)
+                source_files = source_files.loc[~missing_finance].reset_index(drop=True)
 
+    with profiler.stage("dedupe"):
+        rows_before_dedupe = len(projects)
         projects = projects.drop_duplicates(subset=["project_id", "finance_type"], keep="first")
-
-    quality_report = _build_quality_report(projects, raw_files, warnings, source_loads)
-    _write_outputs(projects, quality_report, out_dir)
-    _write_methodology(raw_files, source_loads, audits)
+        deduplication = {"exact_duplicates_dropped": rows_before_dedupe - len(projects)}
+        projects, duplicate_matches, linkage = link_cross_source_duplicates(
+            projects,
+            source_files.loc[projects.index],
+            warnings,
+        )
+        deduplication.update(linkage)
+
+    with profiler.stage("encode"):
+        projects = encode_categoricals(projects)
+    quality_report = _build_quality_report(
+        projects,
+        raw_files,
+        warnings,
+        source_loads,
+        source_reuse=source_reuse if store is not None else None,
+        deduplication=deduplication,
+    )
+    # The methodology is written first so its timing lands in data_quality.json with the rest.
+    with profiler.stage("methodology"):
+        _write_methodology(raw_files, source_loads, audits, duplicate_matches)
+    _write_outputs(
+        projects,
+        quality_report,
+        out_dir,
+        keep_versions=keep_versions,
+        profiler=profiler,
+        audit_tables={DEDUPE_AUDIT_OUTPUT: _dedupe_audit_frame(duplicate_matches)},
+    )
+    if trace_path is not None:
+        profiler.write_chrome_trace(trace_path)
 
     return projects, quality_report
 
@@ -1461,13 +3315,74 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run ETL for project-level canonical dataset")
     parser.add_argument("--raw-dir", type=Path, default=Path("data/raw"))
     parser.add_argument("--out-dir", type=Path, default=Path("data/processed"))
+    parser.add_argument("--cache-dir", type=Path, default=PARSE_CACHE_DIR)
+    parser.add_argument(
+        "--store-dir",
+        type=Path,
+        default=SOURCE_STORE_DIR,
+        help="Per-source standardized outputs reused when a source file is unchanged.",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=PARSE_CACHE_MAX_BYTES // (1 << 20),
+        help="Evict least recently used parse cache entries beyond this size.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to read and standardize sources (0 uses every CPU).",
+    )
+    parser.add_argument(
+        "--keep-versions",
+        type=int,
+        default=PUBLISH_KEEP_VERSIONS,
+        help="Published versions of the processed outputs kept under <out-dir>/versions.",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Also write per-stage timings as a Chrome trace JSON file to this path.",
+    )
+    cache_mode = parser.add_mutually_exclusive_group()
+    cache_mode.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse and standardize every source without the parse cache or source store.",
+    )
+    cache_mode.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Re-parse and re-standardize every source, overwriting cached entries.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = parse_args()
-    projects, quality_report = run_etl(raw_dir=args.raw_dir, out_dir=args.out_dir)
+    cache = (
+        None
+        if args.no_cache
+        else ParseCache(
+            directory=args.cache_dir,
+            max_bytes=args.cache_max_mb * (1 << 20),
+            rebuild=args.rebuild_cache,
+        )
+    )
+    store = None if args.no_cache else SourceStore(directory=args.store_dir, rebuild=args.rebuild_cache)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    projects, quality_report = run_etl(
+        raw_dir=args.raw_dir,
+        out_dir=args.out_dir,
+        cache=cache,
+        jobs=jobs,
+        store=store,
+        keep_versions=args.keep_versions,
+        trace_path=args.trace,
+    )
     logger.info(
         "ETL complete. rows=%s files=%s warnings=%s",
         len(projects),
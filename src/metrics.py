@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pandas as pd
 
 RISK_WEIGHTS = {
@@ -213,8 +215,41 @@ def status_mix(projects: pd.DataFrame) -> pd.DataFrame:
     return frame.sort_values("projects", ascending=False).reset_index(drop=True)
 
 
-def summarize_exposure_vs_friction(projects: pd.DataFrame) -> pd.DataFrame:
-    exposure = province_year_exposure(projects)
+def portfolio_summary(projects: pd.DataFrame) -> dict[str, Any]:
+    finance_type = _series_or_na(projects, "finance_type").astype("string").str.upper()
+    implementation_days = add_time_to_implementation_days(projects)["time_to_implementation_days"]
+    return {
+        "projects": len(projects),
+        "df_projects": int(finance_type.eq("DF").sum()),
+        "fdi_projects": int(finance_type.eq("FDI").sum()),
+        "committed_usd": _to_numeric(_series_or_na(projects, "committed_usd")).sum(min_count=1),
+        "disbursed_usd": _to_numeric(_series_or_na(projects, "disbursed_usd")).sum(min_count=1),
+        "realization_rate": overall_realization_rate(projects),
+        "median_time_to_implementation_days": _to_numeric(implementation_days).median(),
+    }
+
+
+def yearly_capital(projects: pd.DataFrame) -> pd.DataFrame:
+    year = _to_numeric(_series_or_na(projects, "year"))
+    if year.dropna().empty:
+        year = pd.to_datetime(_series_or_na(projects, "approval_date"), errors="coerce").dt.year
+
+    frame = pd.DataFrame(
+        {
+            "year": year.astype("Int64"),
+            "committed_usd": _to_numeric(_series_or_na(projects, "committed_usd")),
+            "disbursed_usd": _to_numeric(_series_or_na(projects, "disbursed_usd")),
+        }
+    ).dropna(subset=["year"])
+    grouped = frame.groupby("year", as_index=False)[["committed_usd", "disbursed_usd"]].sum(min_count=1)
+    return grouped.sort_values("year").reset_index(drop=True)
+
+
+def combine_exposure_vs_friction(
+    exposure: pd.DataFrame,
+    province_realization: pd.DataFrame,
+    risk: pd.DataFrame,
+) -> pd.DataFrame:
     if exposure.empty:
         return pd.DataFrame(
             columns=[
@@ -232,9 +267,24 @@ def summarize_exposure_vs_friction(projects: pd.DataFrame) -> pd.DataFrame:
         .rename(columns={"province_year_exposure": "total_exposure"})
     )
 
+    comparison = total_exposure.merge(province_realization, on="province", how="left")
+    comparison = comparison.merge(risk, on="province", how="left")
+
+    threshold = comparison["total_exposure"].median()
+    comparison["exposure_band"] = comparison["total_exposure"].apply(
+        lambda value: "High Exposure" if value >= threshold else "Low Exposure"
+    )
+    return comparison.sort_values("total_exposure", ascending=False).reset_index(drop=True)
+
+
+def summarize_exposure_vs_friction(projects: pd.DataFrame) -> pd.DataFrame:
+    exposure = province_year_exposure(projects)
+    if exposure.empty:
+        return combine_exposure_vs_friction(exposure, pd.DataFrame(), pd.DataFrame())
+
     realized = add_realization_rate(projects)
     province_realization = (
-        realized.groupby("province", as_index=False)["realization_rate"].mean().rename(
+        realized.groupby("province", as_index=False, observed=True)["realization_rate"].mean().rename(
             columns={"realization_rate": "avg_realization_rate"}
         )
     )
@@ -243,11 +293,4 @@ def summarize_exposure_vs_friction(projects: pd.DataFrame) -> pd.DataFrame:
     if isinstance(risk, float) or risk is None:
         risk = pd.DataFrame(columns=["province", "status_risk_index"])
 
-    comparison = total_exposure.merge(province_realization, on="province", how="left")
-    comparison = comparison.merge(risk, on="province", how="left")
-
-    threshold = comparison["total_exposure"].median()
-    comparison["exposure_band"] = comparison["total_exposure"].apply(
-        lambda value: "High Exposure" if value >= threshold else "Low Exposure"
-    )
-    return comparison.sort_values("total_exposure", ascending=False).reset_index(drop=True)
+    return combine_exposure_vs_friction(exposure, province_realization, risk)
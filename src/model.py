@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
-from src.etl import CANONICAL_FIELDS, DATE_FIELDS, NUMERIC_FIELDS
+from src.connections import DuckDBConnectionManager, published_connections
+from src.etl import (
+    ARROW_OUTPUT,
+    CANONICAL_FIELDS,
+    CATEGORICAL_FIELDS,
+    CSV_OUTPUT,
+    DATE_FIELDS,
+    DUCKDB_OUTPUT,
+    NUMERIC_FIELDS,
+    PARQUET_OUTPUT,
+    encode_categorical,
+    resolve_processed_dir,
+)
 
 try:
     import duckdb
@@ -18,68 +34,163 @@ def _empty_projects() -> pd.DataFrame:
     return pd.DataFrame(columns=CANONICAL_FIELDS)
 
 
-def coerce_projects_schema(frame: pd.DataFrame) -> pd.DataFrame:
-    projects = frame.copy()
+# Frames with equal (column, dtype) fingerprints need the same coercion.
+def schema_fingerprint(frame: pd.DataFrame) -> tuple[tuple[str, str], ...]:
+    return tuple((str(column), str(dtype)) for column, dtype in frame.dtypes.items())
 
-    for column in CANONICAL_FIELDS:
-        if column not in projects.columns:
-            projects[column] = pd.NA
 
-    projects = projects.loc[:, CANONICAL_FIELDS]
+def _dtype_conforms(column: str, dtype_name: str) -> bool:
+    if column in DATE_FIELDS:
+        return dtype_name.startswith("datetime64")
+    if column in NUMERIC_FIELDS:
+        dtype = pd.api.types.pandas_dtype(dtype_name)
+        return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    if column == "year":
+        return dtype_name == "Int64"
+    if column in CATEGORICAL_FIELDS:
+        return dtype_name == "category"
+    return dtype_name == "string"
 
-    for column in DATE_FIELDS:
-        projects[column] = pd.to_datetime(projects[column], errors="coerce")
 
-    for column in NUMERIC_FIELDS:
-        projects[column] = pd.to_numeric(projects[column], errors="coerce")
-
-    projects["year"] = pd.to_numeric(projects["year"], errors="coerce").astype("Int64")
-
-    categorical_columns = [
+@lru_cache(maxsize=64)
+def _nonconforming_columns(fingerprint: tuple[tuple[str, str], ...]) -> tuple[str, ...]:
+    dtypes = dict(fingerprint)
+    return tuple(
         column
         for column in CANONICAL_FIELDS
-        if column not in set(DATE_FIELDS + NUMERIC_FIELDS + ["year"])
-    ]
-    for column in categorical_columns:
-        projects[column] = projects[column].astype("string").str.strip().replace({"": pd.NA})
+        if column not in dtypes or not _dtype_conforms(column, dtypes[column])
+    )
+
+
+def coerce_projects_schema(frame: pd.DataFrame, strict: bool = False) -> pd.DataFrame:
+    # Conforming columns are shared with frame, not converted; strict mode only validates.
+    pending = _nonconforming_columns(schema_fingerprint(frame))
+    if strict:
+        if pending:
+            raise ValueError(f"Columns do not match the canonical schema: {', '.join(pending)}")
+        return frame if list(frame.columns) == CANONICAL_FIELDS else frame.loc[:, CANONICAL_FIELDS]
+
+    if list(frame.columns) == CANONICAL_FIELDS:
+        projects = frame.copy(deep=False)
+    else:
+        projects = frame.copy()
+        for column in CANONICAL_FIELDS:
+            if column not in projects.columns:
+                projects[column] = pd.NA
+        projects = projects.loc[:, CANONICAL_FIELDS]
+
+    for column in pending:
+        if column in DATE_FIELDS:
+            projects[column] = pd.to_datetime(projects[column], errors="coerce")
+        elif column in NUMERIC_FIELDS:
+            projects[column] = pd.to_numeric(projects[column], errors="coerce")
+        elif column == "year":
+            projects[column] = pd.to_numeric(projects[column], errors="coerce").astype("Int64")
+        elif column not in CATEGORICAL_FIELDS:
+            projects[column] = projects[column].astype("string").str.strip().replace({"": pd.NA})
+
+    # encode_categorical returns conforming categoricals as-is after checking the categories.
+    for column in CATEGORICAL_FIELDS:
+        projects[column] = encode_categorical(projects[column], column)
 
     return projects
 
 
-def load_projects(processed_dir: Path = Path("data/processed")) -> pd.DataFrame:
-    db_path = processed_dir / "projects.duckdb"
-    parquet_path = processed_dir / "projects_canonical.parquet"
-    csv_path = processed_dir / "projects_canonical.csv"
+def projects_schema_matches(frame: pd.DataFrame) -> bool:
+    return list(frame.columns) == CANONICAL_FIELDS and not _nonconforming_columns(
+        schema_fingerprint(frame)
+    )
 
-    if db_path.exists() and duckdb is not None:
-        try:
-            connection = duckdb.connect(str(db_path), read_only=True)
-            try:
-                projects = connection.execute("SELECT * FROM projects").df()
-            finally:
-                connection.close()
-            return coerce_projects_schema(projects)
-        except Exception:  # noqa: BLE001
-            pass
 
-    if parquet_path.exists():
-        try:
-            projects = pd.read_parquet(parquet_path)
-            return coerce_projects_schema(projects)
-        except Exception:  # noqa: BLE001
-            pass
+@dataclass(slots=True)
+class ProjectLoader:
+    name: str
+    filename: str
+    read: Callable[[Path], pd.DataFrame]
+    available: Callable[[], bool] = lambda: True
+
+
+@dataclass(slots=True)
+class LoadedProjects:
+    projects: pd.DataFrame
+    source: str
+    path: Path | None = None
+    seconds: float = 0.0
+    coerced: bool = False
+
+
+def _read_arrow(path: Path) -> pd.DataFrame:
+    # Uncompressed and already typed, so it loads faster than Parquet; the frame is a copy.
+    return pd.read_feather(path)
 
-    if csv_path.exists():
+
+def _read_parquet(path: Path) -> pd.DataFrame:
+    return pd.read_parquet(path)
+
+
+def _read_duckdb(path: Path) -> pd.DataFrame:
+    manager = published_connections(path)
+    if manager is not None:
+        return manager.query("SELECT * FROM projects")
+    # The version was superseded after it was resolved; read it without keeping a handle.
+    manager = DuckDBConnectionManager(path.parent)
+    try:
+        return manager.query("SELECT * FROM projects")
+    finally:
+        manager.close()
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+# Tried in order; typed columnar formats come first because they usually need no re-coercion.
+PROJECT_LOADERS: list[ProjectLoader] = [
+    ProjectLoader("arrow", ARROW_OUTPUT, _read_arrow),
+    ProjectLoader("parquet", PARQUET_OUTPUT, _read_parquet),
+    ProjectLoader("duckdb", DUCKDB_OUTPUT, _read_duckdb, available=lambda: duckdb is not None),
+    ProjectLoader("csv", CSV_OUTPUT, _read_csv),
+]
+
+
+def register_project_loader(loader: ProjectLoader, position: int | None = None) -> None:
+    # A loader with the same name is replaced; position defaults to the end of the chain.
+    PROJECT_LOADERS[:] = [item for item in PROJECT_LOADERS if item.name != loader.name]
+    PROJECT_LOADERS.insert(len(PROJECT_LOADERS) if position is None else position, loader)
+
+
+def load_projects_with_metadata(processed_dir: Path = Path("data/processed")) -> LoadedProjects:
+    processed_dir = resolve_processed_dir(processed_dir)
+    started = time.perf_counter()
+
+    for loader in PROJECT_LOADERS:
+        path = processed_dir / loader.filename
+        if not path.exists() or not loader.available():
+            continue
         try:
-            projects = pd.read_csv(csv_path)
-            return coerce_projects_schema(projects)
+            projects = loader.read(path)
+            coerced = not projects_schema_matches(projects)
+            if coerced:
+                projects = coerce_projects_schema(projects)
         except Exception:  # noqa: BLE001
-            pass
+            continue
+        return LoadedProjects(
+            projects=projects,
+            source=loader.name,
+            path=path,
+            seconds=time.perf_counter() - started,
+            coerced=coerced,
+        )
 
-    return _empty_projects()
+    return LoadedProjects(projects=_empty_projects(), source="empty")
+
+
+def load_projects(processed_dir: Path = Path("data/processed")) -> pd.DataFrame:
+    return load_projects_with_metadata(processed_dir).projects
 
 
 def load_data_quality(processed_dir: Path = Path("data/processed")) -> dict[str, Any]:
+    processed_dir = resolve_processed_dir(processed_dir)
     quality_path = processed_dir / "data_quality.json"
 
     if quality_path.exists():
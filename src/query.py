@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.connections import DuckDBConnectionManager, duckdb_connections
+from src.etl import CANONICAL_FIELDS, NUMERIC_FIELDS
+from src.metrics import RISK_WEIGHTS, combine_exposure_vs_friction
+from src.model import coerce_projects_schema
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover
+    duckdb = None
+
+PROJECTS_TABLE = "projects"
+FILTER_FIELDS = ["year", "finance_type", "sector", "province", "status", "sponsor_type"]
+INACTIVE_STATUSES = ["cancelled", "stalled"]
+LIFECYCLE_STAGES = {
+    "Approved": "approval_date",
+    "Financial Close": "financial_close_date",
+    "Construction Start": "construction_start_date",
+    "Operation": "operation_date",
+}
+
+
+def _quote(column: str) -> str:
+    # Identifiers only ever come from the canonical schema, never from user input.
+    if column not in CANONICAL_FIELDS and column not in FILTER_FIELDS:
+        raise ValueError(f"Unknown projects column: {column}")
+    return f'"{column}"'
+
+
+def _placeholders(values: list[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _realization_rate(committed: Any, disbursed: Any) -> float | None:
+    if pd.isna(committed) or committed == 0 or pd.isna(disbursed):
+        return None
+    return float(disbursed / committed)
+
+
+def compile_filters(
+    filters: dict[str, list[Any]],
+    options: dict[str, list[Any]],
+) -> tuple[str, list[Any]]:
+    # Same rules as apply_global_filters; fields missing from options are not table columns.
+    clauses: list[str] = []
+    params: list[Any] = []
+
+    selected_years: list[int] = []
+    for value in filters.get("year", []):
+        try:
+            selected_years.append(int(value))
+        except (TypeError, ValueError):
+            continue
+    if (
+        "year" in options
+        and selected_years
+        and set(selected_years) != {int(value) for value in options.get("year", [])}
+    ):
+        clauses.append(f"year IN ({_placeholders(selected_years)})")
+        params.extend(selected_years)
+
+    selected_finance = [str(value).upper() for value in filters.get("finance_type", [])]
+    all_finance = {str(value).upper() for value in options.get("finance_type", [])}
+    if "finance_type" in options and selected_finance and set(selected_finance) != all_finance:
+        clauses.append(
+            f"upper(CAST(finance_type AS VARCHAR)) IN ({_placeholders(selected_finance)})"
+        )
+        params.extend(selected_finance)
+
+    for column in ["sector", "province", "status", "sponsor_type"]:
+        selected = [str(value) for value in filters.get(column, [])]
+        if (
+            column in options
+            and selected
+            and set(selected) != {str(value) for value in options.get(column, [])}
+        ):
+            clauses.append(f"CAST({_quote(column)} AS VARCHAR) IN ({_placeholders(selected)})")
+            params.extend(selected)
+
+    return " AND ".join(clauses) or "TRUE", params
+
+
+@dataclass(slots=True)
+class ProjectQueryEngine:
+    # Only aggregated results cross into pandas; the manager follows new publishes.
+    connections: DuckDBConnectionManager
+    _options: dict[str, list[Any]] | None = field(default=None, init=False, repr=False)
+    _options_generation: int = field(default=-1, init=False, repr=False)
+    _columns: set[str] = field(default_factory=set, init=False, repr=False)
+
+    def query(self, sql: str, params: list[Any] | None = None) -> pd.DataFrame:
+        return self.connections.query(sql, params)
+
+    def filter_options(self) -> dict[str, list[Any]]:
+        self.connections.cursor()  # reopens first if a new version was published
+        if self._options is not None and self._options_generation == self.connections.generation:
+            return self._options
+
+        columns = set(self.query(f"DESCRIBE {PROJECTS_TABLE}")["column_name"])
+        # Same keys as the app's options, so a selection built from either compiles alike.
+        options: dict[str, list[Any]] = {column: [] for column in FILTER_FIELDS}
+        if "year" in columns:
+            years = self.query(f"SELECT DISTINCT year FROM {PROJECTS_TABLE} WHERE year IS NOT NULL")
+            options["year"] = sorted(int(value) for value in years["year"])
+
+        if "finance_type" in columns:
+            finance = self.query(
+                f"SELECT DISTINCT upper(trim(CAST(finance_type AS VARCHAR))) AS value "
+                f"FROM {PROJECTS_TABLE}"
+            )["value"]
+            finance_values = sorted(value for value in finance.dropna() if value)
+            options["finance_type"] = [
+                value for value in finance_values if value in {"DF", "FDI"}
+            ] + [value for value in finance_values if value not in {"DF", "FDI"}]
+            if not finance.empty and not finance_values:
+                # Rows exist but none carry a finance type; the app then offers both.
+                options["finance_type"] = ["DF", "FDI"]
+
+        for column in ["sector", "province", "status", "sponsor_type"]:
+            if column not in columns:
+                continue
+            values = self.query(
+                f"SELECT DISTINCT trim(CAST({_quote(column)} AS VARCHAR)) AS value FROM {PROJECTS_TABLE}"
+            )["value"].dropna()
+            options[column] = sorted(value for value in values if value)
+
+        self._options = options
+        self._columns = columns
+        self._options_generation = self.connections.generation
+        return options
+
+    def _where(self, filters: dict[str, list[Any]]) -> tuple[str, list[Any]]:
+        options = self.filter_options()
+        return compile_filters(
+            filters,
+            {column: values for column, values in options.items() if column in self._columns},
+        )
+
+    def count(self, filters: dict[str, list[Any]]) -> int:
+        where, params = self._where(filters)
+        result = self.query(
+            f"SELECT count(*) AS projects FROM {PROJECTS_TABLE} WHERE {where}", params
+        )
+        return int(result["projects"].iloc[0])
+
+    def fetch(
+        self,
+        filters: dict[str, list[Any]],
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        where, params = self._where(filters)
+        selected = ", ".join(_quote(column) for column in columns or CANONICAL_FIELDS)
+        frame = self.query(f"SELECT {selected} FROM {PROJECTS_TABLE} WHERE {where}", params)
+        return frame if columns else coerce_projects_schema(frame)
+
+    def overall_realization_rate(self, filters: dict[str, list[Any]]) -> float | None:
+        where, params = self._where(filters)
+        totals = self.query(
+            f"SELECT sum(committed_usd) AS committed_usd, sum(disbursed_usd) AS disbursed_usd "
+            f"FROM {PROJECTS_TABLE} WHERE {where}",
+            params,
+        ).iloc[0]
+        return _realization_rate(totals["committed_usd"], totals["disbursed_usd"])
+
+    def portfolio_summary(self, filters: dict[str, list[Any]]) -> dict[str, Any]:
+        where, params = self._where(filters)
+        totals = self.query(
+            f"SELECT count(*) AS projects, "
+            f"count_if(upper(CAST(finance_type AS VARCHAR)) = 'DF') AS df_projects, "
+            f"count_if(upper(CAST(finance_type AS VARCHAR)) = 'FDI') AS fdi_projects, "
+            f"sum(committed_usd) AS committed_usd, sum(disbursed_usd) AS disbursed_usd, "
+            f"quantile_cont(floor(epoch(operation_date - approval_date) / 86400), 0.5) "
+            f"AS median_time_to_implementation_days "
+            f"FROM {PROJECTS_TABLE} WHERE {where}",
+            params,
+        ).iloc[0]
+        return {
+            "projects": int(totals["projects"]),
+            "df_projects": int(totals["df_projects"]),
+            "fdi_projects": int(totals["fdi_projects"]),
+            "committed_usd": totals["committed_usd"],
+            "disbursed_usd": totals["disbursed_usd"],
+            "realization_rate": _realization_rate(totals["committed_usd"], totals["disbursed_usd"]),
+            "median_time_to_implementation_days": totals["median_time_to_implementation_days"],
+        }
+
+    def yearly_capital(self, filters: dict[str, list[Any]]) -> pd.DataFrame:
+        where, params = self._where(filters)
+        # Falls back to the approval year only when no filtered row has a source year.
+        yearly = self.query(
+            f"SELECT year, sum(committed_usd) AS committed_usd, sum(disbursed_usd) AS disbursed_usd "
+            f"FROM (SELECT CASE WHEN count(year) OVER () > 0 THEN year "
+            f"ELSE year(approval_date) END AS year, committed_usd, disbursed_usd "
+            f"FROM {PROJECTS_TABLE} WHERE {where}) "
+            f"WHERE year IS NOT NULL GROUP BY 1 ORDER BY 1",
+            params,
+        )
+        return yearly.astype({"year": "Int64"})
+
+    def compute_status_risk_index(
+        self,
+        filters: dict[str, list[Any]],
+        group_col: str | None = None,
+        weights: dict[str, float] | None = None,
+    ) -> float | None | pd.DataFrame:
+        risk_weights = weights or RISK_WEIGHTS
+        where, params = self._where(filters)
+        weight_sql = "CASE lower(CAST(status AS VARCHAR)) "
+        weight_sql += " ".join("WHEN ? THEN ?" for _ in risk_weights) + " ELSE 0.0 END"
+        weight_params = [
+            item for status, weight in risk_weights.items() for item in (status, float(weight))
+        ]
+        exposure_sql = "CASE WHEN committed_usd > 0 THEN committed_usd ELSE 1.0 END"
+        components = (
+            f"SELECT {{group}}({weight_sql}) * ({exposure_sql}) AS risk_component, "
+            f"{exposure_sql} AS exposure FROM {PROJECTS_TABLE} WHERE {where}"
+        )
+
+        if group_col is None:
+            totals = self.query(
+                f"SELECT sum(risk_component) AS numerator, sum(exposure) AS denominator "
+                f"FROM ({components.format(group='')})",
+                weight_params + params,
+            ).iloc[0]
+            if pd.isna(totals["denominator"]) or totals["denominator"] == 0:
+                return None
+            return float(totals["numerator"] / totals["denominator"] * 100)
+
+        group = f"CAST({_quote(group_col)} AS VARCHAR) AS grp, "
+        grouped = self.query(
+            f"SELECT grp AS {_quote(group_col)}, "
+            f"CASE WHEN sum(exposure) > 0 THEN sum(risk_component) / sum(exposure) * 100 END "
+            f"AS status_risk_index FROM ({components.format(group=group)}) "
+            f"WHERE grp IS NOT NULL GROUP BY grp ORDER BY grp",
+            weight_params + params,
+        )
+        if grouped.empty:
+            return pd.DataFrame(columns=[group_col, "status_risk_index"])
+        return grouped.astype({group_col: "string"})
+
+    def province_year_exposure(self, filters: dict[str, list[Any]]) -> pd.DataFrame:
+        where, params = self._where(filters)
+        exposure = self.query(
+            f"SELECT CAST(province AS VARCHAR) AS province, "
+            f"coalesce(year, year(approval_date)) AS year, "
+            f"sum(CASE WHEN coalesce(lower(CAST(status AS VARCHAR)) NOT IN "
+            f"({_placeholders(INACTIVE_STATUSES)}), TRUE) "
+            f"THEN coalesce(disbursed_usd, 0.0) ELSE 0.0 END) AS province_year_exposure "
+            f"FROM {PROJECTS_TABLE} WHERE ({where}) AND province IS NOT NULL "
+            f"AND coalesce(year, year(approval_date)) IS NOT NULL "
+            f"GROUP BY 1, 2 ORDER BY 1, 2",
+            INACTIVE_STATUSES + params,
+        )
+        return exposure.astype({"province": "string", "year": "Int64"})
+
+    def sector_concentration_shares(
+        self,
+        filters: dict[str, list[Any]],
+        value_column: str = "committed_usd",
+    ) -> pd.DataFrame:
+        if value_column not in NUMERIC_FIELDS:
+            raise ValueError(f"Not a numeric projects column: {value_column}")
+        where, params = self._where(filters)
+        grouped = self.query(
+            f"SELECT CAST(sector AS VARCHAR) AS sector, sum({_quote(value_column)}) AS value "
+            f"FROM {PROJECTS_TABLE} WHERE ({where}) AND sector IS NOT NULL GROUP BY 1",
+            params,
+        )
+        if grouped.empty:
+            return pd.DataFrame(columns=["sector", "value", "share"])
+
+        grouped = grouped.astype({"sector": "string"})
+        total_value = grouped["value"].sum(min_count=1)
+        if pd.isna(total_value) or total_value == 0:
+            grouped["share"] = pd.NA
+        else:
+            grouped["share"] = grouped["value"] / total_value
+        return grouped.sort_values(
+            ["share", "sector"], ascending=[False, True], na_position="last"
+        ).reset_index(drop=True)
+
+    def lifecycle_funnel(self, filters: dict[str, list[Any]]) -> pd.DataFrame:
+        where, params = self._where(filters)
+        counts = self.query(
+            "SELECT "
+            + ", ".join(
+                f"count({_quote(column)}) AS {_quote(column)}"
+                for column in LIFECYCLE_STAGES.values()
+            )
+            + f" FROM {PROJECTS_TABLE} WHERE {where}",
+            params,
+        ).iloc[0]
+        return pd.DataFrame(
+            [
+                {"stage": stage, "projects": int(counts[column])}
+                for stage, column in LIFECYCLE_STAGES.items()
+            ]
+        )
+
+    def approval_cohorts(self, filters: dict[str, list[Any]]) -> pd.DataFrame:
+        where, params = self._where(filters)
+        cohorts = self.query(
+            f"SELECT year(approval_date) AS approval_year, count(*) AS projects, "
+            f"coalesce(sum(committed_usd), 0.0) AS committed_usd, "
+            f"coalesce(sum(disbursed_usd), 0.0) AS disbursed_usd, "
+            f"avg(disbursed_usd / nullif(committed_usd, 0)) AS avg_realization_rate, "
+            f"quantile_cont(floor(epoch(operation_date - approval_date) / 86400), 0.5) "
+            f"AS median_time_to_implementation_days "
+            f"FROM {PROJECTS_TABLE} WHERE ({where}) AND approval_date IS NOT NULL "
+            f"GROUP BY 1 ORDER BY 1",
+            params,
+        )
+        return cohorts.astype({"approval_year": "Int64"})
+
+    def status_mix(self, filters: dict[str, list[Any]]) -> pd.DataFrame:
+        where, params = self._where(filters)
+        # Ties keep first-appearance order, as value_counts does.
+        mix = self.query(
+            f"SELECT CAST(status AS VARCHAR) AS status, count(*) AS projects FROM {PROJECTS_TABLE} "
+            f"WHERE ({where}) AND status IS NOT NULL GROUP BY 1 ORDER BY 2 DESC, min(rowid)",
+            params,
+        )
+        return mix.astype({"status": "string"})
+
+    def summarize_exposure_vs_friction(self, filters: dict[str, list[Any]]) -> pd.DataFrame:
+        exposure = self.province_year_exposure(filters)
+        if exposure.empty:
+            return combine_exposure_vs_friction(exposure, pd.DataFrame(), pd.DataFrame())
+
+        where, params = self._where(filters)
+        province_realization = self.query(
+            f"SELECT CAST(province AS VARCHAR) AS province, "
+            f"avg(disbursed_usd / nullif(committed_usd, 0)) AS avg_realization_rate "
+            f"FROM {PROJECTS_TABLE} WHERE ({where}) AND province IS NOT NULL GROUP BY 1",
+            params,
+        ).astype({"province": "string"})
+
+        risk = self.compute_status_risk_index(filters, group_col="province")
+        return combine_exposure_vs_friction(exposure, province_realization, risk)
+
+
+def open_query_engine(processed_dir: Path) -> ProjectQueryEngine | None:
+    if duckdb is None:
+        return None
+    connections = duckdb_connections(processed_dir)
+    if not connections.database_path().exists():
+        return None
+    return ProjectQueryEngine(connections)
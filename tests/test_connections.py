@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from src.connections import DuckDBConnectionManager, duckdb_connections, published_connections
+from src.etl import _write_duckdb_output
+from src.model import coerce_projects_schema, load_projects_with_metadata
+
+
+def test_duckdb_connection_manager_shares_handle_and_reopens_on_new_file(tmp_path: Path) -> None:
+    projects = coerce_projects_schema(
+        pd.DataFrame({"project_id": ["p1", "p2"], "year": [2020, 2021]})
+    )
+    _write_duckdb_output(projects, tmp_path / "projects.duckdb")
+    manager = DuckDBConnectionManager(tmp_path)
+    count_sql = "SELECT count(*) AS n FROM projects"
+
+    assert manager.query(count_sql)["n"].iloc[0] == 2
+    assert manager.cursor() is manager.cursor()
+    other_thread: list[object] = []
+    worker = threading.Thread(target=lambda: other_thread.append(manager.cursor()))
+    worker.start()
+    worker.join()
+    assert other_thread[0] is not manager.cursor()
+    assert manager.generation == 1
+
+    # A publish replaces the file; the next query sees the new table on a fresh handle.
+    _write_duckdb_output(pd.concat([projects, projects]), tmp_path / "staged.duckdb")
+    os.replace(tmp_path / "staged.duckdb", tmp_path / "projects.duckdb")
+
+    assert manager.query(count_sql)["n"].iloc[0] == 4
+    assert manager.generation == 2
+
+    # reset() invalidates every thread's cursor; the next one comes from a reopened handle.
+    manager.reset()
+    assert manager.generation == 3
+    worker = threading.Thread(target=lambda: other_thread.append(manager.query(count_sql)))
+    worker.start()
+    worker.join()
+    assert other_thread[-1]["n"].iloc[0] == 4
+    assert manager.generation == 4
+    manager.close()
+    assert manager.healthy()
+    assert duckdb_connections(tmp_path) is duckdb_connections(tmp_path)
+
+
+def test_duckdb_loader_uses_the_processed_dir_manager(tmp_path: Path) -> None:
+    projects = coerce_projects_schema(
+        pd.DataFrame({"project_id": ["p1", "p2"], "year": [2020, 2021]})
+    )
+    for version in ["v1", "v2"]:
+        (tmp_path / "versions" / version).mkdir(parents=True)
+        _write_duckdb_output(projects, tmp_path / "versions" / version / "projects.duckdb")
+    (tmp_path / "current.json").write_text('{"version": "v2"}', encoding="utf-8")
+
+    loaded = load_projects_with_metadata(tmp_path)
+
+    assert loaded.source == "duckdb"
+    assert published_connections(loaded.path) is duckdb_connections(tmp_path)
+    superseded = tmp_path / "versions" / "v1" / "projects.duckdb"
+    assert published_connections(superseded) is None
+    assert len(load_projects_with_metadata(superseded.parent).projects) == 2
+    duckdb_connections(tmp_path).close()
@@ -0,0 +1,1037 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from src.etl import (
+    AIDDATA_COLUMNS,
+    CANONICAL_FIELDS,
+    CGIT_INDONESIA_COLUMNS,
+    CGIT_TRACKER_COLUMNS,
+    DISTRICT_CANDIDATES,
+    ENRICHMENT_COLUMNS,
+    LATITUDE_CANDIDATES,
+    LONGITUDE_CANDIDATES,
+    PROVINCE_CANDIDATES,
+    ColumnResolver,
+    ETLWarning,
+    IndonesiaRowFilter,
+    ParseCache,
+    SourceStore,
+    StageProfiler,
+    _add_mapping_audit,
+    _apply_optional_enrichment,
+    _clean_numeric,
+    _column_projection,
+    _current_rss_bytes,
+    _finalize_schema,
+    _frame_from_rows,
+    _generate_deterministic_ids,
+    _iter_xlsx_rows,
+    _prune_versions,
+    _read_projected,
+    _read_xlsx_sheet_header,
+    _scan_excel_with_pandas,
+    _scan_xlsx_for_best_parse,
+    _write_csv_output,
+    _xlsx_shared_strings,
+    _xlsx_sheet_targets,
+    detect_date_format,
+    encode_categorical,
+    encode_categoricals,
+    frame_checksum,
+    inspect_raw_row_count,
+    link_cross_source_duplicates,
+    parse_dates_with_format,
+    read_raw_file,
+    read_raw_file_cached,
+    resolve_processed_dir,
+    run_etl,
+)
+
+LOCATION_GROUPS = [
+    PROVINCE_CANDIDATES,
+    DISTRICT_CANDIDATES,
+    LATITUDE_CANDIDATES,
+    LONGITUDE_CANDIDATES,
+]
+
+
+def _write_workbook(path: Path, sheets: dict[str, list[list[object]]]) -> Path:
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+def _write_raw_sources(raw_dir: Path) -> None:
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    _write_workbook(
+        raw_dir / "cgit_indonesia_investments_2006_2025.xlsx",
+        {
+            "Sheet1": [
+                ["Year", "Investor", "Sector", "Country", "Amount_musd", "Status"],
+                [2019, "PowerChina", "Energy", "Indonesia", 120.5, "Operational"],
+                [2020, "Tsingshan", "Metals", "Indonesia", 300, "Delayed"],
+                [2020, "CRCC", "Transport", "Malaysia", 80, "Operational"],
+            ]
+        },
+    )
+    _write_workbook(
+        raw_dir / "China-Global-Investment-Tracker-2024-Fall-public.xlsx",
+        {
+            "Dataset": [
+                [
+                    "Year",
+                    "Investor",
+                    "Quantity in Millions",
+                    "Transaction Party",
+                    "Sector",
+                    "Country",
+                ],
+                [2018, "State Grid", 500, "PLN", "Energy", "Indonesia"],
+                [2018, "Sinopec", 200, "Aramco", "Energy", "Saudi Arabia"],
+            ]
+        },
+    )
+    (raw_dir / "IMF DIP.csv").write_text("Country,Value\nIndonesia,1\nChina,2\n", encoding="utf-8")
+
+
+def test_iter_xlsx_rows_streams_rows_in_order(tmp_path: Path) -> None:
+    path = _write_workbook(
+        tmp_path / "sample.xlsx",
+        {"Data": [["Title", "Country", "Year"], ["Road", "Indonesia", 2020], ["Port", None, 2021]]},
+    )
+
+    with zipfile.ZipFile(path) as archive:
+        target = _xlsx_sheet_targets(archive)["Data"]
+        rows = _iter_xlsx_rows(archive, target, _xlsx_shared_strings(archive))
+        first = next(rows)
+        remaining = list(rows)
+
+    assert first == ["Title", "Country", "Year"]
+    assert remaining[0] == ["Road", "Indonesia", "2020"]
+    assert remaining[1][0] == "Port"
+    assert pd.isna(remaining[1][1])
+
+
+def test_frame_from_rows_pads_ragged_rows() -> None:
+    rows = iter([["Title"], ["Road", "extra"], []])
+
+    frame = _frame_from_rows(rows, header_row=0)
+
+    assert frame.columns.tolist() == ["Title", "Unnamed: 1"]
+    assert frame.to_dict("records") == [{"Title": "Road", "Unnamed: 1": "extra"}]
+
+
+def test_read_xlsx_sheet_header_uses_requested_header_row(tmp_path: Path) -> None:
+    path = _write_workbook(
+        tmp_path / "sample.xlsx",
+        {"Sheet1": [["Report title"], ["Title", "Country"], ["Road", "Indonesia"]]},
+    )
+
+    frame, parser = _read_xlsx_sheet_header(path, "Sheet1", header_row=1)
+
+    assert parser == "xlsx_zip(sheet=Sheet1,header=1)"
+    assert frame.columns.tolist() == ["Title", "Country"]
+    assert len(frame) == 1
+
+
+def test_fallback_scanners_pick_the_same_header_row(tmp_path: Path) -> None:
+    path = _write_workbook(
+        tmp_path / "sample.xlsx",
+        {
+            "Notes": [["Generated by statistics office"]],
+            "Data": [
+                ["FDI by country"],
+                [None],
+                ["Country", "Year", "Amount"],
+                ["Indonesia", 2020, 10],
+                ["Indonesia", 2021, 12],
+            ],
+        },
+    )
+
+    xlsx_frame, xlsx_parser = _scan_xlsx_for_best_parse(path)
+    pandas_frame, pandas_parser = _scan_excel_with_pandas(path)
+
+    assert xlsx_parser == "excel_fallback_scan(sheet=Data,header=2,score=3)"
+    assert pandas_parser == xlsx_parser
+    assert xlsx_frame.columns.tolist() == ["Country", "Year", "Amount"]
+    assert pandas_frame.columns.tolist() == ["Country", "Year", "Amount"]
+    assert len(xlsx_frame) == len(pandas_frame) == 2
+
+
+def test_parse_cache_reuses_frame_and_replays_warnings(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "sample.csv"
+    path.write_text("Title,Country\nRoad,Indonesia\n", encoding="utf-8")
+    cache = ParseCache(directory=tmp_path / "cache")
+
+    first_warnings: list[ETLWarning] = []
+    first, first_parser = read_raw_file_cached(path, first_warnings, cache)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("raw file should not be re-parsed on a cache hit")
+
+    monkeypatch.setattr("src.etl.read_raw_file", _fail)
+    second_warnings: list[ETLWarning] = []
+    second, second_parser = read_raw_file_cached(path, second_warnings, cache)
+
+    assert second_parser == first_parser == "csv(header=0)"
+    assert second.astype(str).equals(first.astype(str))
+    assert second_warnings == first_warnings
+
+
+def test_parse_cache_misses_when_file_changes_or_rebuild_requested(tmp_path: Path) -> None:
+    path = tmp_path / "sample.csv"
+    path.write_text("Title\nRoad\n", encoding="utf-8")
+    cache = ParseCache(directory=tmp_path / "cache")
+    read_raw_file_cached(path, [], cache)
+
+    path.write_text("Title\nRoad\nPort\n", encoding="utf-8")
+    changed, _ = read_raw_file_cached(path, [], cache)
+    rebuilt, _ = read_raw_file_cached(path, [], ParseCache(directory=cache.directory, rebuild=True))
+
+    assert len(changed) == 2
+    assert len(rebuilt) == 2
+
+
+def test_parse_cache_returns_the_same_dtypes_on_miss_hit_and_without_cache(tmp_path: Path) -> None:
+    path = tmp_path / "sample.csv"
+    path.write_text("Title,Amount\nRoad,10\nPort,TBD\n", encoding="utf-8")
+    cache = ParseCache(directory=tmp_path / "cache")
+
+    uncached, _ = read_raw_file_cached(path, [], None)
+    miss, _ = read_raw_file_cached(path, [], cache)
+    hit, _ = read_raw_file_cached(path, [], cache)
+
+    assert miss.dtypes.to_dict() == {"Title": "string", "Amount": "string"}
+    assert hit.dtypes.to_dict() == miss.dtypes.to_dict() == uncached.dtypes.to_dict()
+    pd.testing.assert_frame_equal(hit, miss)
+
+
+def test_parse_cache_misses_when_reader_code_changes(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "sample.csv"
+    path.write_text("Title\nRoad\n", encoding="utf-8")
+    cache = ParseCache(directory=tmp_path / "cache")
+    read_raw_file_cached(path, [], cache)
+
+    calls: list[Path] = []
+
+    def _counting_read(path: Path, *args, **kwargs):
+        calls.append(path)
+        return read_raw_file(path, *args, **kwargs)
+
+    monkeypatch.setattr("src.etl.read_raw_file", _counting_read)
+    read_raw_file_cached(path, [], cache)
+    monkeypatch.setattr("src.etl._reader_code_version", lambda: "edited-reader")
+    read_raw_file_cached(path, [], cache)
+
+    assert calls == [path]
+
+
+def test_parse_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = ParseCache(directory=tmp_path / "cache", max_bytes=0)
+    path = tmp_path / "sample.csv"
+    path.write_text("Title\nRoad\n", encoding="utf-8")
+
+    read_raw_file_cached(path, [], cache)
+
+    assert list(cache.directory.iterdir()) == []
+
+
+def test_run_etl_parallel_matches_sequential(tmp_path: Path, monkeypatch) -> None:
+    raw_dir = tmp_path / "raw"
+    _write_raw_sources(raw_dir)
+    monkeypatch.chdir(tmp_path)
+
+    sequential, sequential_report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "seq", jobs=1)
+    parallel, parallel_report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "par", jobs=3)
+
+    pd.testing.assert_frame_equal(sequential, parallel)
+    assert len(sequential) == 3
+    for key in ("warnings", "source_loads", "missing_pct"):
+        assert sequential_report[key] == parallel_report[key]
+
+
+def test_run_etl_reuses_unchanged_sources_from_store(tmp_path: Path, monkeypatch) -> None:
+    raw_dir = tmp_path / "raw"
+    _write_raw_sources(raw_dir)
+    monkeypatch.chdir(tmp_path)
+    store = SourceStore(directory=tmp_path / "store")
+
+    first, first_report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "out", store=store)
+    second, second_report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "out", store=store)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert first_report["source_reuse"]["reused"] == []
+    assert second_report["source_reuse"]["rebuilt"] == []
+    sources = second_report["source_reuse"]["sources"]
+    assert all(entry["reused"] for entry in sources.values())
+    assert sources == {
+        path: {**entry, "reused": True}
+        for path, entry in first_report["source_reuse"]["sources"].items()
+    }
+    assert sum(entry["rows"] for entry in sources.values()) == len(second)
+    assert second_report["source_loads"] == first_report["source_loads"]
+
+    _write_workbook(
+        raw_dir / "cgit_indonesia_investments_2006_2025.xlsx",
+        {
+            "Sheet1": [
+                ["Year", "Investor", "Sector", "Country"],
+                [2021, "CATL", "Energy", "Indonesia"],
+            ]
+        },
+    )
+    third, third_report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "out", store=store)
+
+    assert third_report["source_reuse"]["rebuilt"] == [
+        str(raw_dir / "cgit_indonesia_investments_2006_2025.xlsx")
+    ]
+    assert len(third) == 2
+
+    broken = raw_dir / "cgit_indonesia_investments_2006_2025.xlsx"
+    broken.write_bytes(b"not a workbook")
+    for _ in range(2):
+        _, broken_report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "out", store=store)
+        assert broken_report["source_reuse"]["rebuilt"] == [str(broken)]
+        assert any(load["parser_used"] == "read_error" for load in broken_report["source_loads"])
+
+
+def test_inspect_raw_row_count_matches_full_parse(tmp_path: Path) -> None:
+    xlsx_path = _write_workbook(
+        tmp_path / "excluded.xlsx",
+        {"Sheet1": [[None], ["Country", "Value"], ["Indonesia", 1], [None], ["China", 2]]},
+    )
+    csv_path = tmp_path / "excluded.csv"
+    csv_path.write_text('Country,Note\nIndonesia,"multi\nline"\n\nChina,x\n', encoding="utf-8")
+
+    for path in (xlsx_path, csv_path):
+        frame, _ = read_raw_file(path, [])
+        rows, parser = inspect_raw_row_count(path)
+        assert rows == len(frame)
+        assert parser.startswith("metadata(")
+
+    assert inspect_raw_row_count(tmp_path / "legacy.xls") is None
+
+
+def test_xlsx_row_count_memory_stays_flat_on_large_sheets(tmp_path: Path) -> None:
+    # openpyxl is too slow for a sheet this size, so write the minimal xlsx parts directly.
+    rows = 30_000
+    sheet_rows = "".join(
+        f'<row r="{row}"><c r="A{row}" t="inlineStr"><is><t>Indonesia</t></is></c>'
+        f'<c r="B{row}"><v>{row}</v></c></row>'
+        for row in range(1, rows + 1)
+    )
+    path = tmp_path / "large.xlsx"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<sheets><sheet name="Data" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="worksheets/sheet1.xml"/></Relationships>',
+        )
+        archive.writestr(
+            "xl/worksheets/sheet1.xml",
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f"<sheetData>{sheet_rows}</sheetData></worksheet>",
+        )
+    del sheet_rows
+
+    tracemalloc.start()
+    try:
+        counted = inspect_raw_row_count(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert counted == (rows - 1, "metadata(xlsx_rows,sheet=0,header=0)")
+    # Retaining every emptied <row> element would cost roughly 2.5 MB here.
+    assert peak < 1_500_000
+
+
+def test_shared_string_table_decodes_only_requested_entries(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "strings.xlsx"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "xl/sharedStrings.xml",
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            "<si><t>alpha</t></si><si><r><t>b</t></r><r><t>\u00e9ta</t></r></si><si><t/></si>"
+            "</sst>",
+        )
+
+    with zipfile.ZipFile(path) as archive:
+        table = _xlsx_shared_strings(archive)
+
+    assert len(table) == 3
+    assert table[1] == "b\u00e9ta"
+    assert table[1] == "b\u00e9ta"
+    assert table[2] == ""
+    assert table.decoded == 2
+    monkeypatch.setattr("src.etl.SHARED_STRINGS_LRU_SIZE", 1)
+    assert [table[0], table[1], table[0]] == ["alpha", "b\u00e9ta", "alpha"]
+    assert table.decoded == 3
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_column_projection_keeps_resolvable_and_country_columns(tmp_path: Path) -> None:
+    path = _write_workbook(
+        tmp_path / "wide.xlsx",
+        {
+            "Sheet1": [
+                ["Title", "Recipient", "Notes", "Commitment Year"],
+                ["Road", "Indonesia", None, 2020],
+                [None, None, "only a note", None],
+                ["Port", "Indonesia", None, 2021],
+            ]
+        },
+    )
+    usecols = _column_projection(["Title", "Commitment Year"])
+
+    full, _ = _read_xlsx_sheet_header(path, "Sheet1", header_row=0)
+    projected, _ = _read_xlsx_sheet_header(path, "Sheet1", header_row=0, usecols=usecols)
+    via_pandas, _ = read_raw_file(path, [], columns=["Title", "Commitment Year"])
+
+    assert projected.columns.tolist() == ["Title", "Recipient", "Commitment Year"]
+    assert len(projected) == len(full) == len(via_pandas) == 3
+    assert via_pandas.columns.tolist() == projected.columns.tolist()
+
+
+def test_short_candidates_match_headers_exactly() -> None:
+    usecols = _column_projection(["Y", "X", "Lat", "Latitude"])
+    kept = [
+        name
+        for name in ["Year", "Y", "x", "Translation", "Lat", "Latitude (deg)", "Max"]
+        if usecols(name)
+    ]
+
+    assert kept == ["Y", "x", "Lat", "Latitude (deg)"]
+
+    columns = ColumnResolver(pd.DataFrame({"Year": [2020], "Translation": ["a"]}))
+    assert columns.find(LATITUDE_CANDIDATES) is None
+    assert columns.find(LONGITUDE_CANDIDATES) is None
+
+
+def _baseline_find_column(frame: pd.DataFrame, candidates: list[str]) -> str | None:
+    # Column matching before FUZZY_MATCH_MIN_LENGTH: any normalized substring in either direction.
+    lookup = {}
+    for column in frame.columns:
+        lookup.setdefault("".join(ch for ch in column.lower() if ch.isalnum()), column)
+    normalized = [
+        "".join(ch for ch in candidate.lower() if ch.isalnum()) for candidate in candidates
+    ]
+    for name in normalized:
+        if name in lookup:
+            return lookup[name]
+    for name in filter(None, normalized):
+        for normalized_column, original in lookup.items():
+            if name in normalized_column or normalized_column in name:
+                return original
+    return None
+
+
+@pytest.mark.parametrize(
+    ("headers", "candidate_groups", "changed"),
+    [
+        (
+            # Header row of the CGIT tracker "Dataset 1+2" sheet.
+            ["Year", "Month", "Investor/Contractor", "Quantity in Millions", "Share Size"]
+            + [
+                "Transaction Party",
+                "Sector",
+                "Subsector",
+                "Country",
+                "Region",
+                "BRI",
+                "Greenfield",
+            ],
+            [*CGIT_TRACKER_COLUMNS.values(), *LOCATION_GROUPS],
+            {"Latitude": ("Year", None)},
+        ),
+        (
+            ["Year", "Month", "Investor or Builder", "Sector", "Country", "Amount", "Type"]
+            + ["Amount_musd"],
+            [*CGIT_INDONESIA_COLUMNS.values(), *LOCATION_GROUPS],
+            {"Latitude": ("Year", None)},
+        ),
+        (
+            # GCDF 3.0 headers the AidData and enrichment adapters can reach.
+            ["AidData Record ID", "Recipient", "Commitment Year", "Title", "Status", "Sector Name"]
+            + ["Collateralized", "Amount (Nominal USD)", "Adjusted Amount (Nominal USD)"]
+            + ["Commitment Date (MM/DD/YYYY)", "Planned Implementation Start Date (MM/DD/YYYY)"]
+            + [
+                "Actual Implementation Start Date (MM/DD/YYYY)",
+                "Actual Completion Date (MM/DD/YYYY)",
+            ]
+            + ["Planned Completion Date (MM/DD/YYYY)", "ADM1 Level Available"],
+            [*AIDDATA_COLUMNS.values(), *ENRICHMENT_COLUMNS.values()],
+            {"Latitude": ("Collateralized", None)},
+        ),
+    ],
+)
+def test_column_resolution_matches_baseline_except_short_substring_hits(
+    headers: list[str], candidate_groups: list[list[str]], changed: dict[str, tuple]
+) -> None:
+    frame = pd.DataFrame(columns=headers)
+    resolver = ColumnResolver(frame)
+    differences = {}
+    for candidates in candidate_groups:
+        before, after = _baseline_find_column(frame, candidates), resolver.find(candidates)
+        if before != after:
+            differences[candidates[0]] = (before, after)
+
+    # The only resolutions that changed are short names ("Lat", "Y") hitting unrelated headers.
+    assert differences == changed
+
+
+def test_column_projection_without_matches_reads_all_columns(tmp_path: Path, caplog) -> None:
+    path = tmp_path / "unmatched.csv"
+    path.write_text("Foo,Bar\n1,2\n3,4\n", encoding="utf-8")
+
+    with caplog.at_level("WARNING", logger="src.etl"):
+        frame, _ = read_raw_file(path, [], columns=["Title"])
+
+    assert frame.columns.tolist() == ["Foo", "Bar"]
+    assert len(frame) == 2
+    assert "Column projection matched no headers file=unmatched.csv" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level("WARNING", logger="src.etl"):
+        read_raw_file(path, [], columns=["Foo"])
+    assert caplog.text == ""
+
+    calls: list[dict[str, Any]] = []
+
+    def reader(**kwargs: Any) -> pd.DataFrame:
+        calls.append(kwargs)
+        return pd.read_csv(path, **kwargs)
+
+    assert _read_projected(path, reader, _column_projection(["Title"])).shape == (2, 2)
+    assert calls == [{"nrows": 0}, {"usecols": None}]
+
+
+def test_row_filter_drops_non_indonesia_rows_while_streaming(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("src.etl.ROW_FILTER_CHUNK_ROWS", 2)
+    rows = [["Title", "Recipient"]] + [
+        [f"Project {index}", "Indonesia" if index % 3 == 0 else "Viet Nam"] for index in range(10)
+    ]
+    xlsx_path = _write_workbook(tmp_path / "mixed.xlsx", {"Sheet1": rows})
+    csv_path = tmp_path / "mixed.csv"
+    csv_path.write_text("\n".join(",".join(map(str, row)) for row in rows) + "\n", encoding="utf-8")
+
+    streamed_filter = IndonesiaRowFilter()
+    streamed, _ = _read_xlsx_sheet_header(
+        xlsx_path, "Sheet1", header_row=0, row_filter=streamed_filter
+    )
+    csv_filter = IndonesiaRowFilter()
+    from_csv, _ = read_raw_file(csv_path, [], row_filter=csv_filter)
+
+    assert streamed["Title"].tolist() == ["Project 0", "Project 3", "Project 6", "Project 9"]
+    assert streamed_filter.rows_seen == csv_filter.rows_seen == 10
+    assert streamed_filter.rows_dropped == csv_filter.rows_dropped == 6
+    assert from_csv["Title"].tolist() == streamed["Title"].tolist()
+
+
+def test_read_raw_file_never_holds_more_than_a_chunk_of_unfiltered_rows(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setattr("src.etl.ROW_FILTER_CHUNK_ROWS", 2)
+    rows = [["Title", "Recipient"]] + [
+        [f"Project {index}", "Indonesia" if index % 3 == 0 else "Viet Nam"] for index in range(10)
+    ]
+    xlsx_path = _write_workbook(tmp_path / "mixed.xlsx", {"Data": rows})
+    csv_path = tmp_path / "mixed.csv"
+    csv_path.write_text("\n".join(",".join(map(str, row)) for row in rows) + "\n", encoding="utf-8")
+
+    chunk_sizes: list[int] = []
+    apply = IndonesiaRowFilter.apply
+
+    def recording_apply(self: IndonesiaRowFilter, frame: pd.DataFrame) -> pd.DataFrame:
+        chunk_sizes.append(len(frame))
+        return apply(self, frame)
+
+    def whole_sheet_reader(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        raise AssertionError("the whole sheet was loaded")
+
+    monkeypatch.setattr(IndonesiaRowFilter, "apply", recording_apply)
+    monkeypatch.setattr(pd, "read_excel", whole_sheet_reader)
+
+    for path, kwargs, expected_parser in [
+        (xlsx_path, {}, "xlsx_stream(sheet=0,header=0)"),
+        (xlsx_path, {"fixed_sheet": "Data", "fixed_header": 0}, "xlsx_stream(sheet=Data,header=0)"),
+        (csv_path, {}, "csv(header=0)"),
+    ]:
+        row_filter = IndonesiaRowFilter()
+        warnings: list[ETLWarning] = []
+        frame, parser = read_raw_file(path, warnings, row_filter=row_filter, **kwargs)
+
+        assert parser == expected_parser
+        assert warnings == []
+        assert frame["Title"].tolist() == ["Project 0", "Project 3", "Project 6", "Project 9"]
+        assert (row_filter.rows_seen, row_filter.rows_dropped) == (10, 6)
+    assert max(chunk_sizes) == 2
+
+
+def test_parse_cache_restores_row_filter_counts(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "mixed.csv"
+    path.write_text("Title,Country\nA,Indonesia\nB,China\nC,China\n", encoding="utf-8")
+    cache = ParseCache(tmp_path / "cache")
+
+    first_filter = IndonesiaRowFilter()
+    first, _ = read_raw_file_cached(path, [], cache, row_filter=first_filter)
+    monkeypatch.setattr("src.etl.read_raw_file", None)
+    second_filter = IndonesiaRowFilter()
+    second, _ = read_raw_file_cached(path, [], cache, row_filter=second_filter)
+
+    assert second["Title"].tolist() == first["Title"].tolist() == ["A"]
+    assert (second_filter.rows_seen, second_filter.rows_dropped) == (3, 2)
+
+
+def test_generate_deterministic_ids_hashes_only_missing_ids() -> None:
+    frame = pd.DataFrame(
+        {
+            "project_id": pd.array(["P-1", pd.NA, "  "], dtype="string"),
+            "project_name": pd.array(["Road", "Port", pd.NA], dtype="string"),
+            "year": pd.array([2019, pd.NA, 2021], dtype="Int64"),
+        },
+        index=[4, 7, 9],
+    )
+    countries = pd.Series(["Indonesia", "Indonesia", pd.NA], index=frame.index)
+
+    result = _generate_deterministic_ids(frame, "raw.xlsx", countries)
+
+    def _expected(payload: str) -> str:
+        return f"gen_{hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]}"
+
+    assert result["project_id"].tolist() == [
+        "P-1",
+        _expected("raw.xlsx|Port||Indonesia"),
+        _expected("raw.xlsx||2021|"),
+    ]
+    assert str(result["project_id"].dtype) == "string"
+
+
+def test_apply_optional_enrichment_fills_nulls_by_id_then_name_year() -> None:
+    projects = _finalize_schema(
+        pd.DataFrame(
+            {
+                "project_id": ["A", "B", None, "D"],
+                "project_name": ["Road", "Port  Expansion", "Dam", "Mine"],
+                "year": [2019, None, 2020, 2021],
+                "finance_type": "DF",
+                "sector": [None, None, "Energy", "Metals"],
+                "province": ["Aceh", None, None, "Papua"],
+            }
+        ),
+        "projects.csv",
+        [],
+    )
+    enrich = _finalize_schema(
+        pd.DataFrame(
+            {
+                "project_id": ["A", "B", "X", "A"],
+                "project_name": ["Road", "port expansion!", "DAM", "Road"],
+                "year": [2019, 2018, 2020, 2019],
+                "finance_type": "DF",
+                "sector": ["Transport", None, "Water", "Ignored"],
+                "province": ["Bali", "Riau", "Java", None],
+            }
+        ),
+        "enrich.csv",
+        [],
+    )
+
+    enriched, touched = _apply_optional_enrichment(projects, enrich)
+
+    assert touched == 3
+    assert enriched["sector"].tolist() == ["Transport", pd.NA, "Energy", "Metals"]
+    assert enriched["province"].tolist() == ["Aceh", "Riau", "Java", "Papua"]
+    assert enriched["year"].tolist() == [2019, 2018, 2020, 2021]
+    assert enriched.dtypes.equals(projects.dtypes)
+
+
+def test_column_resolver_memoizes_and_reports_fuzzy_matches() -> None:
+    frame = pd.DataFrame({"Project Title": ["Road"], "Commitment Year": [2020], "Status": ["Done"]})
+    columns = ColumnResolver(frame)
+
+    assert columns.get(["Title"], "project_name").tolist() == ["Road"]
+    assert columns.get(["Commitment Year"], "year").tolist() == [2020]
+    assert columns.find(["Title"]) == "Project Title"
+    assert columns.get(["Missing"], "sector").isna().all()
+    assert len(columns.matches) == 2
+
+    audits: list = []
+    _add_mapping_audit(
+        audits,
+        "raw.xlsx",
+        [
+            ("Title", "project_name", "direct"),
+            ("Year", "year", "numeric"),
+            ("Sector", "sector", "direct"),
+        ],
+        pd.DataFrame({"project_name": ["Road"], "year": [2020], "sector": [None]}),
+        columns,
+    )
+
+    assert [row.resolved_column for row in audits] == [
+        "Project Title (fuzzy: Title)",
+        "Commitment Year",
+        "",
+    ]
+
+
+def test_clean_numeric_only_cleans_values_that_fail_to_parse() -> None:
+    floats, float_cleaned = _clean_numeric(pd.Series([0.1 + 0.2, None]))
+    text, text_cleaned = _clean_numeric(
+        pd.Series(["1.5", "$4,000", "(3)", "n/a", None], dtype=object)
+    )
+
+    assert floats.tolist() == [0.1 + 0.2, pd.NA] and float_cleaned == 0
+    assert text.tolist() == [1.5, 4000.0, -3.0, pd.NA, pd.NA]
+    assert text_cleaned == 2
+
+    columns = ColumnResolver(pd.DataFrame({"Amount": ["1,000", "2"]}))
+    assert columns.numeric(["Amount"], "committed_usd", multiplier=10).tolist() == [10000, 20]
+    assert columns.values_cleaned == {"committed_usd": 1}
+
+
+def test_detect_date_format_classifies_sampled_values() -> None:
+    assert detect_date_format(pd.Series(["2020-01-31", "2021-02-01"], dtype="string")) == "%Y-%m-%d"
+    assert (
+        detect_date_format(pd.Series(["01/31/2020", None, "2/1/2021"], dtype="string"))
+        == "%m/%d/%Y"
+    )
+    assert detect_date_format(pd.Series(["43831", "43831.5"], dtype="string")) == "excel_serial"
+    assert detect_date_format(pd.Series(["2020-01-31", "Feb 1, 2021"], dtype="string")) == "mixed"
+    assert detect_date_format(pd.Series([None], dtype="string")) == ""
+
+
+def test_parse_dates_with_format_falls_back_for_residual_and_redetects_stale_formats() -> None:
+    values = pd.Series(["01/31/2020"] * 30 + ["2020-03-04", "43831", "n/a"], dtype=object)
+
+    parsed, date_format = parse_dates_with_format(values)
+    reparsed, cached_format = parse_dates_with_format(values, date_format)
+    redetected, new_format = parse_dates_with_format(values, "%Y-%m-%d")
+
+    assert date_format == cached_format == new_format == "%m/%d/%Y"
+    assert parsed.iloc[30:].tolist() == [
+        pd.Timestamp("2020-03-04"),
+        pd.Timestamp("2020-01-01"),
+        pd.NaT,
+    ]
+    pd.testing.assert_series_equal(parsed, reparsed)
+    pd.testing.assert_series_equal(parsed, redetected)
+    assert parse_dates_with_format(pd.Series(pd.to_datetime(["2020-01-31"])))[1] == "datetime"
+
+
+def test_parse_cache_remembers_date_formats_per_source(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path / "cache")
+    cache.store_date_formats({"a.xlsx": {"Commitment Date": "%m/%d/%Y"}})
+    cache.store_date_formats({"b.xlsx": {"Date": "excel_serial"}})
+
+    assert cache.load_date_formats("a.xlsx") == {"Commitment Date": "%m/%d/%Y"}
+    assert cache.load_date_formats("b.xlsx") == {"Date": "excel_serial"}
+    assert ParseCache(tmp_path / "cache", rebuild=True).load_date_formats("a.xlsx") == {}
+
+
+def test_encode_categorical_uses_stable_category_order() -> None:
+    finance = encode_categorical(pd.Series(["FDI", " DF", "Other", None, ""]), "finance_type")
+    sector = encode_categorical(pd.Series(["Transport", "Energy", "Transport"]), "sector")
+    reversed_sector = sector.cat.reorder_categories(["Transport", "Energy"])
+
+    assert finance.cat.categories.tolist() == ["DF", "FDI", "Other"]
+    assert finance.isna().tolist() == [False, False, False, True, True]
+    assert sector.cat.categories.tolist() == ["Energy", "Transport"]
+    assert encode_categorical(sector, "sector") is sector
+    assert encode_categorical(reversed_sector, "sector").cat.categories.tolist() == [
+        "Energy",
+        "Transport",
+    ]
+
+
+def test_run_etl_writes_matching_csv_parquet_and_duckdb_outputs(
+    tmp_path: Path, monkeypatch
+) -> None:
+    raw_dir = tmp_path / "raw"
+    _write_raw_sources(raw_dir)
+    monkeypatch.chdir(tmp_path)
+
+    projects, report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "published")
+    out_dir = resolve_processed_dir(tmp_path / "published")
+
+    parquet = pd.read_parquet(out_dir / "projects_canonical.parquet")
+    connection = duckdb.connect(str(out_dir / "projects.duckdb"), read_only=True)
+    try:
+        stored = connection.execute("SELECT * FROM projects").df()
+        indexes = {
+            row[0]
+            for row in connection.execute("SELECT index_name FROM duckdb_indexes()").fetchall()
+        }
+    finally:
+        connection.close()
+
+    assert report["outputs"]["row_count"] == len(projects) == 3
+    assert frame_checksum(parquet) == frame_checksum(stored) == report["outputs"]["checksum_sha256"]
+    assert isinstance(parquet["sector"].dtype, pd.CategoricalDtype)
+    assert indexes == {"idx_projects_year", "idx_projects_finance_type", "idx_projects_province"}
+    assert not list(out_dir.glob(".*.tmp"))
+
+
+def test_csv_output_round_trips_float_values_exactly(tmp_path: Path) -> None:
+    projects = encode_categoricals(
+        pd.DataFrame(
+            {
+                "project_id": ["A", "B"],
+                "project_name": ["NA", "Plant"],
+                "finance_type": ["DF", "FDI"],
+                "committed_usd": [1049599999.9999999, 2118800000.0000002],
+                "year": pd.array([2019, None], dtype="Int64"),
+            }
+        ).reindex(columns=CANONICAL_FIELDS)
+    )
+
+    written = _write_csv_output(projects, tmp_path / "projects.csv")
+
+    assert frame_checksum(written) == frame_checksum(projects)
+
+
+def test_run_etl_publishes_versions_behind_an_atomic_pointer(tmp_path: Path, monkeypatch) -> None:
+    from src import etl
+    from src.model import load_data_quality, load_projects, load_projects_with_metadata
+
+    raw_dir = tmp_path / "raw"
+    out_dir = tmp_path / "out"
+    _write_raw_sources(raw_dir)
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(etl, "PUBLISH_PRUNE_GRACE_SECONDS", 0)
+    published = []
+    for _ in range(3):
+        _, report = run_etl(raw_dir=raw_dir, out_dir=out_dir, keep_versions=2)
+        published.append(report["outputs"]["version"])
+
+    versions = sorted(item.name for item in (out_dir / "versions").iterdir())
+    assert versions == published[1:]
+    assert resolve_processed_dir(out_dir) == out_dir / "versions" / published[-1]
+    assert load_data_quality(out_dir)["outputs"]["version"] == published[-1]
+    assert len(load_projects(out_dir)) == 3
+    live_dir = out_dir / "versions" / published[-1]
+    top_level = [
+        "projects_canonical.arrow",
+        "projects_canonical.parquet",
+        "projects.duckdb",
+        "projects_canonical.csv",
+    ]
+    for name in top_level:
+        assert (out_dir / name).read_bytes() == (live_dir / name).read_bytes()
+
+    (out_dir / "current.json").unlink()
+    assert resolve_processed_dir(out_dir) == out_dir
+    top_level_report = load_data_quality(out_dir)
+    assert "version" not in top_level_report["outputs"]
+    assert published[-1] not in json.dumps(top_level_report)
+    assert top_level_report["outputs"]["files"] == top_level
+    loaded = load_projects_with_metadata(out_dir)
+    assert (loaded.source, len(loaded.projects)) == ("arrow", 3)
+    _, report = run_etl(raw_dir=raw_dir, out_dir=out_dir, keep_versions=2)
+    published.append(report["outputs"]["version"])
+    assert resolve_processed_dir(out_dir) == out_dir / "versions" / published[-1]
+
+    def truncated_parquet(projects: pd.DataFrame, path: Path) -> pd.DataFrame:
+        projects.iloc[:-1].to_parquet(path, index=False)
+        return pd.read_parquet(path)
+
+    monkeypatch.setattr(etl, "_write_parquet_output", truncated_parquet)
+    with pytest.raises(ValueError, match="rows after writing"):
+        run_etl(raw_dir=raw_dir, out_dir=out_dir, keep_versions=2)
+
+    assert resolve_processed_dir(out_dir) == out_dir / "versions" / published[-1]
+    assert sorted(item.name for item in (out_dir / "versions").iterdir()) == published[-2:]
+
+
+def test_prune_versions_keeps_superseded_versions_for_the_grace_period(tmp_path: Path) -> None:
+    versions_dir = tmp_path / "versions"
+    published = [
+        "20260101T000000000000Z-aaaaaaaa",
+        "20260101T010000000000Z-bbbbbbbb",
+        "20260101T023000000000Z-cccccccc",
+    ]
+    for version in published:
+        (versions_dir / version).mkdir(parents=True)
+
+    def remaining() -> list[str]:
+        return sorted(item.name for item in versions_dir.iterdir())
+
+    # The previous version was superseded 10 minutes ago, so it stays; the oldest was
+    # superseded 90 minutes earlier and goes.
+    now = pd.Timestamp("2026-01-01T02:40:00", tz="UTC")
+    _prune_versions(versions_dir, 1, current=published[-1], grace_seconds=3600, now=now)
+    assert remaining() == published[1:]
+
+    _prune_versions(versions_dir, 1, current=published[-1], grace_seconds=3600, now=now)
+    assert remaining() == published[1:]
+
+    later = pd.Timestamp("2026-01-01T03:31:00", tz="UTC")
+    _prune_versions(versions_dir, 1, current=published[-1], grace_seconds=3600, now=later)
+    assert remaining() == published[-1:]
+
+
+def test_run_etl_records_stage_timings_and_chrome_trace(tmp_path: Path, monkeypatch) -> None:
+    import json
+
+    raw_dir = tmp_path / "raw"
+    trace_path = tmp_path / "trace.json"
+    _write_raw_sources(raw_dir)
+    monkeypatch.chdir(tmp_path)
+
+    _, report = run_etl(raw_dir=raw_dir, out_dir=tmp_path / "out", trace_path=trace_path)
+
+    stages = report["timings"]["stages"]
+    names = [(item["stage"], Path(item["source_file"]).name) for item in stages]
+    assert ("read", "cgit_indonesia_investments_2006_2025.xlsx") in names
+    assert ("standardize", "cgit_indonesia_investments_2006_2025.xlsx") in names
+    assert {"discover", "sources", "finalize", "dedupe", "methodology", "write"} <= {
+        stage for stage, _ in names
+    }
+    assert all(item["wall_s"] >= 0 and item["cpu_s"] >= 0 for item in stages)
+    assert all(item["rss_growth_mb"] is None or item["rss_growth_mb"] >= 0 for item in stages)
+
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    assert len(events) == len(stages)
+    assert {event["ph"] for event in events} == {"X"}
+
+
+@pytest.mark.skipif(_current_rss_bytes() is None, reason="needs /proc/self/statm")
+def test_stage_profiler_reports_each_stages_own_peak_rss() -> None:
+    profiler = StageProfiler()
+    with profiler.stage("allocate"):
+        block = b"x" * (200 << 20)
+        time.sleep(0.1)
+        del block
+    with profiler.stage("small"):
+        time.sleep(0.05)
+
+    allocate, small = profiler.timings
+    assert allocate.rss_growth_mb >= 150
+    assert small.rss_growth_mb < 50
+    # A process high-water mark would repeat the first stage's peak here.
+    assert small.peak_rss_mb < allocate.peak_rss_mb - 100
+
+
+def test_link_cross_source_duplicates_merges_blocked_fuzzy_matches() -> None:
+    tracker = "raw/China-Global-Investment-Tracker-2024-Fall-public.xlsx"
+    indonesia = "raw/cgit_indonesia_investments_2006_2025.xlsx"
+    projects = _finalize_schema(
+        pd.DataFrame(
+            {
+                "project_id": ["gen_a", "gen_b", "gen_c", "gen_d", "gen_e"],
+                "project_name": [
+                    "PT Huadi Nickel",
+                    "PT. Huadi Nickel",
+                    "Huadi Nickel",
+                    "CRCC",
+                    "Tsingshan",
+                ],
+                "finance_type": ["FDI"] * 5,
+                "sector": ["Metals", "metals", "Metals", "Transport", "Metals"],
+                "status": [None, "Operational", None, None, None],
+                "committed_usd": [500e6, 520e6, 500e6, 80e6, 300e6],
+                "year": [2020, 2020, 2021, 2020, 2020],
+            }
+        ),
+        "canonical_dataset",
+        [],
+    )
+    sources = pd.Series([tracker, indonesia, indonesia, indonesia, tracker], dtype="string")
+
+    linked, matches, stats = link_cross_source_duplicates(projects, sources, [])
+
+    assert linked["project_id"].tolist() == ["gen_a", "gen_c", "gen_d", "gen_e"]
+    assert linked.loc[0, "status"] == "Operational"
+    assert [
+        (match.kept_project_id, match.dropped_project_id, match.decision) for match in matches
+    ] == [("gen_a", "gen_b", "merged")]
+    assert stats["fuzzy_duplicates_merged"] == 1
+    assert stats["candidate_pairs"] == 1
+
+
+def test_link_cross_source_duplicates_caps_neighbouring_buckets_not_coarse_blocks(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr("src.etl.DEDUPE_MAX_BLOCK_SIZE", 3)
+    amounts = [500e6, 520e6, 1e6, 1e10, 1e3, 1e3, 1e3, 1e3]
+    projects = _finalize_schema(
+        pd.DataFrame(
+            {
+                "project_id": [f"gen_{index}" for index in range(len(amounts))],
+                "project_name": ["PT Huadi Nickel", "PT. Huadi Nickel"]
+                + [f"Project {index}" for index in range(6)],
+                "finance_type": ["FDI"] * len(amounts),
+                "sector": ["Metals"] * len(amounts),
+                "committed_usd": amounts,
+                "year": [2020] * len(amounts),
+            }
+        ),
+        "canonical_dataset",
+        [],
+    )
+    sources = pd.Series(["tracker", "indonesia"] * 4, dtype="string")
+    warnings: list[ETLWarning] = []
+
+    linked, _, stats = link_cross_source_duplicates(projects, sources, warnings)
+
+    assert stats["fuzzy_duplicates_merged"] == 1
+    assert stats["rows_compared"] == 4
+    assert stats["rows_unblocked"] == 4
+    assert [warning.warning_type for warning in warnings] == ["dedupe_block_too_large"]
+    assert len(linked) == 7
+
+
+def test_link_cross_source_duplicates_skips_pairing_without_blockable_rows(monkeypatch) -> None:
+    def _fail(*args, **kwargs):
+        raise AssertionError("no pairs should be built without blockable rows")
+
+    monkeypatch.setattr("src.etl._dedupe_candidate_pairs", _fail)
+    projects = _finalize_schema(
+        pd.DataFrame(
+            {
+                "project_id": ["gen_a", "gen_b"],
+                "project_name": ["Morowali Smelter", "Morowali Smelter"],
+                "finance_type": ["FDI", "FDI"],
+                "sector": ["Metals", "Metals"],
+                "committed_usd": [None, None],
+                "year": [2020, 2020],
+            }
+        ),
+        "canonical_dataset",
+        [],
+    )
+
+    linked, matches, stats = link_cross_source_duplicates(
+        projects, pd.Series(["tracker", "indonesia"], dtype="string"), []
+    )
+
+    assert len(linked) == 2
+    assert matches == []
+    assert (stats["rows_compared"], stats["rows_unblocked"], stats["candidate_pairs"]) == (0, 2, 0)
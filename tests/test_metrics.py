@@ -8,7 +8,9 @@ from src.metrics import (
     compute_status_risk_index,
     province_year_exposure,
     sector_concentration_shares,
+    summarize_exposure_vs_friction,
 )
+from src.model import coerce_projects_schema
 
 
 def test_realization_rate_handles_zero_and_missing_values() -> None:
@@ -86,3 +88,29 @@ def test_sector_concentration_handles_zero_total_value() -> None:
 
     assert len(concentration) == 2
     assert concentration["share"].isna().all()
+
+
+def test_metrics_ignore_unobserved_categories_after_filtering() -> None:
+    projects = coerce_projects_schema(
+        pd.DataFrame(
+            {
+                "province": ["A", "A", "B", "C"],
+                "year": [2020, 2021, 2020, 2021],
+                "committed_usd": [100.0, 80.0, 50.0, 10.0],
+                "disbursed_usd": [60.0, 40.0, 25.0, 5.0],
+                "status": ["operational", "delayed", "cancelled", "operational"],
+            }
+        )
+    )
+    filtered = projects[projects["province"].isin(["A", "B"])]
+    as_strings = filtered.astype({"province": "string", "status": "string"})
+
+    summary = summarize_exposure_vs_friction(filtered)
+
+    assert isinstance(filtered["province"].dtype, pd.CategoricalDtype)
+    assert sorted(summary["province"].astype(str)) == ["A", "B"]
+    pd.testing.assert_frame_equal(
+        summary.astype({"province": "string"}),
+        summarize_exposure_vs_friction(as_strings),
+        check_dtype=False,
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.etl import _write_arrow_output, _write_parquet_output
+from src.model import (
+    PROJECT_LOADERS,
+    ProjectLoader,
+    coerce_projects_schema,
+    load_projects_with_metadata,
+    projects_schema_matches,
+    register_project_loader,
+)
+
+
+def test_project_loaders_prefer_typed_formats_and_skip_coercion(
+    tmp_path: Path, monkeypatch
+) -> None:
+    typed = coerce_projects_schema(
+        pd.DataFrame({"project_id": ["p1", "p2"], "province": ["A", "B"], "year": [2020, 2021]})
+    )
+    _write_parquet_output(typed, tmp_path / "projects_canonical.parquet")
+    typed.head(1).to_csv(tmp_path / "projects_canonical.csv", index=False)
+    monkeypatch.setattr("src.model.PROJECT_LOADERS", list(PROJECT_LOADERS))
+
+    loaded = load_projects_with_metadata(tmp_path)
+
+    assert projects_schema_matches(typed)
+    assert loaded.source == "parquet"
+    assert not loaded.coerced
+    assert len(loaded.projects) == 2
+
+    register_project_loader(ProjectLoader("csv", "projects_canonical.csv", pd.read_csv), position=0)
+    loaded = load_projects_with_metadata(tmp_path)
+
+    assert loaded.source == "csv"
+    assert loaded.coerced
+    assert len(loaded.projects) == 1
+
+
+def test_arrow_snapshot_loads_first_without_coercion(tmp_path: Path, monkeypatch) -> None:
+    typed = coerce_projects_schema(
+        pd.DataFrame(
+            {
+                "project_id": ["p1", "p2"],
+                "province": ["A", None],
+                "committed_usd": [1.5, None],
+                "approval_date": ["2020-01-02", None],
+                "year": [2020, None],
+            }
+        )
+    )
+    _write_parquet_output(typed, tmp_path / "projects_canonical.parquet")
+    _write_arrow_output(typed, tmp_path / "projects_canonical.arrow")
+    monkeypatch.setattr("src.model.PROJECT_LOADERS", list(PROJECT_LOADERS))
+
+    loaded = load_projects_with_metadata(tmp_path)
+
+    assert loaded.source == "arrow"
+    assert not loaded.coerced
+    pd.testing.assert_frame_equal(loaded.projects, typed, check_categorical=False)
+
+
+def test_coerce_projects_schema_skips_conforming_columns_and_validates_in_strict_mode() -> None:
+    raw = pd.DataFrame(
+        {"project_name": [" Road ", ""], "committed_usd": ["10", "x"], "province": ["A", " B "]}
+    )
+    typed = coerce_projects_schema(raw)
+
+    again = coerce_projects_schema(typed)
+
+    pd.testing.assert_frame_equal(again, typed)
+    assert np.shares_memory(again["committed_usd"].to_numpy(), typed["committed_usd"].to_numpy())
+    assert coerce_projects_schema(typed, strict=True) is typed
+    with pytest.raises(ValueError, match="committed_usd"):
+        coerce_projects_schema(typed.astype({"committed_usd": "string"}), strict=True)
+    with pytest.raises(ValueError, match="approval_date"):
+        coerce_projects_schema(raw, strict=True)
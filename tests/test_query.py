@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from app.shared import apply_global_filters, get_filter_options_from_projects
+from src import metrics
+from src.connections import duckdb_connections
+from src.etl import _write_duckdb_output
+from src.model import coerce_projects_schema
+from src.query import ProjectQueryEngine, compile_filters
+
+
+def test_query_engine_metrics_match_pandas_on_filtered_projects(tmp_path: Path) -> None:
+    projects = coerce_projects_schema(
+        pd.DataFrame(
+            {
+                "project_id": [f"p{index}" for index in range(8)],
+                "finance_type": ["DF", "df", "FDI", "Df", "fdi", "DF", "DF", "FDI"],
+                "sector": [
+                    "Energy",
+                    "Energy",
+                    "Transport",
+                    None,
+                    "Metals",
+                    "Transport",
+                    "Energy",
+                    "Metals",
+                ],
+                "province": ["A", "B", "A", "B", None, "A", "C", "C"],
+                "status": [
+                    "Operational",
+                    "delayed",
+                    "cancelled",
+                    None,
+                    "stalled",
+                    "operational",
+                    "Delayed",
+                    "x",
+                ],
+                "approval_date": [
+                    "2019-01-01",
+                    "2019-06-01",
+                    None,
+                    "2020-02-01",
+                    "2020-03-01",
+                    "2021-01-01",
+                    "2021-05-05",
+                    None,
+                ],
+                "operation_date": [
+                    "2020-01-01",
+                    None,
+                    None,
+                    "2021-02-01",
+                    "2022-03-01",
+                    "2021-07-01",
+                    None,
+                    None,
+                ],
+                "committed_usd": [100.0, 0.0, 50.0, None, 10.0, 80.0, 30.0, 5.0],
+                "disbursed_usd": [60.0, 5.0, None, 20.0, 10.0, 40.0, None, 1.0],
+                "year": [2019, 2019, 2020, None, 2020, 2021, 2021, 2022],
+            }
+        )
+    )
+    _write_duckdb_output(projects, tmp_path / "projects.duckdb")
+    engine = ProjectQueryEngine(duckdb_connections(tmp_path))
+
+    options = get_filter_options_from_projects(projects)
+    assert engine.filter_options() == options
+
+    for filters in [
+        {},
+        options,
+        {"finance_type": ["DF"]},
+        {"finance_type": ["df", "Fdi"]},
+        {"year": [2019, 2020], "province": ["A", "C"]},
+    ]:
+        filtered = apply_global_filters(projects, filters)
+        assert engine.count(filters) == len(filtered)
+        assert engine.overall_realization_rate(filters) == pytest.approx(
+            metrics.overall_realization_rate(filtered)
+        )
+        assert engine.compute_status_risk_index(filters) == pytest.approx(
+            metrics.compute_status_risk_index(filtered)
+        )
+        assert engine.portfolio_summary(filters) == pytest.approx(
+            metrics.portfolio_summary(filtered), nan_ok=True
+        )
+        for name, kwargs in [
+            ("compute_status_risk_index", {"group_col": "province"}),
+            ("province_year_exposure", {}),
+            ("sector_concentration_shares", {}),
+            ("lifecycle_funnel", {}),
+            ("approval_cohorts", {}),
+            ("status_mix", {}),
+            ("summarize_exposure_vs_friction", {}),
+            ("yearly_capital", {}),
+        ]:
+            pd.testing.assert_frame_equal(
+                getattr(engine, name)(filters, **kwargs),
+                getattr(metrics, name)(filtered, **kwargs),
+                check_dtype=False,
+                check_index_type=False,
+            )
+    engine.connections.close()
+
+    # Without any source year the yearly totals fall back to the approval year.
+    undated = projects.assign(year=pd.NA)
+    (tmp_path / "undated").mkdir()
+    _write_duckdb_output(undated, tmp_path / "undated" / "projects.duckdb")
+    undated_engine = ProjectQueryEngine(duckdb_connections(tmp_path / "undated"))
+    pd.testing.assert_frame_equal(
+        undated_engine.yearly_capital({}), metrics.yearly_capital(undated), check_dtype=False
+    )
+    undated_engine.connections.close()
+
+    assert compile_filters({"year": ["2019"], "sector": []}, {"year": [2019, 2020]}) == (
+        "year IN (?)",
+        [2019],
+    )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from app import shared
+from app.nav_pages import common
+from src.etl import _write_duckdb_output, _write_parquet_output
+from src.model import coerce_projects_schema
+
+
+def test_cached_projects_are_private_to_each_caller(tmp_path: Path, monkeypatch) -> None:
+    projects = coerce_projects_schema(
+        pd.DataFrame({"project_id": ["p1", "p2"], "province": ["A", "B"], "year": [2020, 2021]})
+    )
+    _write_parquet_output(projects, tmp_path / "projects_canonical.parquet")
+    monkeypatch.setattr(shared, "PROCESSED_DIR", tmp_path)
+    shared._load_projects_for_dir.clear()
+
+    first = shared.load_projects_cached()
+    first["province"] = "Z"
+    first.drop(index=first.index[0], inplace=True)
+    second = shared.load_projects_cached()
+
+    assert len(second) == 2
+    assert second["province"].astype(str).tolist() == ["A", "B"]
+    shared._load_projects_for_dir.clear()
+
+
+def test_query_engine_is_opt_in_and_needs_a_published_database(tmp_path: Path, monkeypatch) -> None:
+    shared._query_engine_for_dir.clear()
+    monkeypatch.setattr(shared, "PROCESSED_DIR", tmp_path)
+    monkeypatch.delenv(shared.QUERY_ENGINE_ENV, raising=False)
+    assert shared.get_query_engine() is None
+
+    monkeypatch.setenv(shared.QUERY_ENGINE_ENV, "duckdb")
+    assert shared.get_query_engine() is None
+
+    projects = coerce_projects_schema(
+        pd.DataFrame(
+            {"project_id": ["p1", "p2"], "finance_type": ["DF", "FDI"], "year": [2020, 2021]}
+        )
+    )
+    _write_duckdb_output(projects, tmp_path / "projects.duckdb")
+    engine = shared.get_query_engine()
+    assert engine is not None
+    assert engine.portfolio_summary({"finance_type": ["FDI"]})["projects"] == 1
+    # Reruns reuse the cached engine instead of reopening it.
+    assert shared.get_query_engine() is engine
+    engine.connections.close()
+    shared._query_engine_for_dir.clear()
+
+
+def test_home_page_in_engine_mode_never_loads_the_project_table(
+    tmp_path: Path, monkeypatch
+) -> None:
+    projects = coerce_projects_schema(
+        pd.DataFrame(
+            {
+                "project_id": ["p1", "p2", "p3"],
+                "finance_type": ["DF", "FDI", "FDI"],
+                "year": [2019, 2020, 2021],
+                "sector": ["Energy", "Transport", "Energy"],
+            }
+        )
+    )
+    _write_duckdb_output(projects, tmp_path / "projects.duckdb")
+    shared._query_engine_for_dir.clear()
+    monkeypatch.setattr(shared, "PROCESSED_DIR", tmp_path)
+    monkeypatch.setenv(shared.QUERY_ENGINE_ENV, "duckdb")
+
+    def _unexpected(*args, **kwargs):
+        raise AssertionError("engine mode touched the pandas frame")
+
+    monkeypatch.setattr(common, "load_projects_metadata_cached", _unexpected)
+    monkeypatch.setattr(common, "apply_global_filters", _unexpected)
+
+    app = AppTest.from_file(
+        str(Path(__file__).parents[1] / "app" / "Home.py"), default_timeout=60
+    ).run()
+    try:
+        assert not app.exception
+        metrics = {metric.label: metric.value for metric in app.metric}
+        assert metrics["Total Projects"] == "3"
+        assert any("3 of 3 projects match" in caption.value for caption in app.caption)
+    finally:
+        engine = shared.get_query_engine()
+        if engine is not None:
+            engine.connections.close()
+        shared._query_engine_for_dir.clear()